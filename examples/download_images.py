@@ -1,5 +1,4 @@
 import os
-import time
 import urllib.request
 from multiprocessing import Pool, cpu_count
 
@@ -11,23 +10,8 @@ PROJECT_SLUG = "YOUR_PROJECT_SLUG"
 
 
 def get_all_tasks() -> list:
-    # Iterate pages until new tasks are empty.
-    all_tasks = []
-    offset = None
-    while True:
-        time.sleep(1)
-
-        tasks = client.get_image_classification_tasks(
-            project=PROJECT_SLUG, limit=1000, offset=offset
-        )
-        all_tasks.extend(tasks)
-
-        if len(tasks) > 0:
-            offset = len(all_tasks)  # Set the offset
-        else:
-            break
-
-    return all_tasks
+    # Pages are fetched one by one within the rate limit of the client.
+    return list(client.iter_tasks(project=PROJECT_SLUG, kind="image_classification"))
 
 
 def download_image(task: dict):
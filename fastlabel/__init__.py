@@ -4,18 +4,30 @@ import logging
 import os
 import re
 import tempfile
+import time
 import urllib.parse
-from concurrent.futures import ThreadPoolExecutor, wait
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Literal, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 import cv2
 import numpy as np
-import requests
 import xmltodict
 from PIL import Image, ImageColor, ImageDraw
 
-from fastlabel import const, converters, lerobot, utils
+from fastlabel import const, converters, dump, lerobot, utils
 from fastlabel.const import (
     EXPORT_IMAGE_WITH_ANNOTATIONS_SUPPORTED_IMAGE_TYPES,
     KEYPOINT_MIN_STROKE_WIDTH,
@@ -28,9 +40,25 @@ from fastlabel.const import (
     Priority,
 )
 
-from .api import Api
+from .api import Api, ProjectingApi
+from .cache import TTLCache
 from .exceptions import FastLabelException, FastLabelInvalidException
+from .http_cache import HTTPCache  # noqa: F401
+from .metrics import Metrics, RequestRecord  # noqa: F401
+from .mirror import ProjectMirror
 from .query import DatasetObjectGetQuery
+from .rate_limit import RateLimiter  # noqa: F401
+from .retry import RetryPolicy  # noqa: F401
+from .schema import AnnotationSchema
+from .task_index import TaskIndex
+from .transport import HTTPXTransport, RequestsTransport, Transport  # noqa: F401
+from .upload import (
+    ByteBudget,
+    ImportJournal,
+    UploadProgress,
+    UploadState,
+    is_file_key_error,
+)
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(
@@ -38,12 +66,85 @@ logging.basicConfig(
     format="%(levelname)s: %(message)s",
 )
 
+# Default size of the request bodies being sent at once by create_*_tasks.
+DEFAULT_MAX_BYTES_IN_FLIGHT = 256 * 1024 * 1024
+
 
 class Client:
     api = None
+    cache = None
 
-    def __init__(self, access_token: Optional[str] = None):
-        self.api = Api(access_token=access_token)
+    def __init__(
+        self,
+        access_token: Optional[str] = None,
+        cache: Union[TTLCache, bool, None] = None,
+        **kwargs,
+    ):
+        """
+        access_token is your FastLabel API key. Falls back to the
+        FASTLABEL_ACCESS_TOKEN environment variable (Optional).
+        cache is a TTLCache of project and dataset metadata used by
+        find_project, find_project_by_slug, get_project_id_slug_map and
+        find_dataset. Pass True to use a TTLCache with the default settings.
+        Entries are invalidated when projects and datasets are updated or
+        deleted through this client. Disabled by default (Optional).
+        Other keyword arguments are passed to Api to configure the HTTP layer,
+        e.g. pool_maxsize, retry_policy, retry_policies, rate_limiter, metrics,
+        transport and http_cache (Optional).
+        """
+        self.api = Api(access_token=access_token, **kwargs)
+        if cache is True:
+            cache = TTLCache()
+        elif cache is False:
+            cache = None
+        self.cache = cache
+
+    def close(self) -> None:
+        """
+        Close the pooled HTTP connections held by this client.
+        """
+        self.api.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def metrics(self) -> Dict[str, dict]:
+        """
+        Returns the request counters per endpoint: count, errors, retries,
+        status codes, latency histogram and bytes sent and received.
+        See Metrics.snapshot for the format.
+        """
+        return self.api.metrics.snapshot()
+
+    def add_metrics_hook(self, hook: Callable[[RequestRecord], None]) -> None:
+        """
+        Adds a function called with a RequestRecord after every request,
+        e.g. to push the metrics to your own collector.
+        """
+        self.api.metrics.add_hook(hook)
+
+    def __get_cached(self, key: tuple, load: Callable[[], Any]) -> Any:
+        if self.cache is None:
+            return load()
+        return self.cache.get_or_load(key, load)
+
+    def __invalidate_projects(self, project_id: Optional[str] = None) -> None:
+        """
+        Drops the cached projects. Every project is dropped when project_id
+        is not known.
+        """
+        if self.cache is None:
+            return
+        if project_id is None:
+            self.cache.invalidate_kind("project")
+        else:
+            self.cache.invalidate(("project", project_id))
+        # The slug of the project may have changed.
+        self.cache.invalidate_kind("project_by_slug")
+        self.cache.invalidate_kind("project_id_slug_map")
 
     # Task Find
 
@@ -54,13 +155,21 @@ class Client:
         endpoint = "tasks/image/" + task_id
         return self.api.get_request(endpoint)
 
-    def find_image_task_by_name(self, project: str, task_name: str) -> dict:
+    def find_image_task_by_name(
+        self, project: str, task_name: str, index: Optional[TaskIndex] = None
+    ) -> dict:
         """
         Find a single image task by name.
 
         project is slug of your project (Required).
         task_name is a task name (Required).
+        index is a TaskIndex of the project. If given, the task id is looked up
+        in it instead of searching by name, and None is returned for names
+        not in it (Optional).
         """
+        if index is not None:
+            task_id = index.get_id(task_name)
+            return self.find_image_task(task_id) if task_id else None
         tasks = self.get_image_tasks(project=project, task_name=task_name)
         if not tasks:
             return None
@@ -81,14 +190,22 @@ class Client:
         return self.api.get_request(endpoint)
 
     def find_multi_image_classification_task_by_name(
-        self, project: str, task_name: str
+        self, project: str, task_name: str, index: Optional[TaskIndex] = None
     ) -> dict:
         """
         Find a single multi image classification task by name.
 
         project is slug of your project (Required).
         task_name is a task name (Required).
-        """
+        index is a TaskIndex of the project. If given, the task id is looked up
+        in it instead of searching by name, and None is returned for names
+        not in it (Optional).
+        """
+        if index is not None:
+            task_id = index.get_id(task_name)
+            return (
+                self.find_multi_image_classification_task(task_id) if task_id else None
+            )
         tasks = self.get_multi_image_classification_tasks(
             project=project, task_name=task_name
         )
@@ -97,14 +214,20 @@ class Client:
         return tasks[0]
 
     def find_image_classification_task_by_name(
-        self, project: str, task_name: str
+        self, project: str, task_name: str, index: Optional[TaskIndex] = None
     ) -> dict:
         """
         Find a single image classification task by name.
 
         project is slug of your project (Required).
         task_name is a task name (Required).
+        index is a TaskIndex of the project. If given, the task id is looked up
+        in it instead of searching by name, and None is returned for names
+        not in it (Optional).
         """
+        if index is not None:
+            task_id = index.get_id(task_name)
+            return self.find_image_classification_task(task_id) if task_id else None
         tasks = self.get_image_classification_tasks(
             project=project, task_name=task_name
         )
@@ -119,13 +242,21 @@ class Client:
         endpoint = "tasks/sequential-image/" + task_id
         return self.api.get_request(endpoint)
 
-    def find_sequential_image_task_by_name(self, project: str, task_name: str) -> dict:
+    def find_sequential_image_task_by_name(
+        self, project: str, task_name: str, index: Optional[TaskIndex] = None
+    ) -> dict:
         """
         Find a single sequential image task by name.
 
         project is slug of your project (Required).
         task_name is a task name (Required).
+        index is a TaskIndex of the project. If given, the task id is looked up
+        in it instead of searching by name, and None is returned for names
+        not in it (Optional).
         """
+        if index is not None:
+            task_id = index.get_id(task_name)
+            return self.find_sequential_image_task(task_id) if task_id else None
         tasks = self.get_sequential_image_tasks(project=project, task_name=task_name)
         if not tasks:
             return None
@@ -145,27 +276,41 @@ class Client:
         endpoint = "tasks/video/classification/" + task_id
         return self.api.get_request(endpoint)
 
-    def find_video_task_by_name(self, project: str, task_name: str) -> dict:
+    def find_video_task_by_name(
+        self, project: str, task_name: str, index: Optional[TaskIndex] = None
+    ) -> dict:
         """
         Find a single video task by name.
 
         project is slug of your project (Required).
         task_name is a task name (Required).
+        index is a TaskIndex of the project. If given, the task id is looked up
+        in it instead of searching by name, and None is returned for names
+        not in it (Optional).
         """
+        if index is not None:
+            task_id = index.get_id(task_name)
+            return self.find_video_task(task_id) if task_id else None
         tasks = self.get_video_tasks(project=project, task_name=task_name)
         if not tasks:
             return None
         return tasks[0]
 
     def find_video_classification_task_by_name(
-        self, project: str, task_name: str
+        self, project: str, task_name: str, index: Optional[TaskIndex] = None
     ) -> dict:
         """
         Find a single video classification task by name.
 
         project is slug of your project (Required).
         task_name is a task name (Required).
+        index is a TaskIndex of the project. If given, the task id is looked up
+        in it instead of searching by name, and None is returned for names
+        not in it (Optional).
         """
+        if index is not None:
+            task_id = index.get_id(task_name)
+            return self.find_video_classification_task(task_id) if task_id else None
         tasks = self.get_video_classification_tasks(
             project=project, task_name=task_name
         )
@@ -187,27 +332,41 @@ class Client:
         endpoint = "tasks/text/classification/" + task_id
         return self.api.get_request(endpoint)
 
-    def find_text_task_by_name(self, project: str, task_name: str) -> dict:
+    def find_text_task_by_name(
+        self, project: str, task_name: str, index: Optional[TaskIndex] = None
+    ) -> dict:
         """
         Find a single text task by name.
 
         project is slug of your project (Required).
         task_name is a task name (Required).
+        index is a TaskIndex of the project. If given, the task id is looked up
+        in it instead of searching by name, and None is returned for names
+        not in it (Optional).
         """
+        if index is not None:
+            task_id = index.get_id(task_name)
+            return self.find_text_task(task_id) if task_id else None
         tasks = self.get_text_tasks(project=project, task_name=task_name)
         if not tasks:
             return None
         return tasks[0]
 
     def find_text_classification_task_by_name(
-        self, project: str, task_name: str
+        self, project: str, task_name: str, index: Optional[TaskIndex] = None
     ) -> dict:
         """
         Find a single text classification task by name.
 
         project is slug of your project (Required).
         task_name is a task name (Required).
+        index is a TaskIndex of the project. If given, the task id is looked up
+        in it instead of searching by name, and None is returned for names
+        not in it (Optional).
         """
+        if index is not None:
+            task_id = index.get_id(task_name)
+            return self.find_text_classification_task(task_id) if task_id else None
         tasks = self.get_text_classification_tasks(project=project, task_name=task_name)
         if not tasks:
             return None
@@ -234,27 +393,41 @@ class Client:
         endpoint = "tasks/multi-modal-video-audio/" + task_id
         return self.api.get_request(endpoint)
 
-    def find_audio_task_by_name(self, project: str, task_name: str) -> dict:
+    def find_audio_task_by_name(
+        self, project: str, task_name: str, index: Optional[TaskIndex] = None
+    ) -> dict:
         """
         Find a single audio task by name.
 
         project is slug of your project (Required).
         task_name is a task name (Required).
+        index is a TaskIndex of the project. If given, the task id is looked up
+        in it instead of searching by name, and None is returned for names
+        not in it (Optional).
         """
+        if index is not None:
+            task_id = index.get_id(task_name)
+            return self.find_audio_task(task_id) if task_id else None
         tasks = self.get_audio_tasks(project=project, task_name=task_name)
         if not tasks:
             return None
         return tasks[0]
 
     def find_audio_classification_task_by_name(
-        self, project: str, task_name: str
+        self, project: str, task_name: str, index: Optional[TaskIndex] = None
     ) -> dict:
         """
         Find a single audio classification task by name.
 
         project is slug of your project (Required).
         task_name is a task name (Required).
+        index is a TaskIndex of the project. If given, the task id is looked up
+        in it instead of searching by name, and None is returned for names
+        not in it (Optional).
         """
+        if index is not None:
+            task_id = index.get_id(task_name)
+            return self.find_audio_classification_task(task_id) if task_id else None
         tasks = self.get_audio_classification_tasks(
             project=project, task_name=task_name
         )
@@ -269,13 +442,21 @@ class Client:
         endpoint = "tasks/dicom/" + task_id
         return self.api.get_request(endpoint)
 
-    def find_dicom_task_by_name(self, project: str, task_name: str) -> dict:
+    def find_dicom_task_by_name(
+        self, project: str, task_name: str, index: Optional[TaskIndex] = None
+    ) -> dict:
         """
         Find a single DICOM task by name.
 
         project is slug of your project (Required).
         task_name is a task name (Required).
+        index is a TaskIndex of the project. If given, the task id is looked up
+        in it instead of searching by name, and None is returned for names
+        not in it (Optional).
         """
+        if index is not None:
+            task_id = index.get_id(task_name)
+            return self.find_dicom_task(task_id) if task_id else None
         tasks = self.get_dicom_tasks(project=project, task_name=task_name)
         if not tasks:
             return None
@@ -288,13 +469,21 @@ class Client:
         endpoint = "tasks/pcd/" + task_id
         return self.api.get_request(endpoint)
 
-    def find_pcd_task_by_name(self, project: str, task_name: str) -> dict:
+    def find_pcd_task_by_name(
+        self, project: str, task_name: str, index: Optional[TaskIndex] = None
+    ) -> dict:
         """
         Find a single PCD task by name.
 
         project is slug of your project (Required).
         task_name is a task name (Required).
+        index is a TaskIndex of the project. If given, the task id is looked up
+        in it instead of searching by name, and None is returned for names
+        not in it (Optional).
         """
+        if index is not None:
+            task_id = index.get_id(task_name)
+            return self.find_pcd_task(task_id) if task_id else None
         tasks = self.get_pcd_tasks(project=project, task_name=task_name)
         if not tasks:
             return None
@@ -307,13 +496,21 @@ class Client:
         endpoint = "tasks/sequential-pcd/" + task_id
         return self.api.get_request(endpoint)
 
-    def find_sequential_pcd_task_by_name(self, project: str, task_name: str) -> dict:
+    def find_sequential_pcd_task_by_name(
+        self, project: str, task_name: str, index: Optional[TaskIndex] = None
+    ) -> dict:
         """
         Find a single Sequential PCD task by name.
 
         project is slug of your project (Required).
         task_name is a task name (Required).
+        index is a TaskIndex of the project. If given, the task id is looked up
+        in it instead of searching by name, and None is returned for names
+        not in it (Optional).
         """
+        if index is not None:
+            task_id = index.get_id(task_name)
+            return self.find_sequential_pcd_task(task_id) if task_id else None
         tasks = self.get_sequential_pcd_tasks(project=project, task_name=task_name)
         if not tasks:
             return None
@@ -949,6 +1146,52 @@ class Client:
             params["limit"] = limit
         return self.api.get_request(endpoint, params=params)
 
+    def get_task_index(
+        self,
+        project: str,
+        cache_path: str = None,
+        max_age: Optional[float] = 3600,
+        max_workers: int = 8,
+    ) -> TaskIndex:
+        """
+        Returns a TaskIndex of every task id and name of a project, answering
+        lookups by name or id in memory.
+        The map is fetched with get_task_id_name_map, with concurrent pages.
+
+        project is slug of your project (Required).
+        cache_path is a path to a JSON file keeping a copy of the index.
+        The copy is used while it is younger than max_age, and replaced by
+        a fetched one otherwise (Optional).
+        max_age is the max age in seconds of the copy. None means the copy
+        never expires (Optional).
+        max_workers is the max number of pages fetched at once (Optional).
+        """
+        if cache_path and os.path.exists(cache_path):
+            index = TaskIndex.load(cache_path)
+            if index.project == project and index.is_fresh(max_age):
+                return index
+
+        loaded_at = time.time()
+        tasks = self.__fetch_pages(
+            lambda offset, limit: [
+                {"id": task_id, "name": name}
+                for task_id, name in self.get_task_id_name_map(
+                    project=project, offset=offset, limit=limit
+                ).items()
+            ],
+            lambda: self.count_tasks(project=project),
+            page_size=950,
+            overlap=50,
+            max_workers=max_workers,
+            ordered=False,
+        )
+        index = TaskIndex(
+            project, {task["id"]: task["name"] for task in tasks}, loaded_at=loaded_at
+        )
+        if cache_path:
+            index.save(cache_path)
+        return index
+
     def get_dicom_tasks(
         self,
         project: str,
@@ -995,6 +1238,369 @@ class Client:
             params["limit"] = limit
         return self.api.get_request(endpoint, params=params)
 
+    def iter_tasks(
+        self,
+        project: str,
+        kind: str,
+        status: str = None,
+        external_status: str = None,
+        tags: list = None,
+        task_name: str = None,
+        page_size: int = None,
+        fields: List[str] = None,
+    ) -> Iterator[dict]:
+        """
+        Yields every task of a project, fetching the pages one by one with
+        get_{kind}_tasks. Only the current page is held in memory.
+
+        project is slug of your project (Required).
+        kind is the kind of the tasks like 'image', 'image_classification',
+        'video', 'pcd', 'sequential_pcd', 'dicom' or 'robotics'. See
+        const.TASK_PAGE_LIMITS for every kind (Required).
+        status can be 'registered', 'completed', 'skipped',
+        'reviewed', 'sent_back', 'approved', 'declined'. (Optional)
+        external_status can be 'registered', 'completed', 'skipped',
+        'reviewed', 'sent_back', 'approved', 'declined',
+        'customer_declined' (Optional).
+        tags is a list of tag (Optional).
+        task_name is a task name (Optional).
+        page_size is the number of tasks fetched at once. Defaults to the max
+        of the kind (Optional).
+        fields is a list of dotted paths of the task fields to keep, e.g.
+        ['id', 'name', 'status', 'annotations.value']. The other fields are
+        skipped while the response is parsed, which saves CPU time and memory
+        for large annotations (Optional).
+        """
+        get_tasks = self.__get_tasks_method(kind, fields)
+        if page_size is None:
+            page_size = const.TASK_PAGE_LIMITS[kind]
+        return self.__iter_pages(
+            lambda offset, limit: get_tasks(
+                project=project,
+                status=status,
+                external_status=external_status,
+                tags=tags,
+                task_name=task_name,
+                offset=offset,
+                limit=limit,
+            ),
+            page_size,
+        )
+
+    def fetch_tasks(
+        self,
+        project: str,
+        kind: str,
+        status: str = None,
+        external_status: str = None,
+        tags: list = None,
+        max_workers: int = 8,
+        ordered: bool = True,
+        page_size: int = None,
+        overlap: int = None,
+        fields: List[str] = None,
+    ) -> Iterator[dict]:
+        """
+        Yields every task of a project, fetching the pages concurrently.
+        The number of tasks is read with count_tasks, and the pages at every
+        offset are fetched by max_workers threads. Up to twice max_workers
+        pages are held in memory.
+
+        Tasks added or removed while fetching are handled as follows.
+        Each page also fetches the overlap tasks before its offset, and tasks
+        already yielded are skipped by id, so a task shifted back by up to
+        overlap removals is not missed. Pages after the counted tasks are
+        fetched until a page is not full, so added tasks are yielded last.
+
+        project is slug of your project (Required).
+        kind is the kind of the tasks. Same as iter_tasks (Required).
+        status can be 'registered', 'completed', 'skipped',
+        'reviewed', 'sent_back', 'approved', 'declined'. (Optional)
+        external_status can be 'registered', 'completed', 'skipped',
+        'reviewed', 'sent_back', 'approved', 'declined',
+        'customer_declined' (Optional).
+        tags is a list of tag (Optional).
+        max_workers is the max number of pages fetched at once (Optional).
+        ordered is whether tasks are yielded in the order of the offsets.
+        If False, each page is yielded as soon as it is fetched (Optional).
+        page_size is the number of tasks per page, excluding the overlap.
+        Defaults to the max of the kind minus overlap (Optional).
+        overlap is the number of tasks fetched again before each page.
+        Defaults to 5% of the max of the kind (Optional).
+        fields is a list of dotted paths of the task fields to keep. Same as
+        iter_tasks. id is always kept to skip duplicates (Optional).
+        """
+        if fields:
+            fields = ["id", *fields]
+        get_tasks = self.__get_tasks_method(kind, fields)
+        max_limit = const.TASK_PAGE_LIMITS[kind]
+        if overlap is None:
+            overlap = max_limit // 20
+        if page_size is None:
+            page_size = max_limit - overlap
+        if max_workers < 1 or page_size < 1 or overlap < 0:
+            raise FastLabelInvalidException(
+                "max_workers and page_size must be greater than or equal to 1, "
+                "and overlap must be greater than or equal to 0.",
+                422,
+            )
+        if page_size + overlap > max_limit:
+            raise FastLabelInvalidException(
+                f"page_size plus overlap must be less than or equal to {max_limit}.",
+                422,
+            )
+
+        def get_page(offset: int, limit: int) -> list:
+            return get_tasks(
+                project=project,
+                status=status,
+                external_status=external_status,
+                tags=tags,
+                offset=offset,
+                limit=limit,
+            )
+
+        def count() -> int:
+            return self.count_tasks(
+                project=project,
+                status=status,
+                external_status=external_status,
+                tags=tags,
+            )
+
+        return self.__fetch_pages(
+            get_page, count, page_size, overlap, max_workers, ordered
+        )
+
+    def dump_tasks(
+        self,
+        project: str,
+        kind: str,
+        path: str,
+        format: str = "jsonl",
+        status: str = None,
+        external_status: str = None,
+        tags: list = None,
+        resume: bool = True,
+        page_size: int = None,
+        fields: List[str] = None,
+    ) -> Dict[str, float]:
+        """
+        Writes every task of a project to disk page by page, so the memory
+        does not grow with the size of the project.
+        The progress is saved in {path}.state.json after every page. When a
+        dump is stopped, calling again with the same arguments resumes from
+        the last completed page. The state file is removed once completed.
+        Returns the throughput of the dump.
+            e.g.) {"tasks": 500000, "pages": 500, "bytes": 1073741824,
+                   "offset": 500000, "elapsed": 600.0,
+                   "tasks_per_second": 833.3, "bytes_per_second": 1789569.7}
+
+        project is slug of your project (Required).
+        kind is the kind of the tasks. Same as iter_tasks (Required).
+        path is the output path. A JSON Lines file for 'jsonl', or a directory
+        of Parquet files for 'parquet' (Required).
+        format can be 'jsonl' or 'parquet'. In Parquet, nested values like
+        annotations are stored as JSON strings. Parquet requires pyarrow
+        (Optional).
+        status can be 'registered', 'completed', 'skipped',
+        'reviewed', 'sent_back', 'approved', 'declined'. (Optional)
+        external_status can be 'registered', 'completed', 'skipped',
+        'reviewed', 'sent_back', 'approved', 'declined',
+        'customer_declined' (Optional).
+        tags is a list of tag (Optional).
+        resume is whether to resume a stopped dump to the same path. If False,
+        the dump starts over (Optional).
+        page_size is the number of tasks fetched at once. Defaults to the max
+        of the kind (Optional).
+        fields is a list of dotted paths of the task fields to write. Same as
+        iter_tasks (Optional).
+        """
+        get_tasks = self.__get_tasks_method(kind, fields)
+        if page_size is None:
+            page_size = const.TASK_PAGE_LIMITS[kind]
+        writer = dump.get_writer(format, path)
+        key = {
+            "project": project,
+            "kind": kind,
+            "format": format,
+            "status": status,
+            "externalStatus": external_status,
+            "tags": tags,
+            "fields": fields,
+        }
+        return dump.dump_pages(
+            lambda offset, limit: get_tasks(
+                project=project,
+                status=status,
+                external_status=external_status,
+                tags=tags,
+                offset=offset,
+                limit=limit,
+            ),
+            writer,
+            page_size,
+            key=key,
+            resume=resume,
+        )
+
+    def refresh_project_mirror(
+        self, mirror: ProjectMirror, max_workers: int = 8
+    ) -> Dict[str, int]:
+        """
+        Fetches every task of the project of a ProjectMirror with fetch_tasks
+        and writes the tasks that changed since the last refresh.
+        Returns the number of tasks inserted, updated, deleted and unchanged.
+
+        mirror is the ProjectMirror to refresh (Required).
+        max_workers is the max number of pages fetched at once (Optional).
+        """
+        return mirror.sync(
+            self.fetch_tasks(
+                project=mirror.project,
+                kind=mirror.kind,
+                max_workers=max_workers,
+                ordered=False,
+            )
+        )
+
+    def __get_item_errors(self) -> Tuple[Type[Exception], ...]:
+        """
+        Returns the errors that batch methods report per item instead of
+        raising: errors of the API, and network errors left after retries.
+        """
+        transport = self.api.transport
+        return (FastLabelException, *transport.connect_errors, *transport.errors)
+
+    def __find_many(
+        self,
+        find: Callable[[str], dict],
+        keys: List[str],
+        key_name: str,
+        max_workers: int,
+    ) -> List[dict]:
+        if max_workers < 1:
+            raise FastLabelInvalidException(
+                "max_workers must be greater than or equal to 1.", 422
+            )
+        item_errors = self.__get_item_errors()
+
+        def find_one(key: str) -> dict:
+            try:
+                return {key_name: key, "success": True, "result": find(key)}
+            except item_errors as e:
+                return {key_name: key, "success": False, "result": {"error": str(e)}}
+
+        # dict keeps the first occurrence of each key in order
+        unique_keys = list(dict.fromkeys(keys))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(find_one, unique_keys))
+
+    def __fetch_pages(
+        self,
+        get_page: Callable[[int, int], list],
+        count: Callable[[], int],
+        page_size: int,
+        overlap: int,
+        max_workers: int,
+        ordered: bool,
+    ) -> Iterator[dict]:
+        """
+        Fetches the pages of count() items concurrently with
+        get_page(offset, limit), then the pages after them until one is not
+        full. See fetch_tasks.
+        """
+        seen = set()
+
+        def fetch(offset: int) -> Tuple[list, bool]:
+            start = max(0, offset - overlap)
+            limit = offset + page_size - start
+            page = get_page(start, limit)
+            return page, len(page) >= limit
+
+        def unseen(page: list) -> Iterator[dict]:
+            for item in page:
+                item_id = item.get("id")
+                if item_id is not None:
+                    if item_id in seen:
+                        continue
+                    seen.add(item_id)
+                yield item
+
+        total = count()
+        offsets = iter(range(0, total, page_size))
+        pages = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                for offset in offsets:
+                    pages.append(executor.submit(fetch, offset))
+                    if len(pages) >= max_workers * 2:
+                        break
+                while pages:
+                    if ordered:
+                        done = pages.pop(0)
+                    else:
+                        done = next(
+                            page
+                            for page in wait(pages, return_when=FIRST_COMPLETED).done
+                        )
+                        pages.remove(done)
+                    offset = next(offsets, None)
+                    if offset is not None:
+                        pages.append(executor.submit(fetch, offset))
+                    yield from unseen(done.result()[0])
+            finally:
+                for page in pages:
+                    page.cancel()
+
+        # Tasks added while fetching are after the counted ones.
+        offset = -(-total // page_size) * page_size
+        while True:
+            page, full = fetch(offset)
+            yield from unseen(page)
+            if not full:
+                return
+            offset += page_size
+
+    def __get_tasks_method(
+        self, kind: str, fields: Optional[List[str]] = None
+    ) -> Callable[..., list]:
+        if kind not in const.TASK_PAGE_LIMITS:
+            raise FastLabelInvalidException(
+                "Kind must be one of " + ", ".join(const.TASK_PAGE_LIMITS) + ".", 422
+            )
+        if not fields:
+            return getattr(self, f"get_{kind}_tasks")
+        # A client sharing the settings of this one, whose task lists are
+        # parsed keeping only fields.
+        client = type(self).__new__(type(self))
+        client.api = ProjectingApi(self.api, fields)
+        client.cache = self.cache
+        return getattr(client, f"get_{kind}_tasks")
+
+    def find_tasks(
+        self, kind: str, task_ids: List[str], max_workers: int = 8
+    ) -> List[dict]:
+        """
+        Find tasks by id concurrently with find_{kind}_task.
+        Returns a result per unique id in the order of task_ids. A failed
+        lookup does not stop the others.
+        e.g.) [
+                {"id": "YOUR_TASK_ID", "success": True, "result": {...}},
+                {"id": "DELETED_TASK_ID", "success": False,
+                 "result": {"error": "<Response [404]> Task not found."}}
+              ]
+
+        kind is the kind of the tasks. Same as iter_tasks (Required).
+        task_ids is a list of task ids (Required).
+        max_workers is the max number of requests sent at once (Optional).
+        """
+        # Validates the kind
+        self.__get_tasks_method(kind)
+        return self.__find_many(
+            getattr(self, f"find_{kind}_task"), task_ids, "id", max_workers
+        )
+
     # Task Create
 
     def create_image_task(
@@ -1010,6 +1616,7 @@ class Client:
         tags: list = [],
         metadatas: list = [],
         is_delete_exif: bool = False,
+        schema: Optional[AnnotationSchema] = None,
         **kwargs,
     ) -> str:
         """
@@ -1034,6 +1641,8 @@ class Client:
         tags is a list of tag to be set in advance (Optional).
         metadatas is a list of metadata key-value pairs to be set in advance (Optional).
             e.g.) [{"key": "metadata_key", "value": "some_value"}]
+        schema is an AnnotationSchema of the project. If given, annotations are
+        validated before the file is encoded and sent (Optional).
         assignee is slug of assigned user (Optional).
         reviewer is slug of review user (Optional).
         approver is slug of approve user (Optional).
@@ -1050,8 +1659,10 @@ class Client:
         if not utils.is_image_supported_size(file_path):
             raise FastLabelInvalidException("Supported image size is under 20 MB.", 422)
 
-        file = utils.base64_encode(file_path)
-        payload = {"project": project, "name": name, "file": file}
+        if schema is not None:
+            schema.validate(annotations)
+
+        payload = {"project": project, "name": name}
         if status:
             payload["status"] = status
         if external_status:
@@ -1059,9 +1670,9 @@ class Client:
         if priority is not None:
             payload["priority"] = priority
         if annotations:
-            for annotation in annotations:
-                annotation["content"] = name
-            payload["annotations"] = delete_extra_annotations_parameter(annotations)
+            payload["annotations"] = delete_extra_annotations_parameter(
+                annotations, content=name
+            )
         if tags:
             payload["tags"] = tags
         if metadatas:
@@ -1073,7 +1684,9 @@ class Client:
 
         self.__fill_assign_users(payload, **kwargs)
 
-        return self.api.post_request(endpoint, payload=payload)
+        return self.api.post_request_with_file(
+            endpoint, payload=payload, file_path=file_path
+        )
 
     def create_integrated_image_task(
         self,
@@ -1124,9 +1737,9 @@ class Client:
         if external_status:
             payload["externalStatus"] = external_status
         if annotations:
-            for annotation in annotations:
-                annotation["content"] = file_path
-            payload["annotations"] = delete_extra_annotations_parameter(annotations)
+            payload["annotations"] = delete_extra_annotations_parameter(
+                annotations, content=file_path
+            )
         if tags:
             payload["tags"] = tags
         if metadatas:
@@ -1182,8 +1795,7 @@ class Client:
         if not utils.is_image_supported_size(file_path):
             raise FastLabelInvalidException("Supported image size is under 20 MB.", 422)
 
-        file = utils.base64_encode(file_path)
-        payload = {"project": project, "name": name, "file": file}
+        payload = {"project": project, "name": name}
         if status:
             payload["status"] = status
         if external_status:
@@ -1200,7 +1812,9 @@ class Client:
 
         self.__fill_assign_users(payload, **kwargs)
 
-        return self.api.post_request(endpoint, payload=payload)
+        return self.api.post_request_with_file(
+            endpoint, payload=payload, file_path=file_path
+        )
 
     def create_integrated_image_classification_task(
         self,
@@ -1306,33 +1920,14 @@ class Client:
         file_paths = glob.glob(os.path.join(folder_path, "*"))
         if not file_paths:
             raise FastLabelInvalidException("Folder does not have any file.", 422)
-        contents = []
-        contents_size = 0
-        for file_path in file_paths:
-            if not utils.is_image_supported_ext(file_path):
-                raise FastLabelInvalidException(
-                    "Supported extensions are png, jpg, jpeg.", 422
-                )
-
-            if not utils.is_image_supported_size(file_path):
-                raise FastLabelInvalidException(
-                    "Supported image size is under 20 MB.", 422
-                )
-
-            if len(contents) == 6:
-                raise FastLabelInvalidException(
-                    "The count of files should be under 6", 422
-                )
-
-            file = utils.base64_encode(file_path)
-            contents.append({"name": os.path.basename(file_path), "file": file})
-            contents_size += utils.get_json_length(contents[-1])
-            if contents_size > const.SUPPORTED_CONTENTS_SIZE:
-                raise FastLabelInvalidException(
-                    "Supported contents size is under"
-                    f" {const.SUPPORTED_CONTENTS_SIZE}.",
-                    422,
-                )
+        contents = self.__encode_contents(
+            file_paths,
+            is_supported_ext=utils.is_image_supported_ext,
+            ext_error="Supported extensions are png, jpg, jpeg.",
+            is_supported_size=utils.is_image_supported_size,
+            size_error="Supported image size is under 20 MB.",
+            max_count=6,
+        )
 
         payload = {"project": project, "name": name, "contents": contents}
         if status:
@@ -1402,33 +1997,14 @@ class Client:
         file_paths = glob.glob(os.path.join(folder_path, "*"))
         if not file_paths:
             raise FastLabelInvalidException("Folder does not have any file.", 422)
-        contents = []
-        contents_size = 0
-        for file_path in file_paths:
-            if not utils.is_image_supported_ext(file_path):
-                raise FastLabelInvalidException(
-                    "Supported extensions are png, jpg, jpeg.", 422
-                )
-
-            if not utils.is_image_supported_size(file_path):
-                raise FastLabelInvalidException(
-                    "Supported image size is under 20 MB.", 422
-                )
-
-            if len(contents) == 250:
-                raise FastLabelInvalidException(
-                    "The count of files should be under 250", 422
-                )
-
-            file = utils.base64_encode(file_path)
-            contents.append({"name": os.path.basename(file_path), "file": file})
-            contents_size += utils.get_json_length(contents[-1])
-            if contents_size > const.SUPPORTED_CONTENTS_SIZE:
-                raise FastLabelInvalidException(
-                    "Supported contents size is under"
-                    f" {const.SUPPORTED_CONTENTS_SIZE}.",
-                    422,
-                )
+        contents = self.__encode_contents(
+            file_paths,
+            is_supported_ext=utils.is_image_supported_ext,
+            ext_error="Supported extensions are png, jpg, jpeg.",
+            is_supported_size=utils.is_image_supported_size,
+            size_error="Supported image size is under 20 MB.",
+            max_count=250,
+        )
 
         payload = {"project": project, "name": name, "contents": contents}
         if status:
@@ -1503,8 +2079,7 @@ class Client:
                 422,
             )
 
-        file = utils.base64_encode(file_path)
-        payload = {"project": project, "name": name, "file": file}
+        payload = {"project": project, "name": name}
         if status:
             payload["status"] = status
         if external_status:
@@ -1512,9 +2087,9 @@ class Client:
         if priority is not None:
             payload["priority"] = priority
         if annotations:
-            for annotation in annotations:
-                annotation["content"] = name
-            payload["annotations"] = delete_extra_annotations_parameter(annotations)
+            payload["annotations"] = delete_extra_annotations_parameter(
+                annotations, content=name
+            )
         if tags:
             payload["tags"] = tags
         if metadatas:
@@ -1522,7 +2097,9 @@ class Client:
 
         self.__fill_assign_users(payload, **kwargs)
 
-        return self.api.post_request(endpoint, payload=payload)
+        return self.api.post_request_with_file(
+            endpoint, payload=payload, file_path=file_path
+        )
 
     def create_video_classification_task(
         self,
@@ -1574,8 +2151,7 @@ class Client:
                 422,
             )
 
-        file = utils.base64_encode(file_path)
-        payload = {"project": project, "name": name, "file": file}
+        payload = {"project": project, "name": name}
         if status:
             payload["status"] = status
         if external_status:
@@ -1589,7 +2165,9 @@ class Client:
 
         self.__fill_assign_users(payload, **kwargs)
 
-        return self.api.post_request(endpoint, payload=payload)
+        return self.api.post_request_with_file(
+            endpoint, payload=payload, file_path=file_path
+        )
 
     def create_text_task(
         self,
@@ -1637,8 +2215,7 @@ class Client:
         if not utils.is_text_supported_size(file_path):
             raise FastLabelInvalidException("Supported text size is under 2 MB.", 422)
 
-        file = utils.base64_encode(file_path)
-        payload = {"project": project, "name": name, "file": file}
+        payload = {"project": project, "name": name}
         if status:
             payload["status"] = status
         if external_status:
@@ -1646,9 +2223,9 @@ class Client:
         if priority is not None:
             payload["priority"] = priority
         if annotations:
-            for annotation in annotations:
-                annotation["content"] = name
-            payload["annotations"] = delete_extra_annotations_parameter(annotations)
+            payload["annotations"] = delete_extra_annotations_parameter(
+                annotations, content=name
+            )
         if tags:
             payload["tags"] = tags
         if metadatas:
@@ -1656,7 +2233,9 @@ class Client:
 
         self.__fill_assign_users(payload, **kwargs)
 
-        return self.api.post_request(endpoint, payload=payload)
+        return self.api.post_request_with_file(
+            endpoint, payload=payload, file_path=file_path
+        )
 
     def create_text_classification_task(
         self,
@@ -1701,8 +2280,7 @@ class Client:
         if not utils.is_text_supported_size(file_path):
             raise FastLabelInvalidException("Supported text size is under 2 MB.", 422)
 
-        file = utils.base64_encode(file_path)
-        payload = {"project": project, "name": name, "file": file}
+        payload = {"project": project, "name": name}
         if status:
             payload["status"] = status
         if external_status:
@@ -1716,7 +2294,9 @@ class Client:
 
         self.__fill_assign_users(payload, **kwargs)
 
-        return self.api.post_request(endpoint, payload=payload)
+        return self.api.post_request_with_file(
+            endpoint, payload=payload, file_path=file_path
+        )
 
     def create_audio_task(
         self,
@@ -1768,8 +2348,7 @@ class Client:
                 "Supported audio size is under 120 MB.", 422
             )
 
-        file = utils.base64_encode(file_path)
-        payload = {"project": project, "name": name, "file": file}
+        payload = {"project": project, "name": name}
         if status:
             payload["status"] = status
         if external_status:
@@ -1777,9 +2356,9 @@ class Client:
         if priority is not None:
             payload["priority"] = priority
         if annotations:
-            for annotation in annotations:
-                annotation["content"] = name
-            payload["annotations"] = delete_extra_annotations_parameter(annotations)
+            payload["annotations"] = delete_extra_annotations_parameter(
+                annotations, content=name
+            )
         if tags:
             payload["tags"] = tags
         if metadatas:
@@ -1787,7 +2366,9 @@ class Client:
 
         self.__fill_assign_users(payload, **kwargs)
 
-        return self.api.post_request(endpoint, payload=payload)
+        return self.api.post_request_with_file(
+            endpoint, payload=payload, file_path=file_path
+        )
 
     def create_audio_classification_task(
         self,
@@ -1836,8 +2417,7 @@ class Client:
                 "Supported audio size is under 120 MB.", 422
             )
 
-        file = utils.base64_encode(file_path)
-        payload = {"project": project, "name": name, "file": file}
+        payload = {"project": project, "name": name}
         if status:
             payload["status"] = status
         if external_status:
@@ -1851,7 +2431,9 @@ class Client:
 
         self.__fill_assign_users(payload, **kwargs)
 
-        return self.api.post_request(endpoint, payload=payload)
+        return self.api.post_request_with_file(
+            endpoint, payload=payload, file_path=file_path
+        )
 
     def create_dicom_task(
         self,
@@ -1861,6 +2443,8 @@ class Client:
         external_status: str = None,
         tags: list = [],
         metadatas: list = [],
+        progress_callback: Optional[Callable[[UploadProgress], None]] = None,
+        upload_state_path: Optional[str] = None,
         **kwargs,
     ) -> str:
         """
@@ -1882,6 +2466,11 @@ class Client:
         external_assignee is slug of external assigned user (Optional).
         external_reviewer is slug of external review user (Optional).
         external_approver is slug of external approve user (Optional).
+        progress_callback is called with an UploadProgress while the file is
+        uploaded (Optional).
+        upload_state_path is a path to a JSON file recording the uploaded file.
+        When the task creation fails after the upload, calling again with the
+        same file reuses the upload instead of sending the file again (Optional).
         """
         endpoint = "tasks/dicom"
         if not utils.is_dicom_supported_ext(file_path):
@@ -1901,15 +2490,13 @@ class Client:
 
         self.__fill_assign_users(payload, **kwargs)
 
-        signed_url = self.__get_signed_path(
-            project=project,
-            file_name=os.path.basename(file_path),
-            file_type="application/zip",
+        return self.__post_with_zipfile(
+            endpoint,
+            payload=payload,
+            file_path=file_path,
+            progress_callback=progress_callback,
+            upload_state_path=upload_state_path,
         )
-        self.api.upload_zipfile(url=signed_url["url"], file_path=file_path)
-
-        payload["fileKey"] = signed_url["name"]
-        return self.api.post_request(endpoint, payload=payload)
 
     def create_pcd_task(
         self,
@@ -1957,8 +2544,7 @@ class Client:
         if not utils.is_pcd_supported_size(file_path):
             raise FastLabelInvalidException("Supported PCD size is under 100 MB.", 422)
 
-        file = utils.base64_encode(file_path)
-        payload = {"project": project, "name": name, "file": file}
+        payload = {"project": project, "name": name}
         if status:
             payload["status"] = status
         if external_status:
@@ -1966,9 +2552,9 @@ class Client:
         if priority is not None:
             payload["priority"] = priority
         if annotations:
-            for annotation in annotations:
-                annotation["content"] = name
-            payload["annotations"] = delete_extra_annotations_parameter(annotations)
+            payload["annotations"] = delete_extra_annotations_parameter(
+                annotations, content=name
+            )
         if tags:
             payload["tags"] = tags
         if metadatas:
@@ -1976,7 +2562,9 @@ class Client:
 
         self.__fill_assign_users(payload, **kwargs)
 
-        return self.api.post_request(endpoint, payload=payload)
+        return self.api.post_request_with_file(
+            endpoint, payload=payload, file_path=file_path
+        )
 
     def create_sequential_pcd_task(
         self,
@@ -2027,33 +2615,14 @@ class Client:
         file_paths = glob.glob(os.path.join(folder_path, "*"))
         if not file_paths:
             raise FastLabelInvalidException("Folder does not have any file.", 422)
-        contents = []
-        contents_size = 0
-        for file_path in file_paths:
-            if not utils.is_pcd_supported_ext(file_path):
-                raise FastLabelInvalidException(
-                    "Supported extensions are pcd only", 422
-                )
-
-            if not utils.is_pcd_supported_size(file_path):
-                raise FastLabelInvalidException(
-                    "Supported PCD size is under 30 MB.", 422
-                )
-
-            if len(contents) == 250:
-                raise FastLabelInvalidException(
-                    "The count of files should be under 250", 422
-                )
-
-            file = utils.base64_encode(file_path)
-            contents.append({"name": os.path.basename(file_path), "file": file})
-            contents_size += utils.get_json_length(contents[-1])
-            if contents_size > const.SUPPORTED_CONTENTS_SIZE:
-                raise FastLabelInvalidException(
-                    "Supported contents size is under"
-                    f" {const.SUPPORTED_CONTENTS_SIZE}.",
-                    422,
-                )
+        contents = self.__encode_contents(
+            file_paths,
+            is_supported_ext=utils.is_pcd_supported_ext,
+            ext_error="Supported extensions are pcd only",
+            is_supported_size=utils.is_pcd_supported_size,
+            size_error="Supported PCD size is under 30 MB.",
+            max_count=250,
+        )
 
         payload = {"project": project, "name": name, "contents": contents}
         if status:
@@ -2137,14 +2706,20 @@ class Client:
         return self.api.get_request(endpoint)
 
     def find_robotics_task_by_name(
-        self, project: str, task_name: str
+        self, project: str, task_name: str, index: Optional[TaskIndex] = None
     ) -> Optional[dict]:
         """
         Find a single robotics task by name.
 
         project is slug of your project (Required).
         task_name is a task name (Required).
+        index is a TaskIndex of the project. If given, the task id is looked up
+        in it instead of searching by name, and None is returned for names
+        not in it (Optional).
         """
+        if index is not None:
+            task_id = index.get_id(task_name)
+            return self.find_robotics_task(task_id) if task_id else None
         tasks = self.get_robotics_tasks(project=project, task_name=task_name)
         if not tasks:
             return None
@@ -2356,11 +2931,19 @@ class Client:
         self,
         project: str,
         file_path: str,
+        progress_callback: Optional[Callable[[UploadProgress], None]] = None,
+        upload_state_path: Optional[str] = None,
     ) -> list:
         """
         Import calibration file zip.
             project is slug of your project (Required).
             file_path is a path to data. Supported extensions are zip (Required).
+            progress_callback is called with an UploadProgress while the file is
+            uploaded (Optional).
+            upload_state_path is a path to a JSON file recording the uploaded
+            file. When the import fails after the upload, calling again with the
+            same file reuses the upload instead of sending the file again
+            (Optional).
         """
 
         if not utils.is_appendix_supported_ext(file_path):
@@ -2368,15 +2951,13 @@ class Client:
 
         endpoint = "contents/imports/appendix/batch"
         payload = {"project": project}
-        signed_url = self.__get_signed_path(
-            project=project,
-            file_name=os.path.basename(file_path),
-            file_type="application/zip",
+        return self.__post_with_zipfile(
+            endpoint,
+            payload=payload,
+            file_path=file_path,
+            progress_callback=progress_callback,
+            upload_state_path=upload_state_path,
         )
-        self.api.upload_zipfile(url=signed_url["url"], file_path=file_path)
-        payload["fileKey"] = signed_url["name"]
-
-        return self.api.post_request(endpoint, payload=payload)
 
     def get_appendix_data(
         self,
@@ -2409,11 +2990,57 @@ class Client:
         offset is the starting position number to fetch (Optional).
         limit is the max number to fetch (Optional).
         """
+        params = self.__get_appendix_data_params(
+            project=project,
+            status=status,
+            external_status=external_status,
+            tags=tags,
+            task_name=task_name,
+            offset=offset,
+            limit=limit,
+        )
+        return self.api.get_request("contents/export/appendix", params=params)
+
+    def iter_appendix_data(
+        self,
+        project: str,
+        status: str = None,
+        external_status: str = None,
+        tags: list = None,
+        task_name: str = None,
+        offset: int = None,
+        limit: int = 10000,
+    ) -> Iterator[dict]:
+        """
+        Yields the appendixes of get_appendix_data one by one while the response
+        is downloaded, without holding the whole list in memory.
+        The arguments are the same as get_appendix_data.
+        """
+        params = self.__get_appendix_data_params(
+            project=project,
+            status=status,
+            external_status=external_status,
+            tags=tags,
+            task_name=task_name,
+            offset=offset,
+            limit=limit,
+        )
+        return self.api.get_request_stream("contents/export/appendix", params=params)
+
+    def __get_appendix_data_params(
+        self,
+        project: str,
+        status: str = None,
+        external_status: str = None,
+        tags: list = None,
+        task_name: str = None,
+        offset: int = None,
+        limit: int = 10000,
+    ) -> dict:
         if limit > 10000:
             raise FastLabelInvalidException(
                 "Limit must be less than or equal to 10000.", 422
             )
-        endpoint = "contents/export/appendix"
         params = {"project": project}
         if status:
             params["status"] = status
@@ -2427,8 +3054,7 @@ class Client:
             params["offset"] = offset
         if limit:
             params["limit"] = limit
-
-        return self.api.get_request(endpoint, params=params)
+        return params
 
     def get_task_appendix_data(
         self,
@@ -2452,11 +3078,39 @@ class Client:
         offset is the starting position number to fetch (Optional).
         limit is the max number to fetch (Optional).
         """
+        params = self.__get_task_appendix_data_params(
+            project=project, task_name=task_name, offset=offset, limit=limit
+        )
+        return self.api.get_request("tasks/appendix", params=params)
+
+    def iter_task_appendix_data(
+        self,
+        project: str,
+        task_name: Optional[str] = None,
+        offset: Optional[int] = None,
+        limit: int = 10000,
+    ) -> Iterator[dict]:
+        """
+        Yields the appendixes of get_task_appendix_data one by one while the
+        response is downloaded, without holding the whole list in memory.
+        The arguments are the same as get_task_appendix_data.
+        """
+        params = self.__get_task_appendix_data_params(
+            project=project, task_name=task_name, offset=offset, limit=limit
+        )
+        return self.api.get_request_stream("tasks/appendix", params=params)
+
+    def __get_task_appendix_data_params(
+        self,
+        project: str,
+        task_name: Optional[str] = None,
+        offset: Optional[int] = None,
+        limit: int = 10000,
+    ) -> dict:
         if limit > 10000:
             raise FastLabelInvalidException(
                 "Limit must be less than or equal to 10000.", 422
             )
-        endpoint = "tasks/appendix"
         params = {"project": project}
         if task_name:
             params["taskName"] = task_name
@@ -2464,18 +3118,25 @@ class Client:
             params["offset"] = offset
         if limit:
             params["limit"] = limit
-
-        return self.api.get_request(endpoint, params=params)
+        return params
 
     def import_robotics_contents_file(
         self,
         project: str,
         file_path: str,
+        progress_callback: Optional[Callable[[UploadProgress], None]] = None,
+        upload_state_path: Optional[str] = None,
     ) -> list:
         """
         Import robotics contents file zip.
             project is slug of your project (Required).
             file_path is a path to data. Supported extensions are zip (Required).
+            progress_callback is called with an UploadProgress while the file is
+            uploaded (Optional).
+            upload_state_path is a path to a JSON file recording the uploaded
+            file. When the import fails after the upload, calling again with the
+            same file reuses the upload instead of sending the file again
+            (Optional).
         """
 
         if not utils.is_robotics_contents_supported_ext(file_path):
@@ -2483,15 +3144,337 @@ class Client:
 
         endpoint = "contents/imports/robotics-contents/batch"
         payload = {"project": project}
-        signed_url = self.__get_signed_path(
-            project=project,
-            file_name=os.path.basename(file_path),
-            file_type="application/zip",
+        return self.__post_with_zipfile(
+            endpoint,
+            payload=payload,
+            file_path=file_path,
+            progress_callback=progress_callback,
+            upload_state_path=upload_state_path,
         )
-        self.api.upload_zipfile(url=signed_url["url"], file_path=file_path)
-        payload["fileKey"] = signed_url["name"]
 
-        return self.api.post_request(endpoint, payload=payload)
+    def __encode_contents(
+        self,
+        file_paths: List[str],
+        is_supported_ext: Callable[[str], bool],
+        ext_error: str,
+        is_supported_size: Callable[[str], bool],
+        size_error: str,
+        max_count: int,
+    ) -> List[dict]:
+        """
+        Returns the contents of a task with several files, [{"name", "file"}].
+        Every file is checked and the size of the contents is computed from
+        the file sizes before any file is read, so invalid folders fail fast.
+        Files are then read and encoded concurrently.
+        """
+        contents_size = 0
+        for i, file_path in enumerate(file_paths):
+            if not is_supported_ext(file_path):
+                raise FastLabelInvalidException(ext_error, 422)
+            if not is_supported_size(file_path):
+                raise FastLabelInvalidException(size_error, 422)
+            if i == max_count:
+                raise FastLabelInvalidException(
+                    f"The count of files should be under {max_count}", 422
+                )
+            contents_size += utils.get_content_json_length(
+                os.path.basename(file_path), os.path.getsize(file_path)
+            )
+            if contents_size > const.SUPPORTED_CONTENTS_SIZE:
+                raise FastLabelInvalidException(
+                    "Supported contents size is under"
+                    f" {const.SUPPORTED_CONTENTS_SIZE}.",
+                    422,
+                )
+        with ThreadPoolExecutor(max_workers=min(8, len(file_paths))) as executor:
+            files = executor.map(utils.base64_encode, file_paths)
+            return [
+                {"name": os.path.basename(file_path), "file": file}
+                for file_path, file in zip(file_paths, files)
+            ]
+
+    # Task Bulk Create
+
+    def create_image_tasks(
+        self,
+        project: str,
+        items: Iterable[Union[str, dict]],
+        max_workers: int = 8,
+        max_bytes_in_flight: int = DEFAULT_MAX_BYTES_IN_FLIGHT,
+        journal_path: Optional[str] = None,
+        **kwargs,
+    ) -> List[dict]:
+        """
+        Create many image tasks concurrently with create_image_task.
+        Files are checked (extension and size) as items are read, and invalid
+        ones fail without a request. Valid files are sent by max_workers
+        threads, each file being encoded while it is sent. The total size of
+        the files being sent is kept under max_bytes_in_flight. Items are
+        read as workers become free, so items can be a generator over a
+        directory of any size.
+        Returns a result per item in the order of items. A failed item does
+        not stop the others.
+        e.g.) [
+                {"name": "a.jpg", "file_path": "./images/a.jpg", "success": True,
+                 "result": "YOUR_TASK_ID"},
+                {"name": "b.gif", "file_path": "./images/b.gif", "success": False,
+                 "result": {"error": "<Response [422]> ..."}}
+              ]
+
+        project is slug of your project (Required).
+        items is an iterable of file paths, or of dicts of the arguments of
+        create_image_task such as file_path, name and annotations.
+        Supported extensions are png, jpg, jpeg (Required).
+        max_workers is the max number of tasks created at once (Optional).
+        max_bytes_in_flight is the max total size of the encoded files
+        being sent at once (Optional).
+        journal_path is a path to a JSON Lines file recording the created
+        tasks (Optional). When an import stops midway, run it again with the
+        same journal_path: recorded items whose file is unchanged are not
+        created again, and are returned with "skipped": True.
+        Other keyword arguments are passed to every create_image_task call,
+        e.g. status and tags (Optional).
+        """
+        return self.__create_tasks(
+            "image",
+            project,
+            items,
+            max_workers,
+            max_bytes_in_flight,
+            journal_path,
+            kwargs,
+        )
+
+    def create_video_tasks(
+        self,
+        project: str,
+        items: Iterable[Union[str, dict]],
+        max_workers: int = 8,
+        max_bytes_in_flight: int = DEFAULT_MAX_BYTES_IN_FLIGHT,
+        journal_path: Optional[str] = None,
+        **kwargs,
+    ) -> List[dict]:
+        """
+        Create many video tasks concurrently with create_video_task.
+        Returns a result per item in the order of items. See create_image_tasks.
+
+        project is slug of your project (Required).
+        items is an iterable of file paths, or of dicts of the arguments of
+        create_video_task such as file_path, name and annotations.
+        Supported extensions are mp4 (Required).
+        max_workers is the max number of tasks created at once (Optional).
+        max_bytes_in_flight is the max total size of the encoded files
+        being sent at once (Optional).
+        journal_path is a path to a JSON Lines file recording the created
+        tasks. See create_image_tasks (Optional).
+        Other keyword arguments are passed to every create_video_task call,
+        e.g. status and tags (Optional).
+        """
+        return self.__create_tasks(
+            "video",
+            project,
+            items,
+            max_workers,
+            max_bytes_in_flight,
+            journal_path,
+            kwargs,
+        )
+
+    def create_text_tasks(
+        self,
+        project: str,
+        items: Iterable[Union[str, dict]],
+        max_workers: int = 8,
+        max_bytes_in_flight: int = DEFAULT_MAX_BYTES_IN_FLIGHT,
+        journal_path: Optional[str] = None,
+        **kwargs,
+    ) -> List[dict]:
+        """
+        Create many text tasks concurrently with create_text_task.
+        Returns a result per item in the order of items. See create_image_tasks.
+
+        project is slug of your project (Required).
+        items is an iterable of file paths, or of dicts of the arguments of
+        create_text_task such as file_path, name and annotations.
+        Supported extensions are txt (Required).
+        max_workers is the max number of tasks created at once (Optional).
+        max_bytes_in_flight is the max total size of the encoded files
+        being sent at once (Optional).
+        journal_path is a path to a JSON Lines file recording the created
+        tasks. See create_image_tasks (Optional).
+        Other keyword arguments are passed to every create_text_task call,
+        e.g. status and tags (Optional).
+        """
+        return self.__create_tasks(
+            "text",
+            project,
+            items,
+            max_workers,
+            max_bytes_in_flight,
+            journal_path,
+            kwargs,
+        )
+
+    def create_audio_tasks(
+        self,
+        project: str,
+        items: Iterable[Union[str, dict]],
+        max_workers: int = 8,
+        max_bytes_in_flight: int = DEFAULT_MAX_BYTES_IN_FLIGHT,
+        journal_path: Optional[str] = None,
+        **kwargs,
+    ) -> List[dict]:
+        """
+        Create many audio tasks concurrently with create_audio_task.
+        Returns a result per item in the order of items. See create_image_tasks.
+
+        project is slug of your project (Required).
+        items is an iterable of file paths, or of dicts of the arguments of
+        create_audio_task such as file_path, name and annotations.
+        Supported extensions are mp3, wav, m4a (Required).
+        max_workers is the max number of tasks created at once (Optional).
+        max_bytes_in_flight is the max total size of the encoded files
+        being sent at once (Optional).
+        journal_path is a path to a JSON Lines file recording the created
+        tasks. See create_image_tasks (Optional).
+        Other keyword arguments are passed to every create_audio_task call,
+        e.g. status and tags (Optional).
+        """
+        return self.__create_tasks(
+            "audio",
+            project,
+            items,
+            max_workers,
+            max_bytes_in_flight,
+            journal_path,
+            kwargs,
+        )
+
+    def create_pcd_tasks(
+        self,
+        project: str,
+        items: Iterable[Union[str, dict]],
+        max_workers: int = 8,
+        max_bytes_in_flight: int = DEFAULT_MAX_BYTES_IN_FLIGHT,
+        journal_path: Optional[str] = None,
+        **kwargs,
+    ) -> List[dict]:
+        """
+        Create many PCD tasks concurrently with create_pcd_task.
+        Returns a result per item in the order of items. See create_image_tasks.
+
+        project is slug of your project (Required).
+        items is an iterable of file paths, or of dicts of the arguments of
+        create_pcd_task such as file_path, name and annotations.
+        Supported extensions are pcd (Required).
+        max_workers is the max number of tasks created at once (Optional).
+        max_bytes_in_flight is the max total size of the encoded files
+        being sent at once (Optional).
+        journal_path is a path to a JSON Lines file recording the created
+        tasks. See create_image_tasks (Optional).
+        Other keyword arguments are passed to every create_pcd_task call,
+        e.g. status and tags (Optional).
+        """
+        return self.__create_tasks(
+            "pcd",
+            project,
+            items,
+            max_workers,
+            max_bytes_in_flight,
+            journal_path,
+            kwargs,
+        )
+
+    def __create_tasks(
+        self,
+        kind: str,
+        project: str,
+        items: Iterable[Union[str, dict]],
+        max_workers: int,
+        max_bytes_in_flight: int,
+        journal_path: Optional[str],
+        common_kwargs: dict,
+    ) -> List[dict]:
+        if max_workers < 1:
+            raise FastLabelInvalidException(
+                "max_workers must be greater than or equal to 1.", 422
+            )
+        create = getattr(self, f"create_{kind}_task")
+        is_supported_ext = getattr(utils, f"is_{kind}_supported_ext")
+        is_supported_size = getattr(utils, f"is_{kind}_supported_size")
+        budget = ByteBudget(max_bytes_in_flight)
+        journal = ImportJournal(journal_path) if journal_path else None
+        item_errors = (*self.__get_item_errors(), OSError)
+
+        def run(task_kwargs: dict, cost: int) -> dict:
+            try:
+                task_id = create(**task_kwargs)
+            except item_errors as e:
+                return {"success": False, "result": {"error": str(e)}}
+            finally:
+                budget.release(cost)
+            if journal is not None:
+                # The task exists, so it is not reported as failed even if
+                # it cannot be recorded.
+                try:
+                    journal.record(
+                        f"{project}/{task_kwargs['name']}",
+                        task_kwargs["file_path"],
+                        task_id,
+                    )
+                except OSError as e:
+                    logger.warning(
+                        "Failed to record %s in %s: %s",
+                        task_kwargs["name"],
+                        journal_path,
+                        e,
+                    )
+            return {"success": True, "result": task_id}
+
+        results = []
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for item in items:
+                    if not isinstance(item, dict):
+                        item = {"file_path": str(item)}
+                    task_kwargs = {**common_kwargs, **item, "project": project}
+                    file_path = task_kwargs["file_path"]
+                    task_kwargs.setdefault("name", os.path.basename(file_path))
+                    result = {"name": task_kwargs["name"], "file_path": file_path}
+                    results.append(result)
+                    task_id = (
+                        journal.get_id(f"{project}/{task_kwargs['name']}", file_path)
+                        if journal is not None
+                        else None
+                    )
+                    if task_id:
+                        result.update(success=True, result=task_id, skipped=True)
+                        continue
+                    try:
+                        if not is_supported_ext(file_path):
+                            raise FastLabelInvalidException(
+                                f"{file_path} is not a supported {kind} file.", 422
+                            )
+                        if not is_supported_size(file_path):
+                            raise FastLabelInvalidException(
+                                f"{file_path} exceeds the max size of {kind} tasks.",
+                                422,
+                            )
+                        # Size of the base64 encoded file
+                        cost = (os.path.getsize(file_path) + 2) // 3 * 4
+                    except (FastLabelException, OSError) as e:
+                        result.update(success=False, result={"error": str(e)})
+                        continue
+                    budget.acquire(cost)
+                    result["future"] = executor.submit(run, task_kwargs, cost)
+        finally:
+            if journal is not None:
+                journal.close()
+        for result in results:
+            future: Optional[Future] = result.pop("future", None)
+            if future is not None:
+                result.update(future.result())
+        return results
 
     # Task Update
 
@@ -2546,6 +3529,71 @@ class Client:
 
         return self.api.put_request(endpoint, payload=payload)
 
+    def update_tasks(
+        self,
+        kind: str,
+        updates: Iterable[Tuple[str, dict]],
+        max_workers: int = 8,
+    ) -> Iterator[dict]:
+        """
+        Update many tasks concurrently with update_{kind}_task.
+        Returns a generator, and nothing is sent until it is consumed, e.g.
+        with a for loop or list(). It yields a result per update in the order
+        of updates, as soon as that update and the ones before it are done.
+        Failed requests are retried as configured by the retry policy of the
+        client. A failed update, including a network error left after
+        retries, does not stop the others. Only max_workers * 2 updates are
+        read ahead, so updates can be a generator over any number of tasks.
+        The given fields, including annotations, are not modified.
+        e.g.) yields
+                {"id": "YOUR_TASK_ID", "success": True, "result": "YOUR_TASK_ID"},
+                {"id": "DELETED_TASK_ID", "success": False,
+                 "result": {"error": "<Response [404]> Task not found."}}
+
+        kind is the kind of the tasks, e.g. image, video or pcd (Required).
+        updates is an iterable of pairs of a task id and a dict of the
+        arguments of update_{kind}_task, e.g.
+        ("YOUR_TASK_ID", {"status": "completed", "annotations": [...]})
+        (Required).
+        max_workers is the max number of requests sent at once (Optional).
+        """
+        if max_workers < 1:
+            raise FastLabelInvalidException(
+                "max_workers must be greater than or equal to 1.", 422
+            )
+        update = getattr(self, f"update_{kind}_task", None)
+        if update is None:
+            raise FastLabelInvalidException(f"Unknown kind of task '{kind}'.", 422)
+        item_errors = self.__get_item_errors()
+
+        def run(task_id: str, fields: dict) -> dict:
+            try:
+                return {
+                    "id": task_id,
+                    "success": True,
+                    "result": update(task_id, **fields),
+                }
+            except item_errors as e:
+                return {"id": task_id, "success": False, "result": {"error": str(e)}}
+
+        updates = iter(updates)
+        pending = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                for task_id, fields in updates:
+                    pending.append(executor.submit(run, task_id, fields))
+                    if len(pending) >= max_workers * 2:
+                        break
+                while pending:
+                    done = pending.pop(0)
+                    update_item = next(updates, None)
+                    if update_item is not None:
+                        pending.append(executor.submit(run, *update_item))
+                    yield done.result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
     def update_image_task(
         self,
         task_id: str,
@@ -2557,6 +3605,7 @@ class Client:
         annotations: List[dict] = [],
         relations: Optional[List[dict]] = None,
         metadatas: list = [],
+        schema: Optional[AnnotationSchema] = None,
         **kwargs,
     ) -> str:
         """
@@ -2580,6 +3629,8 @@ class Client:
         relations is a list of annotation relations to be set (Optional).
         metadatas is a list of metadata key-value pairs to be set (Optional).
             e.g.) [{"key": "metadata_key", "value": "some_value"}]
+        schema is an AnnotationSchema of the project. If given, annotations are
+        validated before they are sent (Optional).
         assignee is slug of assigned user (Optional).
         reviewer is slug of review user (Optional).
         approver is slug of approve user (Optional).
@@ -2588,6 +3639,8 @@ class Client:
         external_approver is slug of external approve user (Optional).
         workflow_{1..6}_user is slug of custom workflow assignee user for each step (Optional).
         """
+        if schema is not None:
+            schema.validate(annotations)
         endpoint = "tasks/image/" + task_id
         payload = {}
         if status:
@@ -2599,11 +3652,11 @@ class Client:
         if tags:
             payload["tags"] = tags
         if annotations:
-            for annotation in annotations:
-                # Since the content name is not passed in the sdk update api,
-                # the content will be filled on the server side.
-                annotation["content"] = ""
-            payload["annotations"] = delete_extra_annotations_parameter(annotations)
+            # Since the content name is not passed in the sdk update api,
+            # the content will be filled on the server side.
+            payload["annotations"] = delete_extra_annotations_parameter(
+                annotations, content=""
+            )
         if relations:
             payload["relations"] = relations
         if custom_task_status:
@@ -2817,9 +3870,9 @@ class Client:
         if tags:
             payload["tags"] = tags
         if annotations:
-            for annotation in annotations:
-                annotation["content"] = ""
-            payload["annotations"] = delete_extra_annotations_parameter(annotations)
+            payload["annotations"] = delete_extra_annotations_parameter(
+                annotations, content=""
+            )
         if metadatas:
             payload["metadatas"] = metadatas
 
@@ -2924,9 +3977,9 @@ class Client:
         if tags:
             payload["tags"] = tags
         if annotations:
-            for annotation in annotations:
-                annotation["content"] = ""
-            payload["annotations"] = delete_extra_annotations_parameter(annotations)
+            payload["annotations"] = delete_extra_annotations_parameter(
+                annotations, content=""
+            )
         if metadatas:
             payload["metadatas"] = metadatas
 
@@ -3031,9 +4084,9 @@ class Client:
         if tags:
             payload["tags"] = tags
         if annotations:
-            for annotation in annotations:
-                annotation["content"] = ""
-            payload["annotations"] = delete_extra_annotations_parameter(annotations)
+            payload["annotations"] = delete_extra_annotations_parameter(
+                annotations, content=""
+            )
         if metadatas:
             payload["metadatas"] = metadatas
 
@@ -3138,11 +4191,11 @@ class Client:
         if tags:
             payload["tags"] = tags
         if annotations:
-            for annotation in annotations:
-                # Since the content name is not passed in the sdk update api,
-                # the content will be filled on the server side.
-                annotation["content"] = ""
-            payload["annotations"] = delete_extra_annotations_parameter(annotations)
+            # Since the content name is not passed in the sdk update api,
+            # the content will be filled on the server side.
+            payload["annotations"] = delete_extra_annotations_parameter(
+                annotations, content=""
+            )
         if metadatas:
             payload["metadatas"] = metadatas
 
@@ -3197,11 +4250,11 @@ class Client:
         if tags:
             payload["tags"] = tags
         if annotations:
-            for annotation in annotations:
-                # Since the content name is not passed in the sdk update api,
-                # the content will be filled on the server side.
-                annotation["content"] = ""
-            payload["annotations"] = delete_extra_annotations_parameter(annotations)
+            # Since the content name is not passed in the sdk update api,
+            # the content will be filled on the server side.
+            payload["annotations"] = delete_extra_annotations_parameter(
+                annotations, content=""
+            )
         if metadatas:
             payload["metadatas"] = metadatas
 
@@ -3642,6 +4695,7 @@ class Client:
             tasks=tasks,
             annotations=annotations,
             output_dir=output_dir,
+            session=self.api.session,
         )
         file_path = os.path.join(output_dir, output_file_name)
         with open(file_path, "w") as f:
@@ -3678,6 +4732,7 @@ class Client:
             tasks=tasks,
             classes=classes,
             output_dir=output_dir,
+            session=self.api.session,
         )
         for anno in annos:
             file_name = anno["filename"]
@@ -3719,7 +4774,10 @@ class Client:
 
         os.makedirs(output_dir, exist_ok=True)
         pascalvoc = converters.to_pascalvoc(
-            project_type=project["type"], tasks=tasks, output_dir=output_dir
+            project_type=project["type"],
+            tasks=tasks,
+            output_dir=output_dir,
+            session=self.api.session,
         )
         for voc in pascalvoc:
             file_name = voc["annotation"]["filename"]
@@ -4257,6 +5315,19 @@ class Client:
             return None
         return annotations[0]
 
+    def find_annotations(
+        self, annotation_ids: List[str], max_workers: int = 8
+    ) -> List[dict]:
+        """
+        Find annotations by id concurrently.
+        Returns a result per unique id in the order of annotation_ids, in the
+        same format as find_tasks.
+
+        annotation_ids is a list of annotation ids (Required).
+        max_workers is the max number of requests sent at once (Optional).
+        """
+        return self.__find_many(self.find_annotation, annotation_ids, "id", max_workers)
+
     def get_annotations(
         self,
         project: str,
@@ -4288,6 +5359,33 @@ class Client:
             params["limit"] = limit
         return self.api.get_request(endpoint, params=params)
 
+    def iter_annotations(
+        self, project: str, value: str = None, page_size: int = 1000
+    ) -> Iterator[dict]:
+        """
+        Yields every annotation of a project, fetching the pages one by one.
+
+        project is slug of your project (Required).
+        value is a unique identifier of annotation in your project (Optional).
+        page_size is the number of annotations fetched at once (Optional).
+        """
+        return self.__iter_pages(
+            lambda offset, limit: self.get_annotations(
+                project=project, value=value, offset=offset, limit=limit
+            ),
+            page_size,
+        )
+
+    def get_annotation_schema(self, project: str) -> AnnotationSchema:
+        """
+        Returns an AnnotationSchema holding every annotation definition of a
+        project, to validate task annotations locally.
+        Load it again after the annotations of the project are changed.
+
+        project is slug of your project (Required).
+        """
+        return AnnotationSchema(project, list(self.iter_annotations(project)))
+
     def create_annotation(
         self,
         project: str,
@@ -4423,7 +5521,9 @@ class Client:
         Find a project.
         """
         endpoint = "projects/" + project_id
-        return self.api.get_request(endpoint)
+        return self.__get_cached(
+            ("project", project_id), lambda: self.api.get_request(endpoint)
+        )
 
     def find_project_by_slug(self, slug: str) -> dict:
         """
@@ -4431,7 +5531,9 @@ class Client:
 
         slug is slug of your project (Required).
         """
-        projects = self.get_projects(slug=slug)
+        projects = self.__get_cached(
+            ("project_by_slug", slug), lambda: self.get_projects(slug=slug)
+        )
         if not projects:
             return None
         return projects[0]
@@ -4507,6 +5609,20 @@ class Client:
             params["limit"] = limit
         return self.api.get_request(endpoint, params=params)
 
+    def iter_projects(self, slug: str = None, page_size: int = 1000) -> Iterator[dict]:
+        """
+        Yields every project, fetching the pages one by one.
+
+        slug is slug of your project (Optional).
+        page_size is the number of projects fetched at once (Optional).
+        """
+        return self.__iter_pages(
+            lambda offset, limit: self.get_projects(
+                slug=slug, offset=offset, limit=limit
+            ),
+            page_size,
+        )
+
     def get_project_id_slug_map(
         self,
         offset: int = None,
@@ -4534,7 +5650,10 @@ class Client:
             params["offset"] = offset
         if limit:
             params["limit"] = limit
-        return self.api.get_request(endpoint, params=params)
+        return self.__get_cached(
+            ("project_id_slug_map", offset, limit),
+            lambda: self.api.get_request(endpoint, params=params),
+        )
 
     def create_project(
         self,
@@ -4575,7 +5694,12 @@ class Client:
             payload["isPixel"] = is_pixel
         if job_size:
             payload["jobSize"] = job_size
-        return self.api.post_request(endpoint, payload=payload)
+        project_id = self.api.post_request(endpoint, payload=payload)
+        if self.cache is not None:
+            # The new project may have been looked up by slug before.
+            self.cache.invalidate_kind("project_by_slug")
+            self.cache.invalidate_kind("project_id_slug_map")
+        return project_id
 
     def update_project(
         self,
@@ -4610,14 +5734,20 @@ class Client:
             payload["workflow"] = workflow
         if external_workflow:
             payload["externalWorkflow"] = external_workflow
-        return self.api.put_request(endpoint, payload=payload)
+        try:
+            return self.api.put_request(endpoint, payload=payload)
+        finally:
+            self.__invalidate_projects(project_id)
 
     def delete_project(self, project_id: str) -> None:
         """
         Delete a project.
         """
         endpoint = "projects/" + project_id
-        self.api.delete_request(endpoint)
+        try:
+            self.api.delete_request(endpoint)
+        finally:
+            self.__invalidate_projects(project_id)
 
     def copy_project(
         self,
@@ -4634,10 +5764,15 @@ class Client:
             payload["name"] = project_name
         if project_slug:
             payload["slug"] = project_slug
-        return self.api.post_request(
+        result = self.api.post_request(
             endpoint,
             payload=payload,
         )
+        if self.cache is not None:
+            # The new project may have been looked up by slug before.
+            self.cache.invalidate_kind("project_by_slug")
+            self.cache.invalidate_kind("project_id_slug_map")
+        return result
 
     def update_project_metadata(
         self,
@@ -4661,7 +5796,10 @@ class Client:
             "externalCode2": external_code_2,
             "externalCode3": external_code_3,
         }
-        return self.api.put_request(endpoint, payload=payload)
+        try:
+            return self.api.put_request(endpoint, payload=payload)
+        finally:
+            self.__invalidate_projects(project_id)
 
     def update_project_user_permission(
         self,
@@ -4681,7 +5819,11 @@ class Client:
         """
         endpoint = "projects-users"
         payload = {"project": project, "email": email, "role": role}
-        return self.api.put_request(endpoint, payload=payload)
+        try:
+            return self.api.put_request(endpoint, payload=payload)
+        finally:
+            # Only the slug is known, so every cached project is dropped.
+            self.__invalidate_projects()
 
     # Tags
 
@@ -4714,6 +5856,23 @@ class Client:
             params["limit"] = limit
         return self.api.get_request(endpoint, params=params)
 
+    def iter_tags(
+        self, project: str, keyword: str = None, page_size: int = 1000
+    ) -> Iterator[dict]:
+        """
+        Yields every tag of a project, fetching the pages one by one.
+
+        project is slug of your project (Required).
+        keyword are search terms in the tag name (Optional).
+        page_size is the number of tags fetched at once (Optional).
+        """
+        return self.__iter_pages(
+            lambda offset, limit: self.get_tags(
+                project=project, keyword=keyword, offset=offset, limit=limit
+            ),
+            page_size,
+        )
+
     def delete_tags(self, tag_ids: List[str]) -> None:
         """
         Delete a tags.
@@ -4729,7 +5888,9 @@ class Client:
         Find a dataset with latest version.
         """
         endpoint = "datasets-v2/" + dataset_id
-        return self.api.get_request(endpoint)
+        return self.__get_cached(
+            ("dataset", dataset_id), lambda: self.api.get_request(endpoint)
+        )
 
     def get_datasets(
         self,
@@ -4791,14 +5952,22 @@ class Client:
         payload = {"name": name}
         if tags is not None:
             payload["tags"] = tags
-        return self.api.put_request(endpoint, payload=payload)
+        try:
+            return self.api.put_request(endpoint, payload=payload)
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate(("dataset", dataset_id))
 
     def delete_dataset(self, dataset_id: str) -> None:
         """
         Delete a dataset.
         """
         endpoint = "datasets-v2/" + dataset_id
-        self.api.delete_request(endpoint)
+        try:
+            self.api.delete_request(endpoint)
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate(("dataset", dataset_id))
 
     # Dataset Object
 
@@ -4836,6 +6005,42 @@ class Client:
             params["version"] = version
         return self.api.get_request(endpoint, params=params)
 
+    def find_dataset_objects(
+        self,
+        dataset_id: str,
+        object_names: List[str],
+        version: str = None,
+        revision_id: str = None,
+        max_workers: int = 8,
+    ) -> List[dict]:
+        """
+        Find dataset objects by name concurrently.
+        Returns a result per unique name in the order of object_names.
+        e.g.) [{"name": "sample.jpg", "success": True, "result": {...}}]
+
+        dataset_id is dataset id (Required).
+        object_names is a list of dataset object names (Required).
+        version is dataset version (Optional).
+        revision_id is dataset rebision (Optional).
+        Only use specify one of revision_id or version.
+        max_workers is the max number of requests sent at once (Optional).
+        """
+        if version and revision_id:
+            raise FastLabelInvalidException(
+                "only use specify one of revisionId or version.", 400
+            )
+        return self.__find_many(
+            lambda object_name: self.find_dataset_object(
+                dataset_id=dataset_id,
+                object_name=object_name,
+                version=version,
+                revision_id=revision_id,
+            ),
+            object_names,
+            "name",
+            max_workers,
+        )
+
     def get_dataset_objects(
         self,
         dataset: str,
@@ -4981,9 +6186,11 @@ class Client:
     def __download_dataset_object(self, download_path: Path, obj: dict):
         obj_path = download_path / obj["name"]
         os.makedirs(obj_path.parent, exist_ok=True)
-        response = requests.get(obj["signedUrl"])
-        with obj_path.open("wb") as f:
-            f.write(response.content)
+        converters._download_file(
+            url=obj["signedUrl"],
+            output_file_path=str(obj_path),
+            session=self.api.session,
+        )
 
     def create_dataset_object(
         self,
@@ -5167,6 +6374,100 @@ class Client:
         params = {"project": project, "fileName": file_name, "fileType": file_type}
         return self.api.get_request(endpoint, params)
 
+    def __iter_pages(
+        self, get_page: Callable[[int, int], list], page_size: int
+    ) -> Iterator[dict]:
+        """
+        Calls get_page(offset, limit) until a page shorter than page_size is
+        returned, and yields the items of every page.
+        The first page is fetched when the iteration starts.
+        """
+        if page_size < 1:
+            raise FastLabelInvalidException(
+                "Page size must be greater than or equal to 1.", 422
+            )
+        return self.__iter_page_items(get_page, page_size)
+
+    def __iter_page_items(
+        self, get_page: Callable[[int, int], list], page_size: int
+    ) -> Iterator[dict]:
+        offset = 0
+        while True:
+            page = get_page(offset, page_size)
+            yield from page
+            if len(page) < page_size:
+                return
+            offset += len(page)
+
+    def __upload_zipfile(
+        self,
+        project: str,
+        file_path: str,
+        progress_callback: Optional[Callable[[UploadProgress], None]] = None,
+    ) -> str:
+        """
+        Uploads a zip file to a signed URL and returns its file key.
+        """
+        signed_url = self.__get_signed_path(
+            project=project,
+            file_name=os.path.basename(file_path),
+            file_type="application/zip",
+        )
+        self.api.upload_zipfile(
+            url=signed_url["url"],
+            file_path=file_path,
+            progress_callback=progress_callback,
+        )
+        return signed_url["name"]
+
+    def __post_with_zipfile(
+        self,
+        endpoint: str,
+        payload: dict,
+        file_path: str,
+        progress_callback: Optional[Callable[[UploadProgress], None]] = None,
+        upload_state_path: Optional[str] = None,
+    ):
+        """
+        Uploads a zip file and posts payload with its file key.
+        With upload_state_path, a file uploaded by a previous call whose post
+        failed is not uploaded again.
+        """
+        project = payload["project"]
+        upload_state = UploadState(upload_state_path) if upload_state_path else None
+        file_key = (
+            upload_state.get_file_key(project, file_path) if upload_state else None
+        )
+        if file_key:
+            try:
+                result = self.api.post_request(
+                    endpoint, payload={**payload, "fileKey": file_key}
+                )
+            except FastLabelInvalidException as e:
+                if not is_file_key_error(e):
+                    # The payload itself was rejected. Sending the file again
+                    # would fail the same way, so the upload is kept.
+                    raise
+                # The previous upload has expired. Send the file again.
+                logger.warning(
+                    "Uploading %s again as its previous upload was rejected: %s",
+                    file_path,
+                    e,
+                )
+            else:
+                upload_state.remove(project, file_path)
+                return result
+
+        file_key = self.__upload_zipfile(project, file_path, progress_callback)
+        if upload_state:
+            upload_state.save(project, file_path, file_key)
+        result = self.api.post_request(
+            endpoint, payload={**payload, "fileKey": file_key}
+        )
+        if upload_state:
+            upload_state.remove(project, file_path)
+        return result
+
     def get_training_jobs(
         self,
         offset: int = None,
@@ -5464,6 +6765,20 @@ class Client:
 
         return self.api.get_request(endpoint, params=params)
 
+    def iter_histories(self, project: str, page_size: int = 1000) -> Iterator[dict]:
+        """
+        Yields every import history of a project, fetching the pages one by one.
+
+        project is slug of your project (Required).
+        page_size is the number of histories fetched at once (Optional).
+        """
+        return self.__iter_pages(
+            lambda offset, limit: self.get_histories(
+                project=project, offset=offset, limit=limit
+            ),
+            page_size,
+        )
+
     def get_task_comments(
         self,
         project: str,
@@ -5713,23 +7028,53 @@ class Client:
         ]
 
 
-def delete_extra_annotations_parameter(annotations: list) -> list:
+def delete_extra_annotations_parameter(
+    annotations: list, content: Optional[str] = None
+) -> list:
+    """
+    Returns copies of annotations without the parameters the API does not
+    accept. annotations are not modified.
+    content is set to the content of every annotation (Optional).
+    """
+    results = []
     for annotation in annotations:
-        annotation.pop("id", None)
-        annotation.pop("title", None)
-        annotation.pop("color", None)
-        for keypoint in annotation.get("keypoints", []):
-            keypoint.pop("edges", None)
-            keypoint.pop("name", None)
+        annotation = {
+            key: value
+            for key, value in annotation.items()
+            if key not in ("id", "title", "color")
+        }
+        if "keypoints" in annotation:
+            annotation["keypoints"] = [
+                {
+                    key: value
+                    for key, value in keypoint.items()
+                    if key not in ("edges", "name")
+                }
+                for keypoint in annotation["keypoints"]
+            ]
         annotation["attributes"] = delete_extra_attributes_parameter(
             annotation.get("attributes", [])
         )
-    return annotations
+        if content is not None:
+            annotation["content"] = content
+        results.append(annotation)
+    return results
 
 
 def delete_extra_attributes_parameter(attributes: list) -> list:
-    for attribute in attributes:
-        attribute.pop("title", None)
-        attribute.pop("name", None)
-        attribute.pop("type", None)
-    return attributes
+    """
+    Returns copies of attributes without the parameters the API does not
+    accept. attributes are not modified.
+    """
+    return [
+        {
+            key: value
+            for key, value in attribute.items()
+            if key not in ("title", "name", "type")
+        }
+        for attribute in attributes
+    ]
+
+
+# Imported last: AsyncClient mirrors the methods of Client.
+from .async_client import AsyncClient  # noqa: E402, F401, isort: skip
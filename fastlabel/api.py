@@ -1,9 +1,70 @@
+import gzip
+import json
+import logging
 import os
-from typing import Optional, Union
+import threading
+import time
+import zlib
+from typing import Callable, Dict, Iterator, List, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .exceptions import FastLabelException, FastLabelInvalidException
+from .http_cache import HTTPCache
+from .json_stream import ProjectingScanner, iter_json_array
+from .metrics import (
+    Metrics,
+    RequestRecord,
+    get_request_size,
+    get_response_size,
+    normalize_endpoint,
+)
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .transport import RequestsTransport, Transport
+from .upload import (
+    JSONFileReader,
+    MultipartFileReader,
+    ProgressCallback,
+    UploadProgress,
+)
+
+logger = logging.getLogger(__name__)
+
+# Number of connections kept alive per host. Matches the largest thread pool used
+# inside the SDK so that concurrent downloads do not open throwaway connections.
+DEFAULT_POOL_MAXSIZE = 10
+
+# Number of hosts whose pools are cached (API host plus storage hosts of signed URLs).
+DEFAULT_POOL_CONNECTIONS = 10
+
+# Bodies smaller than this are sent as is. Compressing them costs more CPU time
+# than the bandwidth it saves.
+DEFAULT_COMPRESSION_THRESHOLD = 64 * 1024
+
+SUPPORTED_COMPRESSIONS = ("gzip", "deflate")
+
+# wbits of zlib for each compression, i.e. gzip and zlib headers.
+_COMPRESSION_WBITS = {"gzip": 31, "deflate": 15}
+
+# Size of the chunks read from a streamed response body.
+DEFAULT_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def iter_compressed(
+    chunks: Iterator[bytes], compression: str, level: int
+) -> Iterator[bytes]:
+    """
+    Yields chunks compressed with compression, 'gzip' or 'deflate', as one
+    stream. The result is the same format as gzip.compress or zlib.compress
+    of the joined chunks. Empty bytes are never yielded.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, _COMPRESSION_WBITS[compression])
+    for chunk in chunks:
+        if data := compressor.compress(chunk):
+            yield data
+    yield compressor.flush()
 
 
 class Api:
@@ -11,13 +72,330 @@ class Api:
 
     access_token = None
 
-    def __init__(self, access_token: Optional[str] = None):
+    def __init__(
+        self,
+        access_token: Optional[str] = None,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_policies: Optional[Dict[str, RetryPolicy]] = None,
+        rate_limiter: Union[RateLimiter, bool, None] = None,
+        compression: Optional[str] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        compression_level: int = 6,
+        metrics: Optional[Metrics] = None,
+        transport: Optional[Transport] = None,
+        http_cache: Optional[HTTPCache] = None,
+    ):
+        """
+        access_token is your FastLabel API key. Falls back to the
+        FASTLABEL_ACCESS_TOKEN environment variable (Optional).
+        pool_maxsize is the number of connections kept alive per host.
+        Set it to at least the number of threads sharing this client (Optional).
+        pool_connections is the number of hosts whose connection pools are
+        cached (Optional).
+        retry_policy is the default RetryPolicy. Pass RetryPolicy(max_retries=0)
+        to disable retries (Optional).
+        retry_policies is a map of endpoint prefix and RetryPolicy to override
+        the default for a class of endpoints.
+            e.g.) {"tasks/": RetryPolicy(max_retries=5)} (Optional).
+        rate_limiter is a RateLimiter shared by every thread using this client.
+        Defaults to the documented API limit of 10000 calls per 10 minutes.
+        Pass False to disable it (Optional).
+        compression can be 'gzip' or 'deflate'. POST and PUT bodies are sent
+        compressed with Content-Encoding when their size reaches
+        compression_threshold bytes. Bodies holding a file, e.g. of
+        create_image_task, are compressed while they are sent and sent chunked
+        without Content-Length (Optional).
+        compression_level is the level from 1 (fastest) to 9 (smallest) (Optional).
+        metrics is the Metrics recording the requests. Pass one to share it
+        between clients (Optional).
+        transport is the Transport sending the API requests and uploads.
+        Defaults to requests on the pooled session. Pass HTTPXTransport() to
+        multiplex concurrent requests over HTTP/2. File downloads always use
+        the pooled session (Optional).
+        http_cache is an HTTPCache storing GET responses on disk. Stored
+        responses are revalidated with If-None-Match and If-Modified-Since,
+        and reused when the server answers 304 (Optional).
+        """
         if api_url := os.environ.get("FASTLABEL_API_URL"):
             self.base_url = api_url
         access_token = access_token or os.environ.get("FASTLABEL_ACCESS_TOKEN")
         if not access_token:
             raise ValueError("FASTLABEL_ACCESS_TOKEN is not configured.")
+        if pool_maxsize < 1:
+            raise ValueError("pool_maxsize must be greater than or equal to 1.")
+        if compression is not None and compression not in SUPPORTED_COMPRESSIONS:
+            raise ValueError("compression must be one of 'gzip', 'deflate'.")
         self.access_token = "Bearer " + access_token
+        self.pool_maxsize = pool_maxsize
+        self.pool_connections = pool_connections
+        self._session = None
+        self._session_lock = threading.Lock()
+        self.retry_policies = {"": retry_policy or RetryPolicy()}
+        self.retry_policies.update(retry_policies or {})
+        self._retry_stats = {}
+        self._upload_stats = {"uploads": 0, "bytes_sent": 0, "elapsed": 0.0}
+        self._stats_lock = threading.Lock()
+        if rate_limiter is None or rate_limiter is True:
+            rate_limiter = RateLimiter()
+        self.rate_limiter = rate_limiter or None
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self.compression_level = compression_level
+        self.metrics = metrics or Metrics()
+        self.transport = transport or RequestsTransport(lambda: self.session)
+        self.http_cache = http_cache
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Pooled session shared by every request of this client.
+        Connections are kept alive and reused across threads, so consecutive
+        calls skip the TCP and TLS handshakes.
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self) -> None:
+        """
+        Close every pooled connection. The session is recreated on the next request.
+        """
+        self.transport.close()
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def get_retry_policy(self, endpoint: str) -> RetryPolicy:
+        """
+        Returns the retry policy of the longest matching endpoint prefix,
+        or the default policy.
+        """
+        return self.retry_policies[self._get_endpoint_class(endpoint)]
+
+    def _get_endpoint_class(self, endpoint: str) -> str:
+        matched = ""
+        for prefix in self.retry_policies:
+            if endpoint.startswith(prefix) and len(prefix) > len(matched):
+                matched = prefix
+        return matched
+
+    def get_retry_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Returns retry counters per endpoint class.
+        e.g.) {
+                "": {"calls": 120, "retries": 4, "exhausted": 0},
+                "tasks/": {"calls": 3000, "retries": 57, "exhausted": 1}
+              }
+        "" is the class of endpoints that match no prefix.
+        """
+        with self._stats_lock:
+            return {key: dict(stats) for key, stats in self._retry_stats.items()}
+
+    def _record_retry_stats(self, endpoint_class: str, name: str) -> None:
+        with self._stats_lock:
+            stats = self._retry_stats.setdefault(
+                endpoint_class, {"calls": 0, "retries": 0, "exhausted": 0}
+            )
+            stats[name] += 1
+
+    def _send_limited(
+        self, send: Callable[[], requests.Response], rate_limited: bool
+    ) -> requests.Response:
+        if not rate_limited or self.rate_limiter is None:
+            return send()
+        self.rate_limiter.acquire()
+        started_at = time.monotonic()
+        status_code = None
+        try:
+            response = send()
+            status_code = response.status_code
+            return response
+        finally:
+            self.rate_limiter.release(status_code, time.monotonic() - started_at)
+
+    def _call_with_retry(
+        self,
+        method: str,
+        endpoint: str,
+        send: Callable[[], requests.Response],
+        rate_limited: bool = True,
+    ) -> requests.Response:
+        """
+        Calls send until it returns a response that is not retryable,
+        following the retry policy of the endpoint.
+        Returns the last response. Raises the last error when the request could
+        not be sent.
+        rate_limited is whether the calls go through the rate limiter.
+        Requests to signed URLs do not count against the API limit.
+        """
+        endpoint_class = self._get_endpoint_class(endpoint)
+        policy = self.retry_policies[endpoint_class]
+        self._record_retry_stats(endpoint_class, "calls")
+        started_at = time.monotonic()
+        retry = 0
+
+        def measured_send():
+            nonlocal sent_at
+            sent_at = time.monotonic()
+            return send()
+
+        while True:
+            error = None
+            response = None
+            sent_at = None
+            try:
+                try:
+                    response = self._send_limited(measured_send, rate_limited)
+                finally:
+                    self._record_metrics(method, endpoint, retry, sent_at, response)
+            except (*self.transport.connect_errors, *self.transport.errors) as e:
+                connected = not self.transport.is_connect_error(e)
+                if not policy.is_retryable_error(method, connected=connected):
+                    raise
+                error = e
+            else:
+                if not policy.is_retryable_status(method, response.status_code):
+                    return response
+
+            delay = self._get_retry_delay(
+                policy, endpoint_class, method, endpoint, retry, started_at, response
+            )
+            if delay is None:
+                if error is not None:
+                    raise error
+                return response
+            if response is not None:
+                # Releases the connection of a streamed response to the pool.
+                response.close()
+            time.sleep(delay)
+            retry += 1
+
+    def _record_metrics(
+        self,
+        method: str,
+        endpoint: str,
+        retry: int,
+        sent_at: Optional[float],
+        response=None,
+    ) -> None:
+        if sent_at is None:
+            # Failed before being sent
+            return
+        self.metrics.record(
+            RequestRecord(
+                method=method,
+                endpoint=normalize_endpoint(endpoint),
+                status_code=None if response is None else response.status_code,
+                latency=time.monotonic() - sent_at,
+                bytes_sent=0 if response is None else get_request_size(response),
+                bytes_received=0 if response is None else get_response_size(response),
+                retry=retry,
+            )
+        )
+
+    def _get_retry_delay(
+        self,
+        policy: RetryPolicy,
+        endpoint_class: str,
+        method: str,
+        endpoint: str,
+        retry: int,
+        started_at: float,
+        response=None,
+    ) -> Optional[float]:
+        """
+        Returns the seconds to wait before the next retry,
+        or None when the retries are exhausted.
+        response is None when the request failed with a connection error.
+        """
+        if response is None:
+            delay = policy.get_backoff(retry)
+        else:
+            delay = policy.get_delay(retry, response.headers.get("Retry-After"))
+        elapsed = time.monotonic() - started_at
+        if retry >= policy.max_retries or (
+            policy.max_elapsed is not None and elapsed + delay > policy.max_elapsed
+        ):
+            self._record_retry_stats(endpoint_class, "exhausted")
+            return None
+
+        logger.info(
+            "Retrying %s %s in %.2f seconds (%d/%d, %s).",
+            method,
+            endpoint,
+            delay,
+            retry + 1,
+            policy.max_retries,
+            "connection error" if response is None else response.status_code,
+        )
+        self._record_retry_stats(endpoint_class, "retries")
+        return delay
+
+    def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        url = self.base_url + endpoint
+        return self._call_with_retry(
+            method, endpoint, lambda: self.transport.request(method, url, **kwargs)
+        )
+
+    def _encode_json_body(self, payload, headers: dict) -> dict:
+        """
+        Returns the keyword arguments sending payload as a JSON body.
+        The body is compressed when compression is enabled and it is large
+        enough. Content-Encoding is added to headers in that case.
+        """
+        if self.compression is None:
+            return {"json": payload}
+        body = json.dumps(payload, allow_nan=False).encode("utf-8")
+        if len(body) < self.compression_threshold:
+            return {"data": body}
+        if self.compression == "gzip":
+            body = gzip.compress(body, compresslevel=self.compression_level)
+        else:
+            body = zlib.compress(body, self.compression_level)
+        headers["Content-Encoding"] = self.compression
+        return {"data": body}
+
+    def _encode_file_body(self, body: JSONFileReader, headers: dict):
+        """
+        Returns body as it is sent. When compression is enabled and body is
+        large enough, it is compressed chunk by chunk into an iterator of bytes
+        and Content-Encoding is added to headers. The compressed size is not
+        known in advance, so the iterator is sent chunked.
+        """
+        if self.compression is None or len(body) < self.compression_threshold:
+            return body
+        headers["Content-Encoding"] = self.compression
+        return iter_compressed(
+            iter(lambda: body.read(body.chunk_size), b""),
+            self.compression,
+            self.compression_level,
+        )
+
+    @staticmethod
+    def _raise_error(r: requests.Response) -> None:
+        try:
+            error = r.json()["message"]
+        except ValueError:
+            error = r.text
+        if str(r.status_code).startswith("4"):
+            raise FastLabelInvalidException(error, r.status_code)
+        else:
+            raise FastLabelException(error, r.status_code)
 
     def get_request(self, endpoint: str, params=None) -> Union[dict, list]:
         """Makes a get request to an endpoint.
@@ -30,19 +408,65 @@ class Api:
             "Content-Type": "application/json",
             "Authorization": self.access_token,
         }
-        r = requests.get(self.base_url + endpoint, headers=headers, params=params)
+        cache_key = cached = None
+        if self.http_cache is not None:
+            cache_key = self.http_cache.get_key(
+                self.base_url + endpoint, params, self.access_token
+            )
+            cached = self.http_cache.get(cache_key)
+            if cached is not None:
+                if cached.etag:
+                    headers["If-None-Match"] = cached.etag
+                if cached.last_modified:
+                    headers["If-Modified-Since"] = cached.last_modified
+        r = self._request("GET", endpoint, headers=headers, params=params)
 
+        if r.status_code == 304 and cached is not None:
+            return json.loads(cached.body)
         if r.status_code == 200:
+            if cache_key is not None:
+                self.http_cache.store(
+                    cache_key,
+                    r.headers.get("ETag"),
+                    r.headers.get("Last-Modified"),
+                    r.content,
+                )
             return r.json()
-        else:
-            try:
-                error = r.json()["message"]
-            except ValueError:
-                error = r.text
-            if str(r.status_code).startswith("4"):
-                raise FastLabelInvalidException(error, r.status_code)
-            else:
-                raise FastLabelException(error, r.status_code)
+        self._raise_error(r)
+
+    def get_request_stream(
+        self,
+        endpoint: str,
+        params=None,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        fields: Optional[List[str]] = None,
+    ) -> Iterator:
+        """Makes a get request to an endpoint returning a JSON array, and
+        yields its items while the body is downloaded.
+        Only one item is decoded at a time, so the memory does not grow with
+        the size of the response.
+        With fields, only these dotted paths of the items are decoded. See
+        ProjectingScanner.
+        The request is retried until the response is received. Errors while
+        reading the body are raised as is.
+        """
+        params = params or {}
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": self.access_token,
+        }
+        r = self._request("GET", endpoint, headers=headers, params=params, stream=True)
+        try:
+            if r.status_code != 200:
+                # The error message is in the body, which is not loaded yet.
+                self.transport.read(r)
+                self._raise_error(r)
+            scanner = ProjectingScanner(fields) if fields else None
+            yield from iter_json_array(
+                self.transport.iter_bytes(r, chunk_size), scanner=scanner
+            )
+        finally:
+            r.close()
 
     def delete_request(self, endpoint: str, params=None, payload=None) -> dict:
         """Makes a delete request to an endpoint.
@@ -55,21 +479,13 @@ class Api:
             "Content-Type": "application/json",
             "Authorization": self.access_token,
         }
-        r = requests.delete(
-            self.base_url + endpoint, headers=headers, params=params, json=payload
+        r = self._request(
+            "DELETE", endpoint, headers=headers, params=params, json=payload
         )
 
         if r.status_code == 200 or r.status_code == 204:
             return
-
-        try:
-            error = r.json()["message"]
-        except ValueError:
-            error = r.text
-        if str(r.status_code).startswith("4"):
-            raise FastLabelInvalidException(error, r.status_code)
-        else:
-            raise FastLabelException(error, r.status_code)
+        self._raise_error(r)
 
     def post_request(self, endpoint, payload=None):
         """Makes a post request to an endpoint.
@@ -82,21 +498,45 @@ class Api:
             "Content-Type": "application/json",
             "Authorization": self.access_token,
         }
-        r = requests.post(self.base_url + endpoint, json=payload, headers=headers)
+        body = self._encode_json_body(payload, headers)
+        r = self._request("POST", endpoint, headers=headers, **body)
 
         if r.status_code == 200:
             return r.json()
         elif r.status_code == 204:
             return
-        else:
-            try:
-                error = r.json()["message"]
-            except ValueError:
-                error = r.text
-            if str(r.status_code).startswith("4"):
-                raise FastLabelInvalidException(error, r.status_code)
-            else:
-                raise FastLabelException(error, r.status_code)
+        self._raise_error(r)
+
+    def post_request_with_file(
+        self, endpoint: str, payload: dict, file_path: str, file_field: str = "file"
+    ):
+        """Makes a post request to an endpoint with a JSON body holding the file
+        at file_path as a base64 string in file_field, besides payload.
+        The file is read and encoded while it is sent, so the memory does not
+        grow with the file size. Responses are handled as post_request.
+        """
+        url = self.base_url + endpoint
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": self.access_token,
+        }
+
+        def send():
+            # Every attempt reads the file from the start.
+            with JSONFileReader(payload, file_path, file_field) as body:
+                attempt_headers = dict(headers)
+                data = self._encode_file_body(body, attempt_headers)
+                return self.transport.request(
+                    "POST", url, headers=attempt_headers, data=data
+                )
+
+        r = self._call_with_retry("POST", endpoint, send)
+
+        if r.status_code == 200:
+            return r.json()
+        elif r.status_code == 204:
+            return
+        self._raise_error(r)
 
     def put_request(self, endpoint, payload=None):
         """Makes a put request to an endpoint.
@@ -109,7 +549,8 @@ class Api:
             "Content-Type": "application/json",
             "Authorization": self.access_token,
         }
-        r = requests.put(self.base_url + endpoint, json=payload, headers=headers)
+        body = self._encode_json_body(payload, headers)
+        r = self._request("PUT", endpoint, headers=headers, **body)
 
         if r.status_code == 200:
             if not r.content:
@@ -117,20 +558,69 @@ class Api:
             return r.json()
         elif r.status_code == 204:
             return
-        else:
-            try:
-                error = r.json()["message"]
-            except ValueError:
-                error = r.text
-            if str(r.status_code).startswith("4"):
-                raise FastLabelInvalidException(error, r.status_code)
-            else:
-                raise FastLabelException(error, r.status_code)
+        self._raise_error(r)
 
     def upload_zipfile(
         self,
         url: str,
         file_path: str,
+        progress_callback: Optional[ProgressCallback] = None,
     ):
-        files = {"file": open(file_path, "rb")}
-        return requests.put(url, files=files)
+        """
+        Uploads a file to a signed URL as multipart/form-data.
+        The file is streamed from disk, so the memory does not grow with its size.
+        progress_callback is called with an UploadProgress while the body is
+        sent. It starts over from 0 when the upload is retried (Optional).
+        """
+
+        def send():
+            with MultipartFileReader(
+                file_path, progress_callback=progress_callback
+            ) as body:
+                response = self.transport.request(
+                    "PUT", url, data=body, headers={"Content-Type": body.content_type}
+                )
+                self._record_upload_stats(body.get_progress())
+                return response
+
+        # Signed URLs are retried with the default policy. PUT is idempotent.
+        return self._call_with_retry("PUT", "", send, rate_limited=False)
+
+    def get_upload_stats(self) -> Dict[str, float]:
+        """
+        Returns the totals of the file uploads sent by this client.
+        e.g.) {"uploads": 2, "bytes_sent": 2147483648, "elapsed": 120.5,
+               "throughput": 17821440.6}
+        throughput is the average bytes sent per second.
+        """
+        with self._stats_lock:
+            stats = dict(self._upload_stats)
+        stats["throughput"] = (
+            stats["bytes_sent"] / stats["elapsed"] if stats["elapsed"] > 0 else 0.0
+        )
+        return stats
+
+    def _record_upload_stats(self, progress: UploadProgress) -> None:
+        with self._stats_lock:
+            self._upload_stats["uploads"] += 1
+            self._upload_stats["bytes_sent"] += progress.bytes_sent
+            self._upload_stats["elapsed"] += progress.elapsed
+
+
+class ProjectingApi:
+    """Stands in for Api inside Client methods, so that their GET requests
+    returning lists are streamed and only keep the given fields.
+    Other requests are sent by the wrapped Api.
+    """
+
+    def __init__(self, api: Api, fields: List[str]):
+        self._api = api
+        self.fields = fields
+
+    def get_request(self, endpoint: str, params=None) -> list:
+        return list(
+            self._api.get_request_stream(endpoint, params=params, fields=self.fields)
+        )
+
+    def __getattr__(self, name):
+        return getattr(self._api, name)
@@ -0,0 +1,678 @@
+import asyncio
+import functools
+import time
+from typing import Callable, Dict, List, Optional, Union
+
+from fastlabel.api import Api
+from fastlabel.exceptions import FastLabelInvalidException
+from fastlabel.metrics import RequestRecord
+from fastlabel.rate_limit import DEFAULT_MAX_CONCURRENCY, RateLimiter
+from fastlabel.transport import HTTPXTransport
+from fastlabel.upload import JSONFileReader, MultipartFileReader, ProgressCallback
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - depends on the installed extras
+    httpx = None
+
+DEFAULT_MAX_CONNECTIONS = 100
+
+# Arguments of Api that AsyncApi does not support: requests are always sent by
+# httpx.AsyncClient, and GET responses are not cached.
+_UNSUPPORTED_API_ARGUMENTS = ("transport", "http_cache")
+
+
+def check_dependencies() -> None:
+    if httpx is None:
+        raise FastLabelInvalidException(
+            "httpx is required for AsyncClient. "
+            "Install it with: pip install fastlabel[async]",
+            422,
+        )
+
+
+class AsyncApi(Api):
+    """Asynchronous counterpart of Api built on httpx.AsyncClient.
+
+    Shares the configuration of Api (base url, access token, retry policies and
+    rate limiter). The request methods are coroutines.
+    """
+
+    def __init__(
+        self,
+        access_token: Optional[str] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ):
+        """
+        max_connections is the max number of connections open at once.
+        Requests beyond it wait for a free connection (Optional).
+        timeout is the timeout in seconds of a single request.
+        None means no timeout like Api (Optional).
+        Other keyword arguments are passed to Api, except transport and
+        http_cache which are not supported. Unless rate_limiter is given, the
+        default RateLimiter allows max_connections requests in flight, or its
+        own default if that is larger.
+        """
+        check_dependencies()
+        for name in _UNSUPPORTED_API_ARGUMENTS:
+            if name in kwargs:
+                raise FastLabelInvalidException(
+                    f"{name} is not supported by AsyncClient. Use Client.", 422
+                )
+        rate_limiter = kwargs.get("rate_limiter")
+        if rate_limiter is None or rate_limiter is True:
+            kwargs["rate_limiter"] = RateLimiter(
+                max_concurrency=max(DEFAULT_MAX_CONCURRENCY, max_connections)
+            )
+        # Requests are sent by httpx.AsyncClient. The transport only
+        # classifies the network errors of httpx for the retry policies, so
+        # the same rules apply as for Api.
+        transport = HTTPXTransport(
+            http2=False, max_connections=max_connections, timeout=timeout
+        )
+        super().__init__(access_token=access_token, transport=transport, **kwargs)
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self._client = None
+        self._slot_condition = None
+
+    @property
+    def client(self) -> "httpx.AsyncClient":
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                timeout=self.timeout,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _acquire(self) -> None:
+        if self._slot_condition is None:
+            self._slot_condition = asyncio.Condition()
+        async with self._slot_condition:
+            while not self.rate_limiter.try_acquire():
+                await self._slot_condition.wait()
+        delay = self.rate_limiter.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _release(self, status_code: Optional[int], latency: float) -> None:
+        self.rate_limiter.release(status_code, latency)
+        async with self._slot_condition:
+            self._slot_condition.notify_all()
+
+    async def _send_limited(self, send: Callable, rate_limited: bool):
+        if not rate_limited or self.rate_limiter is None:
+            return await send()
+        await self._acquire()
+        started_at = time.monotonic()
+        status_code = None
+        try:
+            response = await send()
+            status_code = response.status_code
+            return response
+        finally:
+            await self._release(status_code, time.monotonic() - started_at)
+
+    async def _call_with_retry(
+        self,
+        method: str,
+        endpoint: str,
+        send: Callable,
+        rate_limited: bool = True,
+    ):
+        endpoint_class = self._get_endpoint_class(endpoint)
+        policy = self.retry_policies[endpoint_class]
+        self._record_retry_stats(endpoint_class, "calls")
+        started_at = time.monotonic()
+        retry = 0
+
+        async def measured_send():
+            nonlocal sent_at
+            sent_at = time.monotonic()
+            return await send()
+
+        while True:
+            error = None
+            response = None
+            sent_at = None
+            try:
+                try:
+                    response = await self._send_limited(measured_send, rate_limited)
+                finally:
+                    self._record_metrics(method, endpoint, retry, sent_at, response)
+            except (*self.transport.connect_errors, *self.transport.errors) as e:
+                connected = not self.transport.is_connect_error(e)
+                if not policy.is_retryable_error(method, connected=connected):
+                    raise
+                error = e
+            else:
+                if not policy.is_retryable_status(method, response.status_code):
+                    return response
+
+            delay = self._get_retry_delay(
+                policy, endpoint_class, method, endpoint, retry, started_at, response
+            )
+            if delay is None:
+                if error is not None:
+                    raise error
+                return response
+            await asyncio.sleep(delay)
+            retry += 1
+
+    async def _request(self, method: str, endpoint: str, **kwargs):
+        url = self.base_url + endpoint
+        if "data" in kwargs:
+            # httpx takes raw bytes as content
+            kwargs["content"] = kwargs.pop("data")
+        if kwargs.get("params"):
+            # requests drops None values while httpx sends them as empty strings
+            kwargs["params"] = {
+                key: value
+                for key, value in kwargs["params"].items()
+                if value is not None
+            }
+        return await self._call_with_retry(
+            method, endpoint, lambda: self.client.request(method, url, **kwargs)
+        )
+
+    def _headers(self) -> dict:
+        return {
+            "Content-Type": "application/json",
+            "Authorization": self.access_token,
+        }
+
+    async def get_request(self, endpoint: str, params=None) -> Union[dict, list]:
+        r = await self._request(
+            "GET", endpoint, headers=self._headers(), params=params or {}
+        )
+        if r.status_code == 200:
+            return r.json()
+        self._raise_error(r)
+
+    async def delete_request(self, endpoint: str, params=None, payload=None) -> dict:
+        r = await self._request(
+            "DELETE",
+            endpoint,
+            headers=self._headers(),
+            params=params or {},
+            json=payload,
+        )
+        if r.status_code == 200 or r.status_code == 204:
+            return
+        self._raise_error(r)
+
+    async def post_request(self, endpoint, payload=None):
+        headers = self._headers()
+        body = self._encode_json_body(payload or {}, headers)
+        r = await self._request("POST", endpoint, headers=headers, **body)
+        if r.status_code == 200:
+            return r.json()
+        elif r.status_code == 204:
+            return
+        self._raise_error(r)
+
+    async def post_request_with_file(
+        self, endpoint: str, payload: dict, file_path: str, file_field: str = "file"
+    ):
+        url = self.base_url + endpoint
+
+        async def send():
+            with JSONFileReader(payload, file_path, file_field) as body:
+                headers = self._headers()
+                data = self._encode_file_body(body, headers)
+                if data is body:
+                    headers["Content-Length"] = str(len(body))
+                    chunks = iter(lambda: body.read(body.chunk_size), b"")
+                else:
+                    chunks = data
+
+                async def content():
+                    # Files are read and compressed off the event loop.
+                    while chunk := await asyncio.to_thread(next, chunks, b""):
+                        yield chunk
+
+                return await self.client.post(url, content=content(), headers=headers)
+
+        r = await self._call_with_retry("POST", endpoint, send)
+        if r.status_code == 200:
+            return r.json()
+        elif r.status_code == 204:
+            return
+        self._raise_error(r)
+
+    async def put_request(self, endpoint, payload=None):
+        headers = self._headers()
+        body = self._encode_json_body(payload or {}, headers)
+        r = await self._request("PUT", endpoint, headers=headers, **body)
+        if r.status_code == 200:
+            if not r.content:
+                return
+            return r.json()
+        elif r.status_code == 204:
+            return
+        self._raise_error(r)
+
+    async def upload_zipfile(
+        self,
+        url: str,
+        file_path: str,
+        progress_callback: Optional[ProgressCallback] = None,
+    ):
+        async def send():
+            with MultipartFileReader(
+                file_path, progress_callback=progress_callback
+            ) as body:
+
+                async def content():
+                    while chunk := await asyncio.to_thread(body.read, body.chunk_size):
+                        yield chunk
+
+                headers = {
+                    "Content-Type": body.content_type,
+                    "Content-Length": str(len(body)),
+                }
+                response = await self.client.put(
+                    url, content=content(), headers=headers
+                )
+                self._record_upload_stats(body.get_progress())
+                return response
+
+        return await self._call_with_retry("PUT", "", send, rate_limited=False)
+
+
+class _CapturedRequest(Exception):
+    def __init__(self, method: str, endpoint: str, kwargs: dict):
+        self.method = method
+        self.endpoint = endpoint
+        self.kwargs = kwargs
+
+    async def send(self, api: AsyncApi):
+        return await getattr(api, self.method)(self.endpoint, **self.kwargs)
+
+
+class _RequestRecorder:
+    """Stands in for Api inside Client methods.
+
+    Raises the request a method is about to send instead of sending it, so that
+    AsyncClient reuses the parameter building and validation of Client.
+    """
+
+    def get_request(self, endpoint, params=None):
+        raise _CapturedRequest("get_request", endpoint, {"params": params})
+
+    def delete_request(self, endpoint, params=None, payload=None):
+        raise _CapturedRequest(
+            "delete_request", endpoint, {"params": params, "payload": payload}
+        )
+
+    def post_request(self, endpoint, payload=None):
+        raise _CapturedRequest("post_request", endpoint, {"payload": payload})
+
+    def put_request(self, endpoint, payload=None):
+        raise _CapturedRequest("put_request", endpoint, {"payload": payload})
+
+    def post_request_with_file(self, endpoint, payload, file_path, file_field="file"):
+        raise _CapturedRequest(
+            "post_request_with_file",
+            endpoint,
+            {"payload": payload, "file_path": file_path, "file_field": file_field},
+        )
+
+
+class _BlockingApi:
+    """Blocking facade of an AsyncApi for Client methods sending several
+    requests. Must be called from a worker thread, never from the event loop.
+    """
+
+    def __init__(self, api: AsyncApi, loop: asyncio.AbstractEventLoop):
+        self._api = api
+        self._loop = loop
+
+    def __getattr__(self, name):
+        coroutine_function = getattr(self._api, name)
+
+        def call(*args, **kwargs):
+            return asyncio.run_coroutine_threadsafe(
+                coroutine_function(*args, **kwargs), self._loop
+            ).result()
+
+        return call
+
+
+# Client methods sending exactly one request. Their body only builds the request,
+# so AsyncClient captures it and sends it on the event loop.
+_SINGLE_REQUEST_METHODS = [
+    "find_image_task",
+    "find_image_classification_task",
+    "find_multi_image_classification_task",
+    "find_sequential_image_task",
+    "find_video_task",
+    "find_video_classification_task",
+    "find_text_task",
+    "find_text_classification_task",
+    "find_audio_task",
+    "find_audio_classification_task",
+    "find_multi_modal_video_audio_task",
+    "find_dicom_task",
+    "find_pcd_task",
+    "find_sequential_pcd_task",
+    "find_robotics_task",
+    "find_history",
+    "count_tasks",
+    "get_image_tasks",
+    "get_image_classification_tasks",
+    "get_multi_image_classification_tasks",
+    "get_sequential_image_tasks",
+    "get_video_tasks",
+    "get_video_classification_tasks",
+    "get_text_tasks",
+    "get_text_classification_tasks",
+    "get_audio_tasks",
+    "get_audio_classification_tasks",
+    "get_multi_modal_video_audio_tasks",
+    "get_pcd_tasks",
+    "get_sequential_pcd_tasks",
+    "get_task_id_name_map",
+    "get_dicom_tasks",
+    "get_robotics_tasks",
+    "get_appendix_data",
+    "get_task_appendix_data",
+    "create_image_task",
+    "create_integrated_image_task",
+    "create_image_classification_task",
+    "create_integrated_image_classification_task",
+    "create_multi_image_classification_task",
+    "create_sequential_image_task",
+    "create_video_task",
+    "create_video_classification_task",
+    "create_text_task",
+    "create_text_classification_task",
+    "create_audio_task",
+    "create_audio_classification_task",
+    "create_pcd_task",
+    "create_sequential_pcd_task",
+    "create_robotics_task",
+    "update_task",
+    "update_image_task",
+    "update_image_classification_task",
+    "update_multi_image_classification_task",
+    "update_sequential_image_task",
+    "update_video_task",
+    "update_video_classification_task",
+    "update_text_task",
+    "update_text_classification_task",
+    "update_audio_task",
+    "update_audio_classification_task",
+    "update_pcd_task",
+    "update_sequential_pcd_task",
+    "update_dicom_task",
+    "update_robotics_task",
+    "delete_task",
+    "delete_task_annotations",
+    "find_integrated_image_task_by_prefix",
+    "find_integrated_video_task_by_prefix",
+    "find_integrated_audio_task_by_prefix",
+    "find_annotation",
+    "get_annotations",
+    "create_annotation",
+    "create_classification_annotation",
+    "update_annotation",
+    "update_classification_annotation",
+    "delete_annotation",
+    "get_metadatas",
+    "find_project",
+    "get_projects",
+    "get_project_id_slug_map",
+    "create_project",
+    "update_project",
+    "delete_project",
+    "copy_project",
+    "update_project_metadata",
+    "update_project_user_permission",
+    "get_tags",
+    "delete_tags",
+    "find_dataset",
+    "get_datasets",
+    "create_dataset",
+    "update_dataset",
+    "delete_dataset",
+    "find_dataset_object",
+    "get_dataset_objects",
+    "create_dataset_object",
+    "update_dataset_object",
+    "delete_dataset_object",
+    "update_aws_s3_storage",
+    "create_task_from_aws_s3",
+    "get_aws_s3_import_status_by_project",
+    "get_training_jobs",
+    "execute_training_job",
+    "find_training_job",
+    "get_evaluation_jobs",
+    "find_evaluation_job",
+    "execute_evaluation_job",
+    "get_auto_annotation_jobs",
+    "execute_auto_annotation_job",
+    "execute_endpoint",
+    "create_model_monitoring_request_results",
+    "get_histories",
+    "get_task_comments",
+    "create_task_comment",
+    "update_task_comment",
+    "delete_task_comment",
+    "get_project_comments",
+    "get_workspace_users",
+    "create_workspace_user",
+    "update_workspace_user",
+    "delete_workspace_user",
+]
+
+# Client methods returning the first item of a list, e.g. find_*_by_name.
+_FIND_FIRST_METHODS = {
+    "find_image_task_by_name": ("get_image_tasks", "task_name"),
+    "find_image_classification_task_by_name": (
+        "get_image_classification_tasks",
+        "task_name",
+    ),
+    "find_multi_image_classification_task_by_name": (
+        "get_multi_image_classification_tasks",
+        "task_name",
+    ),
+    "find_sequential_image_task_by_name": ("get_sequential_image_tasks", "task_name"),
+    "find_video_task_by_name": ("get_video_tasks", "task_name"),
+    "find_video_classification_task_by_name": (
+        "get_video_classification_tasks",
+        "task_name",
+    ),
+    "find_text_task_by_name": ("get_text_tasks", "task_name"),
+    "find_text_classification_task_by_name": (
+        "get_text_classification_tasks",
+        "task_name",
+    ),
+    "find_audio_task_by_name": ("get_audio_tasks", "task_name"),
+    "find_audio_classification_task_by_name": (
+        "get_audio_classification_tasks",
+        "task_name",
+    ),
+    "find_dicom_task_by_name": ("get_dicom_tasks", "task_name"),
+    "find_pcd_task_by_name": ("get_pcd_tasks", "task_name"),
+    "find_sequential_pcd_task_by_name": ("get_sequential_pcd_tasks", "task_name"),
+    "find_robotics_task_by_name": ("get_robotics_tasks", "task_name"),
+    "find_annotation_by_value": ("get_annotations", "value"),
+}
+
+# Client methods sending several dependent requests (signed URL upload, one
+# request per module). They run in a worker thread and send their requests on
+# the event loop.
+_MULTI_REQUEST_METHODS = [
+    "create_dicom_task",
+    "import_appendix_file",
+    "import_robotics_contents_file",
+    "create_workspace_user_module_permissions",
+    "delete_workspace_user_module_permissions",
+    "get_annotation_schema",
+]
+
+
+def _get_client_class():
+    from fastlabel import Client
+
+    return Client
+
+
+class AsyncClient:
+    """Asynchronous client with the same methods as Client.
+
+    Every method is a coroutine, so a single event loop can keep hundreds of
+    requests in flight. Converters and exports are not included; use Client.
+
+    Requires: pip install fastlabel[async]
+    """
+
+    def __init__(self, access_token: Optional[str] = None, **kwargs):
+        """
+        access_token is your FastLabel API key. Falls back to the
+        FASTLABEL_ACCESS_TOKEN environment variable (Optional).
+        Other keyword arguments are passed to AsyncApi,
+        e.g. max_connections, timeout, retry_policy and rate_limiter (Optional).
+        """
+        self.api = AsyncApi(access_token=access_token, **kwargs)
+        client_class = _get_client_class()
+        self._builder = client_class.__new__(client_class)
+        self._builder.api = _RequestRecorder()
+
+    async def aclose(self) -> None:
+        """
+        Close the connections held by this client.
+        """
+        await self.api.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    def metrics(self) -> Dict[str, dict]:
+        """
+        Returns the request counters per endpoint. Same as Client.metrics.
+        """
+        return self.api.metrics.snapshot()
+
+    def add_metrics_hook(self, hook: Callable[[RequestRecord], None]) -> None:
+        """
+        Adds a function called with a RequestRecord after every request.
+        """
+        self.api.metrics.add_hook(hook)
+
+    async def _send_captured(
+        self, method_name: str, run_in_thread: bool, /, *args, **kwargs
+    ):
+        # Positional-only, so that methods taking name= can be mirrored.
+        build = getattr(self._builder, method_name)
+        try:
+            if run_in_thread:
+                # create_* methods read and encode files, keep the loop responsive.
+                result = await asyncio.to_thread(build, *args, **kwargs)
+            else:
+                result = build(*args, **kwargs)
+        except _CapturedRequest as request:
+            return await request.send(self.api)
+        return result
+
+    async def _run_blocking(self, method_name: str, /, *args, **kwargs):
+        client_class = _get_client_class()
+        client = client_class.__new__(client_class)
+        client.api = _BlockingApi(self.api, asyncio.get_running_loop())
+        return await asyncio.to_thread(getattr(client, method_name), *args, **kwargs)
+
+    async def _find_first(self, getter: str, key: str, project: str, value: str):
+        items = await getattr(self, getter)(project=project, **{key: value})
+        if not items:
+            return None
+        return items[0]
+
+    async def find_project_by_slug(self, slug: str) -> Optional[dict]:
+        """
+        Find a project by slug.
+
+        slug is slug of your project (Required).
+        """
+        projects = await self.get_projects(slug=slug)
+        if not projects:
+            return None
+        return projects[0]
+
+    async def gather(self, *coroutines, limit: Optional[int] = None) -> List:
+        """
+        Runs coroutines concurrently and returns their results in order.
+        limit is the max number of coroutines running at once (Optional).
+        """
+        if limit is None:
+            return await asyncio.gather(*coroutines)
+        semaphore = asyncio.Semaphore(limit)
+
+        async def run(coroutine):
+            async with semaphore:
+                return await coroutine
+
+        return await asyncio.gather(*(run(c) for c in coroutines))
+
+
+def _make_single_request_method(name: str):
+    client_method = getattr(_get_client_class(), name)
+    run_in_thread = name.startswith("create_")
+
+    @functools.wraps(client_method)
+    async def method(self, *args, **kwargs):
+        return await self._send_captured(name, run_in_thread, *args, **kwargs)
+
+    return method
+
+
+def _make_find_first_method(name: str, getter: str, key: str):
+    client_method = getattr(_get_client_class(), name)
+
+    @functools.wraps(client_method)
+    async def method(self, project: str, *args, **kwargs):
+        value = args[0] if args else kwargs[key]
+        index = args[1] if len(args) > 1 else kwargs.get("index")
+        if index is not None:
+            # find_*_task_by_name with a TaskIndex finds the task by id
+            task_id = index.get_id(value)
+            find_by_id = getattr(self, name[: -len("_by_name")])
+            return await find_by_id(task_id) if task_id else None
+        return await self._find_first(getter, key, project, value)
+
+    return method
+
+
+def _make_multi_request_method(name: str):
+    client_method = getattr(_get_client_class(), name)
+
+    @functools.wraps(client_method)
+    async def method(self, *args, **kwargs):
+        return await self._run_blocking(name, *args, **kwargs)
+
+    return method
+
+
+def _install_methods() -> None:
+    for name in _SINGLE_REQUEST_METHODS:
+        setattr(AsyncClient, name, _make_single_request_method(name))
+    for name, (getter, key) in _FIND_FIRST_METHODS.items():
+        setattr(AsyncClient, name, _make_find_first_method(name, getter, key))
+    for name in _MULTI_REQUEST_METHODS:
+        setattr(AsyncClient, name, _make_multi_request_method(name))
+
+
+_install_methods()
@@ -0,0 +1,104 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+DEFAULT_CACHE_TTL = 300
+DEFAULT_CACHE_MAX_SIZE = 1024
+
+
+class TTLCache:
+    """In-memory cache of metadata responses such as projects and datasets,
+    shared by every thread of a client.
+
+    Entries expire ttl seconds after they were stored. When the cache holds
+    max_size entries, the least recently used one is dropped.
+    Keys are tuples whose first item is the kind of the entry,
+    e.g. ("project", project_id), so that every entry of a kind can be
+    invalidated at once.
+    Values are copied when read, so callers can modify them freely.
+    A value loaded while an invalidation happened is returned but not stored,
+    so a load racing with an update never caches the data before the update.
+
+    ttl is the seconds an entry is kept.
+    max_size is the max number of entries.
+    """
+
+    def __init__(
+        self, ttl: float = DEFAULT_CACHE_TTL, max_size: int = DEFAULT_CACHE_MAX_SIZE
+    ):
+        if ttl <= 0 or max_size < 1:
+            raise ValueError("ttl and max_size must be positive.")
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        # Incremented by every invalidation.
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get_or_load(self, key: Tuple[Hashable, ...], load: Callable[[], Any]) -> Any:
+        """
+        Returns the cached value of key, or calls load and caches its result.
+        None and empty results are not cached, so that missing resources are
+        looked up again once created.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return copy.deepcopy(entry[1])
+            self._misses += 1
+            version = self._version
+        # Loaded outside the lock so that a slow request does not block the
+        # other threads. Two threads may load the same key at once.
+        value = load()
+        if value is None or (isinstance(value, (list, dict)) and not value):
+            return value
+        with self._lock:
+            if self._version != version:
+                # Invalidated while loading: the value may be stale.
+                return value
+            self._entries[key] = (time.monotonic() + self.ttl, copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, key: Tuple[Hashable, ...]) -> None:
+        with self._lock:
+            self._version += 1
+            self._entries.pop(key, None)
+
+    def invalidate_kind(self, kind: str) -> None:
+        """
+        Drops every entry whose key starts with kind.
+        """
+        with self._lock:
+            self._version += 1
+            for key in [key for key in self._entries if key[0] == kind]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Returns the number of entries, hits and misses.
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+            }
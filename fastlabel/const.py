@@ -228,6 +228,25 @@ SUPPORTED_FOURCC = ["avc1", "h264"]
 
 SUPPORTED_INFERENCE_IMAGE_SIZE = 6 * math.pow(1024, 2)
 
+# Max number of tasks returned at once by get_{kind}_tasks of each task kind.
+TASK_PAGE_LIMITS = {
+    "image": 1000,
+    "image_classification": 1000,
+    "multi_image_classification": 1000,
+    "sequential_image": 10,
+    "video": 10,
+    "video_classification": 1000,
+    "text": 1000,
+    "text_classification": 1000,
+    "audio": 1000,
+    "audio_classification": 1000,
+    "multi_modal_video_audio": 10,
+    "pcd": 1000,
+    "sequential_pcd": 10,
+    "dicom": 1000,
+    "robotics": 100,
+}
+
 AttributeValue = Union[str, List[str], float, List[float]]
 
 
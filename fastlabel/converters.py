@@ -23,7 +23,11 @@ from fastlabel.utils import is_video_project_type
 
 
 def to_coco(
-    project_type: str, tasks: list, output_dir: str, annotations: list = []
+    project_type: str,
+    tasks: list,
+    output_dir: str,
+    annotations: list = [],
+    session: Optional[requests.Session] = None,
 ) -> dict:
     # Get categories
     categories = __get_coco_categories(tasks, annotations)
@@ -36,7 +40,7 @@ def to_coco(
     for task in tasks:
         if is_video_project_type(project_type):
             image_file_names = _export_image_files_for_video_task(
-                task, str((Path(output_dir) / "images").resolve())
+                task, str((Path(output_dir) / "images").resolve()), session=session
             )
             task_images = _generate_coco_images(
                 image_file_names=image_file_names,
@@ -475,9 +479,20 @@ def __serialize(value: any) -> any:
 # YOLO
 
 
-def to_yolo(project_type: str, tasks: list, classes: list, output_dir: str) -> tuple:
+def to_yolo(
+    project_type: str,
+    tasks: list,
+    classes: list,
+    output_dir: str,
+    session: Optional[requests.Session] = None,
+) -> tuple:
     if len(classes) == 0:
-        coco = to_coco(project_type=project_type, tasks=tasks, output_dir=output_dir)
+        coco = to_coco(
+            project_type=project_type,
+            tasks=tasks,
+            output_dir=output_dir,
+            session=session,
+        )
         return __coco2yolo(project_type, coco)
     else:
         return __to_yolo(
@@ -485,6 +500,7 @@ def to_yolo(project_type: str, tasks: list, classes: list, output_dir: str) -> t
             tasks=tasks,
             classes=classes,
             output_dir=output_dir,
+            session=session,
         )
 
 
@@ -576,7 +592,13 @@ def __coco2yolo_segmentation(
     return objs
 
 
-def __to_yolo(project_type: str, tasks: list, classes: list, output_dir: str) -> tuple:
+def __to_yolo(
+    project_type: str,
+    tasks: list,
+    classes: list,
+    output_dir: str,
+    session: Optional[requests.Session] = None,
+) -> tuple:
     annos = []
     for task in tasks:
         if task["height"] == 0 or task["width"] == 0:
@@ -584,7 +606,7 @@ def __to_yolo(project_type: str, tasks: list, classes: list, output_dir: str) ->
 
         if is_video_project_type(project_type):
             image_file_names = _export_image_files_for_video_task(
-                task, str((Path(output_dir) / "images").resolve())
+                task, str((Path(output_dir) / "images").resolve()), session=session
             )
 
             def get_annotation_points(anno, index):
@@ -720,12 +742,17 @@ def _truncate(n, decimals=0) -> float:
 # Pascal VOC
 
 
-def to_pascalvoc(project_type: str, tasks: list, output_dir: str) -> list:
+def to_pascalvoc(
+    project_type: str,
+    tasks: list,
+    output_dir: str,
+    session: Optional[requests.Session] = None,
+) -> list:
     pascalvoc = []
     for task in tasks:
         if is_video_project_type(project_type):
             image_file_names = _export_image_files_for_video_task(
-                task, str((Path(output_dir) / "images").resolve())
+                task, str((Path(output_dir) / "images").resolve()), session=session
             )
 
             def get_annotation_points(anno, index):
@@ -1289,8 +1316,17 @@ def VideoCapture(*args, **kwds):
         videoCapture.release()
 
 
-def _download_file(url: str, output_file_path: str, chunk_size: int = 8192) -> str:
-    with requests.get(url, stream=True) as stream:
+def _download_file(
+    url: str,
+    output_file_path: str,
+    chunk_size: int = 8192,
+    session: Optional[requests.Session] = None,
+) -> str:
+    """
+    Download url to output_file_path in chunks.
+    Pass the client's pooled session to reuse its keep-alive connections.
+    """
+    with (session or requests).get(url, stream=True) as stream:
         stream.raise_for_status()
         with open(file=output_file_path, mode="wb") as file:
             for chunk in stream.iter_content(chunk_size=chunk_size):
@@ -1330,10 +1366,14 @@ def _export_image_files_for_video_file(
     return image_file_names
 
 
-def _export_image_files_for_video_task(video_task: dict, output_dir_path: str):
+def _export_image_files_for_video_task(
+    video_task: dict,
+    output_dir_path: str,
+    session: Optional[requests.Session] = None,
+):
     with NamedTemporaryFile(prefix="fastlabel-sdk-") as video_file:
         video_file_path = _download_file(
-            url=video_task["url"], output_file_path=video_file.name
+            url=video_task["url"], output_file_path=video_file.name, session=session
         )
         return _export_image_files_for_video_file(
             file_path=video_file_path,
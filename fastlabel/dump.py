@@ -0,0 +1,256 @@
+import glob
+import json
+import logging
+import os
+import time
+from typing import Callable, Dict, List, Optional
+
+from fastlabel.exceptions import FastLabelInvalidException
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_DUMP_FORMATS = ("jsonl", "parquet")
+
+
+def check_dependencies() -> None:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise FastLabelInvalidException(
+            "pyarrow is required for Parquet. "
+            "Install it with: pip install fastlabel[parquet]",
+            422,
+        )
+
+
+class DumpState:
+    """Progress of a dump saved next to its output after every page.
+
+    The state holds the offset of the next page and the position of the
+    writer after the last completed page, so that a stopped dump resumes
+    from there.
+    """
+
+    def __init__(self, path: str):
+        self.path = path.rstrip("/\\") + ".state.json"
+
+    def load(self) -> Optional[dict]:
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def save(self, state: dict) -> None:
+        # Written to a temporary file first so that a crash never leaves a
+        # truncated state file.
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def remove(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class JSONLWriter:
+    """Appends tasks to a JSON Lines file, one task per line.
+    The position is the size of the file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    def open(self, position: int = 0) -> None:
+        """
+        Opens the file and drops everything after position, i.e. the lines of
+        a page that was not completed.
+        """
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        mode = "r+b" if position and os.path.exists(self.path) else "wb"
+        self._file = open(self.path, mode)
+        self._file.truncate(position)
+        self._file.seek(position)
+
+    def write(self, tasks: List[dict]) -> int:
+        """
+        Writes a page and returns the number of bytes written.
+        The page is on disk when this returns.
+        """
+        data = "".join(
+            json.dumps(task, ensure_ascii=False) + "\n" for task in tasks
+        ).encode("utf-8")
+        self._file.write(data)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return len(data)
+
+    @property
+    def position(self) -> int:
+        return self._file.tell()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+# Column of the Parquet parts holding the keys missing from the first part.
+PARQUET_EXTRA_COLUMN = "_extra"
+
+
+def _to_parquet_value(value) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value, ensure_ascii=False)
+
+
+class ParquetWriter:
+    """Writes each page as a Parquet file in a directory
+    (part-000000.parquet, part-000001.parquet, ...), which can be read
+    together as a dataset.
+    Every part has the same schema, so pages with missing or null values can
+    be read together. The top level keys of the first page are columns, and
+    keys first found in later pages are stored as a JSON object in the
+    _extra column. Every column is a string: strings are stored as is, and
+    other values such as numbers and annotations are stored as JSON, because
+    their type differs between tasks. The position is the number of the next
+    part.
+    """
+
+    def __init__(self, path: str):
+        check_dependencies()
+        self.path = path
+        self._position = 0
+        self._columns: Optional[List[str]] = None
+
+    def open(self, position: int = 0) -> None:
+        """
+        Removes the parts from position, i.e. the parts of a previous dump
+        that are not completed in the current state.
+        """
+        import pyarrow.parquet as pq
+
+        os.makedirs(self.path, exist_ok=True)
+        for part_path in glob.glob(os.path.join(self.path, "part-*.parquet")):
+            part = os.path.basename(part_path)[len("part-") : -len(".parquet")]
+            if not part.isdigit() or int(part) >= position:
+                os.remove(part_path)
+        self._position = position
+        self._columns = None
+        first_path = os.path.join(self.path, "part-000000.parquet")
+        if position > 0 and os.path.exists(first_path):
+            # Resumed parts keep the columns of the parts already written.
+            self._columns = [
+                name
+                for name in pq.read_schema(first_path).names
+                if name != PARQUET_EXTRA_COLUMN
+            ]
+
+    def write(self, tasks: List[dict]) -> int:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self._columns is None:
+            self._columns = list(
+                dict.fromkeys(
+                    key for task in tasks for key in task if key != PARQUET_EXTRA_COLUMN
+                )
+            )
+        columns = set(self._columns)
+        schema = pa.schema(
+            [(column, pa.string()) for column in self._columns]
+            + [(PARQUET_EXTRA_COLUMN, pa.string())]
+        )
+        rows = []
+        for task in tasks:
+            row = {
+                column: _to_parquet_value(task.get(column)) for column in self._columns
+            }
+            extra = {key: value for key, value in task.items() if key not in columns}
+            row[PARQUET_EXTRA_COLUMN] = _to_parquet_value(extra or None)
+            rows.append(row)
+        part_path = os.path.join(self.path, f"part-{self._position:06d}.parquet")
+        # Renamed once written so that a part is never half written.
+        tmp_path = part_path + ".tmp"
+        pq.write_table(pa.Table.from_pylist(rows, schema=schema), tmp_path)
+        os.replace(tmp_path, part_path)
+        self._position += 1
+        return os.path.getsize(part_path)
+
+    @property
+    def position(self) -> int:
+        return self._position
+
+    def close(self) -> None:
+        pass
+
+
+def get_writer(format: str, path: str):
+    if format == "jsonl":
+        return JSONLWriter(path)
+    if format == "parquet":
+        return ParquetWriter(path)
+    raise FastLabelInvalidException(
+        "Format must be one of " + ", ".join(SUPPORTED_DUMP_FORMATS) + ".", 422
+    )
+
+
+def dump_pages(
+    get_page: Callable[[int, int], list],
+    writer,
+    page_size: int,
+    key: dict,
+    resume: bool = True,
+) -> Dict[str, float]:
+    """
+    Writes the pages returned by get_page(offset, limit) one by one until a
+    page is not full, and returns the throughput of the dump.
+    key identifies the dump (project, kind, filters and format). A saved state
+    is only resumed when its key is the same.
+    The state is removed once the dump completes.
+    """
+    state = DumpState(writer.path)
+    saved = state.load() if resume else None
+    if saved is not None and saved.get("key") != key:
+        logger.info("Ignoring the state of a different dump: %s", state.path)
+        saved = None
+    offset = saved["offset"] if saved else 0
+    if saved:
+        logger.info("Resuming the dump to %s from offset %d.", writer.path, offset)
+
+    stats = {"tasks": 0, "pages": 0, "bytes": 0, "offset": offset}
+    started_at = time.monotonic()
+    writer.open(saved["position"] if saved else 0)
+    try:
+        while True:
+            page = get_page(offset, page_size)
+            if page:
+                stats["bytes"] += writer.write(page)
+            offset += len(page)
+            stats["tasks"] += len(page)
+            stats["pages"] += 1
+            stats["offset"] = offset
+            state.save({"key": key, "offset": offset, "position": writer.position})
+            elapsed = time.monotonic() - started_at
+            logger.info(
+                "Dumped %d tasks to %s (%.1f tasks/s, %.2f MB/s).",
+                stats["tasks"],
+                writer.path,
+                stats["tasks"] / elapsed if elapsed > 0 else 0.0,
+                stats["bytes"] / elapsed / 1024 / 1024 if elapsed > 0 else 0.0,
+            )
+            if len(page) < page_size:
+                break
+    finally:
+        writer.close()
+    state.remove()
+
+    elapsed = time.monotonic() - started_at
+    stats["elapsed"] = elapsed
+    stats["tasks_per_second"] = stats["tasks"] / elapsed if elapsed > 0 else 0.0
+    stats["bytes_per_second"] = stats["bytes"] / elapsed if elapsed > 0 else 0.0
+    return stats
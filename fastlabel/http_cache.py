@@ -0,0 +1,160 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional
+
+DEFAULT_HTTP_CACHE_MAX_SIZE = 256 * 1024 * 1024
+
+_SUFFIX = ".cache"
+
+
+class CachedResponse(NamedTuple):
+    """Body of a GET response with its validators.
+
+    etag is the ETag header, or None.
+    last_modified is the Last-Modified header, or None.
+    """
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: bytes
+
+
+class HTTPCache:
+    """Disk cache of GET responses revalidated with conditional requests.
+
+    Responses with an ETag or Last-Modified header are stored. The next GET of
+    the same URL sends If-None-Match and If-Modified-Since, and the stored body
+    is used when the server answers 304 Not Modified, so an unchanged resource
+    costs no body transfer.
+    When the files exceed max_size bytes, the least recently used ones are
+    removed.
+
+    directory is the directory of the cache files. It is created if it does
+    not exist, and can be shared by the processes of the same user.
+    max_size is the max total size in bytes of the cache files.
+    """
+
+    def __init__(self, directory: str, max_size: int = DEFAULT_HTTP_CACHE_MAX_SIZE):
+        if max_size < 1:
+            raise ValueError("max_size must be greater than or equal to 1.")
+        self.directory = os.path.expanduser(directory)
+        self.max_size = max_size
+        self._sizes: Optional["OrderedDict[str, int]"] = None
+        self._total_size = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(url: str, params: Optional[dict], authorization: str) -> str:
+        """
+        Returns the key of a GET request. The access token is part of the key,
+        so responses are never shared between tokens.
+        """
+        data = json.dumps(
+            [url, params or {}, authorization], sort_keys=True, default=str
+        )
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Returns the stored response of a key, or None.
+        """
+        path = self._get_path(key)
+        try:
+            with open(path, "rb") as f:
+                header = json.loads(f.readline())
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        with self._lock:
+            sizes = self._load_sizes()
+            if key in sizes:
+                sizes.move_to_end(key)
+        try:
+            # The modification time orders the entries when a process loads them.
+            os.utime(path)
+        except OSError:
+            pass
+        return CachedResponse(header.get("etag"), header.get("lastModified"), body)
+
+    def store(
+        self,
+        key: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        body: bytes,
+    ) -> None:
+        """
+        Stores a response, and removes the least recently used responses when
+        the cache is full. Responses without validators are not stored.
+        """
+        if etag is None and last_modified is None:
+            return
+        header = json.dumps({"etag": etag, "lastModified": last_modified})
+        data = header.encode("utf-8") + b"\n" + body
+        if len(data) > self.max_size:
+            return
+        path = self._get_path(key)
+        with self._lock:
+            sizes = self._load_sizes()
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            self._total_size += len(data) - sizes.pop(key, 0)
+            sizes[key] = len(data)
+            while self._total_size > self.max_size:
+                evicted, size = sizes.popitem(last=False)
+                self._total_size -= size
+                try:
+                    os.remove(self._get_path(evicted))
+                except OSError:
+                    pass
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            sizes = self._load_sizes()
+            self._total_size -= sizes.pop(key, 0)
+            try:
+                os.remove(self._get_path(key))
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in self._load_sizes():
+                try:
+                    os.remove(self._get_path(key))
+                except OSError:
+                    pass
+            self._sizes = OrderedDict()
+            self._total_size = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Returns the number of stored responses and their total size in bytes.
+        """
+        with self._lock:
+            return {"entries": len(self._load_sizes()), "bytes": self._total_size}
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + _SUFFIX)
+
+    def _load_sizes(self) -> "OrderedDict[str, int]":
+        # Loaded on first use, from the least to the most recently used.
+        if self._sizes is None:
+            os.makedirs(self.directory, exist_ok=True)
+            entries = []
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.endswith(_SUFFIX):
+                        stat = entry.stat()
+                        entries.append(
+                            (stat.st_mtime, entry.name[: -len(_SUFFIX)], stat.st_size)
+                        )
+            entries.sort()
+            self._sizes = OrderedDict((key, size) for _, key, size in entries)
+            self._total_size = sum(self._sizes.values())
+        return self._sizes
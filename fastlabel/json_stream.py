@@ -0,0 +1,280 @@
+import codecs
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+_STRUCTURAL = re.compile(r'[\[\]{}"]')
+_STRING_SPECIAL = re.compile(r'[\\"]')
+_SCALAR_END = re.compile(r"[\s,\]]")
+_WHITESPACE = re.compile(r"\s*")
+_MEMBER_SCALAR_END = re.compile(r"[\s,\]}]")
+
+_decoder = json.JSONDecoder()
+
+_START = 0
+_VALUE_OR_END = 1
+_VALUE = 2
+_IN_VALUE = 3
+_COMMA_OR_END = 4
+_DONE = 5
+
+
+class JSONArrayScanner:
+    """Incremental parser of a top level JSON array.
+
+    Text is fed in arbitrary pieces. Each item is decoded with json.loads as
+    soon as its last character is received, so at most one item is held as
+    text at a time. The pieces of an incomplete item are kept in a list and
+    joined once, so a large item costs linear time.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0
+        self._state = _START
+        # Pieces of the current item received by the previous calls of feed.
+        self._parts: List[str] = []
+        self._item_start = 0
+        self._item_is_scalar = False
+        self._scan_pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, text: str) -> List[Any]:
+        """
+        Adds text and returns the items completed by it.
+        """
+        if self._state == _IN_VALUE:
+            # The current item continues at the start of text.
+            self._buffer = text
+            self._item_start = 0
+            self._scan_pos = 0
+        else:
+            self._buffer = self._buffer[self._pos :] + text
+        self._pos = 0
+        items = []
+        while True:
+            if self._state == _IN_VALUE:
+                end = self._scan_item()
+                if end is None:
+                    self._parts.append(self._buffer[self._item_start :])
+                    self._pos = len(self._buffer)
+                    break
+                self._parts.append(self._buffer[self._item_start : end])
+                items.append(self._decode("".join(self._parts)))
+                self._parts = []
+                self._pos = end
+                self._state = _COMMA_OR_END
+                continue
+
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos >= len(self._buffer):
+                break
+            char = self._buffer[self._pos]
+            if self._state == _START:
+                if char != "[":
+                    raise ValueError("Response is not a JSON array.")
+                self._pos += 1
+                self._state = _VALUE_OR_END
+            elif self._state == _COMMA_OR_END:
+                if char == ",":
+                    self._state = _VALUE
+                elif char == "]":
+                    self._state = _DONE
+                else:
+                    raise ValueError(f"Unexpected {char!r} in JSON array.")
+                self._pos += 1
+            elif self._state == _VALUE_OR_END and char == "]":
+                self._pos += 1
+                self._state = _DONE
+            elif self._state == _DONE:
+                raise ValueError("Unexpected data after JSON array.")
+            else:
+                self._state = _IN_VALUE
+                self._item_start = self._pos
+                self._item_is_scalar = char not in '[{"'
+                self._scan_pos = self._pos
+                self._depth = 0
+                self._in_string = False
+                self._escaped = False
+        return items
+
+    def close(self) -> None:
+        """
+        Checks that the whole array has been received.
+        """
+        if self._state != _DONE:
+            raise ValueError("JSON array is incomplete.")
+
+    def _decode(self, text: str) -> Any:
+        return json.loads(text)
+
+    def _scan_item(self) -> Optional[int]:
+        """
+        Returns the end index of the current item in the buffer, or None when
+        more text is needed. The scan resumes where it stopped on the next
+        call of feed.
+        """
+        buffer = self._buffer
+        i = self._scan_pos
+        if self._item_is_scalar:
+            match = _SCALAR_END.search(buffer, i)
+            return None if match is None else match.start()
+
+        while True:
+            if self._in_string:
+                if self._escaped:
+                    if i >= len(buffer):
+                        return None
+                    self._escaped = False
+                    i += 1
+                match = _STRING_SPECIAL.search(buffer, i)
+                if match is None:
+                    return None
+                i = match.end()
+                if match.group() == "\\":
+                    self._escaped = True
+                    continue
+                self._in_string = False
+                if self._depth == 0:
+                    return i
+                continue
+
+            match = _STRUCTURAL.search(buffer, i)
+            if match is None:
+                return None
+            char = match.group()
+            i = match.end()
+            if char == '"':
+                self._in_string = True
+            elif char in "[{":
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    return i
+
+
+def parse_fields(fields: Iterable[str]) -> Dict[str, Optional[dict]]:
+    """
+    Returns the tree of a list of dotted field paths.
+    e.g.) ["id", "annotations.value"] -> {"id": None, "annotations": {"value": None}}
+    A path also covering its parent keeps the whole parent.
+    """
+    tree = {}
+    for field in fields:
+        node = tree
+        keys = field.split(".")
+        for i, key in enumerate(keys):
+            if i == len(keys) - 1:
+                node[key] = None
+                break
+            if key in node and node[key] is None:
+                break
+            node = node.setdefault(key, {})
+    return tree
+
+
+def _skip_value(text: str, pos: int) -> int:
+    """
+    Returns the end index of the JSON value starting at pos without decoding it.
+    """
+    char = text[pos]
+    if char == '"':
+        i = pos + 1
+        while True:
+            match = _STRING_SPECIAL.search(text, i)
+            if match.group() == "\\":
+                i = match.end() + 1
+                continue
+            return match.end()
+    if char not in "[{":
+        return _MEMBER_SCALAR_END.search(text, pos).start()
+    depth = 0
+    i = pos
+    while True:
+        match = _STRUCTURAL.search(text, i)
+        char = match.group()
+        i = match.end()
+        if char == '"':
+            i = _skip_value(text, match.start())
+        elif char in "[{":
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return i
+
+
+def _project(text: str, pos: int, tree: dict):
+    """
+    Decodes the JSON value starting at pos keeping only the keys of tree in its
+    objects, and returns it with its end index. The values of the other keys
+    are skipped without being decoded.
+    """
+    char = text[pos]
+    if char == "{":
+        value = {}
+        pos = _WHITESPACE.match(text, pos + 1).end()
+        if text[pos] == "}":
+            return value, pos + 1
+        while True:
+            key, pos = json.decoder.scanstring(text, pos + 1)
+            pos = _WHITESPACE.match(text, pos).end() + 1  # ':'
+            pos = _WHITESPACE.match(text, pos).end()
+            if key not in tree:
+                pos = _skip_value(text, pos)
+            elif tree[key] is None:
+                value[key], pos = _decoder.raw_decode(text, pos)
+            else:
+                value[key], pos = _project(text, pos, tree[key])
+            pos = _WHITESPACE.match(text, pos).end()
+            if text[pos] == "}":
+                return value, pos + 1
+            pos = _WHITESPACE.match(text, pos + 1).end()  # ','
+    if char == "[":
+        value = []
+        pos = _WHITESPACE.match(text, pos + 1).end()
+        if text[pos] == "]":
+            return value, pos + 1
+        while True:
+            item, pos = _project(text, pos, tree)
+            value.append(item)
+            pos = _WHITESPACE.match(text, pos).end()
+            if text[pos] == "]":
+                return value, pos + 1
+            pos = _WHITESPACE.match(text, pos + 1).end()  # ','
+    return _decoder.raw_decode(text, pos)
+
+
+class ProjectingScanner(JSONArrayScanner):
+    """JSONArrayScanner keeping only some fields of the items.
+
+    The values of the other fields are skipped in the text and never decoded,
+    so large nested arrays such as annotation points cost no Python objects.
+    fields are dotted paths. Lists are projected item by item.
+        e.g.) ["id", "name", "status", "annotations.value"]
+    """
+
+    def __init__(self, fields: Iterable[str]):
+        super().__init__()
+        self.fields = parse_fields(fields)
+
+    def _decode(self, text: str) -> Any:
+        return _project(text, 0, self.fields)[0]
+
+
+def iter_json_array(
+    chunks: Iterable[bytes], scanner: Optional[JSONArrayScanner] = None
+) -> Iterator[Any]:
+    """
+    Yields the items of a JSON array encoded in UTF-8 as the chunks arrive.
+    """
+    scanner = scanner or JSONArrayScanner()
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for chunk in chunks:
+        if chunk:
+            yield from scanner.feed(decoder.decode(chunk))
+    yield from scanner.feed(decoder.decode(b"", final=True))
+    scanner.close()
@@ -0,0 +1,230 @@
+import logging
+import re
+import threading
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds in seconds of the latency histogram buckets.
+# The last bucket holds every latency above the largest bound.
+DEFAULT_LATENCY_BUCKETS = (
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+# Endpoint recorded for uploads to signed URLs, which are not API endpoints.
+SIGNED_URL_ENDPOINT = "<signed url>"
+
+_ID_SEGMENT = re.compile(
+    r"^(?:[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+    r"|\d+)$"
+)
+
+
+class RequestRecord(NamedTuple):
+    """A request sent by Api, passed to metrics hooks.
+
+    endpoint is the endpoint with ids replaced by {id}.
+    status_code is None when no response was received.
+    latency is the seconds from sending the request to receiving the response
+    headers, excluding the wait of the rate limiter.
+    retry is the number of the attempt, 0 for the first one.
+    """
+
+    method: str
+    endpoint: str
+    status_code: Optional[int]
+    latency: float
+    bytes_sent: int
+    bytes_received: int
+    retry: int
+
+
+MetricsHook = Callable[[RequestRecord], None]
+
+
+def normalize_endpoint(endpoint: str) -> str:
+    """
+    Replaces the ids in an endpoint with {id} so that requests to the same
+    endpoint are aggregated together.
+    e.g.) tasks/image/123e4567-e89b-12d3-a456-426614174000 -> tasks/image/{id}
+    """
+    if not endpoint:
+        return SIGNED_URL_ENDPOINT
+    path = endpoint.split("?", 1)[0]
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/")
+    )
+
+
+class Metrics:
+    """Per endpoint counters of the requests sent by Api.
+
+    Every attempt of a request is recorded, including retries. Counters are
+    shared by every thread of a client.
+
+    latency_buckets are the upper bounds in seconds of the latency histogram.
+    """
+
+    def __init__(self, latency_buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        self.latency_buckets = tuple(sorted(latency_buckets))
+        self._endpoints = {}
+        self._hooks = []
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook: MetricsHook) -> None:
+        """
+        Adds a function called with a RequestRecord after every request, e.g. to
+        push the metrics to your own collector.
+        Hooks are called in the thread that sent the request, so they must be
+        fast. Errors raised by hooks are logged and ignored, so that a broken
+        collector never fails a request the server has already processed.
+        """
+        with self._lock:
+            self._hooks.append(hook)
+
+    def remove_hook(self, hook: MetricsHook) -> None:
+        with self._lock:
+            self._hooks.remove(hook)
+
+    def record(self, record: RequestRecord) -> None:
+        key = f"{record.method} {record.endpoint}"
+        with self._lock:
+            stats = self._endpoints.get(key)
+            if stats is None:
+                stats = self._endpoints[key] = {
+                    "count": 0,
+                    "errors": 0,
+                    "retries": 0,
+                    "status_codes": {},
+                    "latency_sum": 0.0,
+                    "latency_max": 0.0,
+                    "latency_histogram": [0] * (len(self.latency_buckets) + 1),
+                    "bytes_sent": 0,
+                    "bytes_received": 0,
+                }
+            stats["count"] += 1
+            if record.retry > 0:
+                stats["retries"] += 1
+            if record.status_code is None:
+                stats["errors"] += 1
+            else:
+                status_codes = stats["status_codes"]
+                status_codes[record.status_code] = (
+                    status_codes.get(record.status_code, 0) + 1
+                )
+            stats["latency_sum"] += record.latency
+            stats["latency_max"] = max(stats["latency_max"], record.latency)
+            stats["latency_histogram"][self._get_bucket(record.latency)] += 1
+            stats["bytes_sent"] += record.bytes_sent
+            stats["bytes_received"] += record.bytes_received
+            hooks = list(self._hooks)
+        for hook in hooks:
+            try:
+                hook(record)
+            except Exception:
+                logger.exception("Metrics hook %r failed.", hook)
+
+    def snapshot(self) -> Dict[str, dict]:
+        """
+        Returns a copy of the counters per "METHOD endpoint".
+        e.g.) {
+                "GET tasks/image": {
+                    "count": 120,
+                    "errors": 0,
+                    "retries": 2,
+                    "status_codes": {200: 118, 503: 2},
+                    "latency_sum": 30.5,
+                    "latency_max": 1.2,
+                    "latency_mean": 0.25,
+                    "latency_p50": 0.25,
+                    "latency_p90": 0.5,
+                    "latency_p99": 1.0,
+                    "latency_histogram": [{"le": 0.01, "count": 0}, ...],
+                    "bytes_sent": 0,
+                    "bytes_received": 12345678,
+                }
+              }
+        The percentiles are the upper bounds of the histogram buckets holding
+        them. The last bucket of the histogram has the bound None.
+        """
+        with self._lock:
+            endpoints = {
+                key: {
+                    **stats,
+                    "status_codes": dict(stats["status_codes"]),
+                    "latency_histogram": list(stats["latency_histogram"]),
+                }
+                for key, stats in self._endpoints.items()
+            }
+        bounds = list(self.latency_buckets) + [None]
+        for stats in endpoints.values():
+            histogram = stats["latency_histogram"]
+            stats["latency_mean"] = stats["latency_sum"] / stats["count"]
+            for name, ratio in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99)):
+                stats["latency_" + name] = self._get_percentile(
+                    histogram, ratio, stats["latency_max"]
+                )
+            stats["latency_histogram"] = [
+                {"le": bound, "count": count} for bound, count in zip(bounds, histogram)
+            ]
+        return endpoints
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints = {}
+
+    def _get_bucket(self, latency: float) -> int:
+        for i, bound in enumerate(self.latency_buckets):
+            if latency <= bound:
+                return i
+        return len(self.latency_buckets)
+
+    def _get_percentile(
+        self, histogram: List[int], ratio: float, latency_max: float
+    ) -> float:
+        rank = ratio * sum(histogram)
+        seen = 0
+        for i, count in enumerate(histogram):
+            seen += count
+            if count and seen >= rank:
+                if i < len(self.latency_buckets):
+                    return min(self.latency_buckets[i], latency_max)
+                return latency_max
+        return latency_max
+
+
+def get_request_size(response) -> int:
+    """
+    Returns the size of the body of the request of a response.
+    Works with the responses of requests and httpx.
+    """
+    request = getattr(response, "request", None)
+    if request is None:
+        return 0
+    return int(request.headers.get("Content-Length") or 0)
+
+
+def get_response_size(response) -> int:
+    """
+    Returns the size of the body of a response as received, without reading
+    a streamed body.
+    """
+    length = response.headers.get("Content-Length")
+    if length is not None:
+        return int(length)
+    # requests keeps False until a streamed body is read
+    content = getattr(response, "_content", None)
+    if isinstance(content, bytes):
+        return len(content)
+    return 0
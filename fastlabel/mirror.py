@@ -0,0 +1,278 @@
+import json
+import os
+import sqlite3
+import time
+from typing import Dict, Iterable, List, Optional
+
+from fastlabel.exceptions import FastLabelInvalidException
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mirror (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    name TEXT,
+    status TEXT,
+    external_status TEXT,
+    updated_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tasks_name ON tasks (name);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status);
+CREATE TABLE IF NOT EXISTS task_tags (
+    task_id TEXT NOT NULL,
+    tag TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS task_tags_task_id ON task_tags (task_id);
+CREATE INDEX IF NOT EXISTS task_tags_tag ON task_tags (tag);
+CREATE TABLE IF NOT EXISTS annotations (
+    task_id TEXT NOT NULL,
+    value TEXT,
+    type TEXT,
+    area REAL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS annotations_task_id ON annotations (task_id);
+CREATE INDEX IF NOT EXISTS annotations_value ON annotations (value);
+"""
+
+
+def get_annotation_area(annotation: dict) -> Optional[float]:
+    """
+    Returns the area of a bbox or polygon annotation of an image, or None.
+    """
+    points = annotation.get("points")
+    if not isinstance(points, list) or not all(
+        isinstance(point, (int, float)) for point in points
+    ):
+        return None
+    type = annotation.get("type")
+    if type == "bbox" and len(points) == 4:
+        return abs(points[2] - points[0]) * abs(points[3] - points[1])
+    if type == "polygon" and len(points) >= 6 and len(points) % 2 == 0:
+        xs, ys = points[0::2], points[1::2]
+        # Shoelace formula
+        return (
+            abs(sum(xs[i] * ys[i - 1] - xs[i - 1] * ys[i] for i in range(len(xs)))) / 2
+        )
+    return None
+
+
+class ProjectMirror:
+    """Copy of the tasks and annotations of a project in a local SQLite file,
+    to filter and aggregate them without requests.
+
+    Refresh it with Client.refresh_project_mirror. Only tasks whose updatedAt
+    changed since the last refresh are written again, and tasks deleted in
+    the project are removed.
+
+    path is the path of the SQLite file. It is created if it does not exist.
+    project is slug of the project.
+    kind is the kind of the tasks, same as Client.iter_tasks.
+    """
+
+    def __init__(self, path: str, project: str, kind: str):
+        self.path = path
+        self.project = project
+        self.kind = kind
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(_SCHEMA)
+        key = {"project": project, "kind": kind}
+        saved = self._get_meta("key")
+        if saved is None:
+            with self._connection:
+                self._set_meta("key", key)
+        elif saved != key:
+            self.close()
+            raise FastLabelInvalidException(
+                f"{path} is a mirror of {saved['kind']} tasks of {saved['project']}.",
+                422,
+            )
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    @property
+    def refreshed_at(self) -> Optional[float]:
+        """UNIX time of the last completed refresh, or None."""
+        return self._get_meta("refreshedAt")
+
+    def sync(self, tasks: Iterable[dict]) -> Dict[str, int]:
+        """
+        Writes the tasks that are new or changed, and removes the tasks that
+        are not in tasks. tasks must be every task of the project.
+        Nothing is written if tasks raises.
+        Returns the number of tasks inserted, updated, deleted and unchanged.
+        """
+        stats = {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": 0}
+        with self._connection:
+            updated_at = dict(
+                self._connection.execute("SELECT id, updated_at FROM tasks")
+            )
+            seen = set()
+            for task in tasks:
+                task_id = task["id"]
+                if task_id in seen:
+                    continue
+                seen.add(task_id)
+                if task_id not in updated_at:
+                    stats["inserted"] += 1
+                elif updated_at[task_id] != task.get("updatedAt"):
+                    self._delete_task(task_id)
+                    stats["updated"] += 1
+                else:
+                    stats["unchanged"] += 1
+                    continue
+                self._insert_task(task)
+            for task_id in updated_at.keys() - seen:
+                self._delete_task(task_id)
+                stats["deleted"] += 1
+            self._set_meta("refreshedAt", time.time())
+        return stats
+
+    def get_tasks(
+        self,
+        status: str = None,
+        external_status: str = None,
+        tag: str = None,
+        value: str = None,
+        name: str = None,
+    ) -> List[dict]:
+        """
+        Returns the tasks matching every given condition, ordered by name.
+
+        status is the status of the tasks (Optional).
+        external_status is the external status of the tasks (Optional).
+        tag is a tag the tasks have (Optional).
+        value is the value of an annotation the tasks have (Optional).
+        name is a task name (Optional).
+        """
+        conditions, params = [], []
+        if status:
+            conditions.append("status = ?")
+            params.append(status)
+        if external_status:
+            conditions.append("external_status = ?")
+            params.append(external_status)
+        if name:
+            conditions.append("name = ?")
+            params.append(name)
+        if tag:
+            conditions.append("id IN (SELECT task_id FROM task_tags WHERE tag = ?)")
+            params.append(tag)
+        if value:
+            conditions.append("id IN (SELECT task_id FROM annotations WHERE value = ?)")
+            params.append(value)
+        sql = "SELECT data FROM tasks"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY name"
+        return [json.loads(data) for (data,) in self._connection.execute(sql, params)]
+
+    def count_tasks_by_status(self, external: bool = False) -> Dict[str, int]:
+        """
+        Returns the number of tasks per status.
+        external is whether to count by external status (Optional).
+        """
+        column = "external_status" if external else "status"
+        return dict(
+            self._connection.execute(
+                f"SELECT {column}, COUNT(*) FROM tasks GROUP BY {column}"
+            )
+        )
+
+    def get_annotation_stats(self) -> Dict[str, dict]:
+        """
+        Returns the number of annotations and their area (min, max and mean)
+        per annotation value. Areas are computed for image bbox and polygon
+        annotations, and are None for other types.
+        e.g.) {"cat": {"count": 10, "area_min": 120.0, "area_max": 4800.0,
+                       "area_mean": 1530.5}}
+        """
+        rows = self._connection.execute(
+            "SELECT value, COUNT(*), MIN(area), MAX(area), AVG(area)"
+            " FROM annotations GROUP BY value"
+        )
+        return {
+            value: {
+                "count": count,
+                "area_min": area_min,
+                "area_max": area_max,
+                "area_mean": area_mean,
+            }
+            for value, count, area_min, area_max, area_mean in rows
+        }
+
+    def execute(self, sql: str, params: tuple = ()) -> List[tuple]:
+        """
+        Runs a SQL query on the mirror and returns its rows, for queries not
+        covered by the other methods. The tables are tasks, task_tags and
+        annotations. data columns hold the objects as JSON.
+        """
+        return self._connection.execute(sql, params).fetchall()
+
+    def _insert_task(self, task: dict) -> None:
+        task_id = task["id"]
+        self._connection.execute(
+            "INSERT INTO tasks VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                task_id,
+                task.get("name"),
+                task.get("status"),
+                task.get("externalStatus"),
+                task.get("updatedAt"),
+                json.dumps(task, ensure_ascii=False),
+            ),
+        )
+        self._connection.executemany(
+            "INSERT INTO task_tags VALUES (?, ?)",
+            [(task_id, tag) for tag in task.get("tags") or []],
+        )
+        self._connection.executemany(
+            "INSERT INTO annotations VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    task_id,
+                    annotation.get("value"),
+                    annotation.get("type"),
+                    get_annotation_area(annotation),
+                    json.dumps(annotation, ensure_ascii=False),
+                )
+                for annotation in task.get("annotations") or []
+            ],
+        )
+
+    def _delete_task(self, task_id: str) -> None:
+        for table, column in (
+            ("tasks", "id"),
+            ("task_tags", "task_id"),
+            ("annotations", "task_id"),
+        ):
+            self._connection.execute(
+                f"DELETE FROM {table} WHERE {column} = ?", (task_id,)
+            )
+
+    def _get_meta(self, key: str):
+        row = self._connection.execute(
+            "SELECT value FROM mirror WHERE key = ?", (key,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _set_meta(self, key: str, value) -> None:
+        self._connection.execute(
+            "INSERT OR REPLACE INTO mirror VALUES (?, ?)", (key, json.dumps(value))
+        )
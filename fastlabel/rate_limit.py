@@ -0,0 +1,184 @@
+import threading
+import time
+from typing import Optional
+
+# API is allowed to call 10000 times per 10 minutes.
+DEFAULT_RATE = 10000 / 600
+DEFAULT_BURST = 10000
+DEFAULT_MAX_CONCURRENCY = 32
+
+# Status codes that mean the server is overloaded.
+CONGESTION_STATUS_CODES = frozenset([429, 503])
+
+
+class RateLimiter:
+    """Client side rate limiter shared by every thread of a client.
+
+    Requests take a token from a bucket refilled at rate tokens per second,
+    and a slot from an adaptive concurrency limit.
+    Both limits follow AIMD (additive increase, multiplicative decrease):
+    they are multiplied by decrease_factor when the server answers 429/503 or
+    when the latency rises above latency_tolerance times its baseline, and grow
+    back additively while responses are healthy.
+
+    rate is the max number of requests per second.
+    burst is the number of requests that can be sent at once after being idle.
+    max_concurrency is the max number of requests in flight.
+    min_rate and min_concurrency are the lower bounds when backing off.
+    rate_step is the number of requests per second added per second of
+        healthy responses.
+    decrease_factor is the factor applied to both limits on congestion.
+    latency_tolerance is the ratio of the smoothed latency to its baseline
+        that is treated as congestion. The baseline is shared by every
+        endpoint, so enable it only when the requests have similar sizes:
+        file uploads and large pages are slow without any congestion.
+        None, the default, disables latency based backoff.
+    cooldown is the min interval in seconds between two decreases, so that
+        a burst of 429s of requests sent together counts once.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        min_rate: float = 0.5,
+        min_concurrency: int = 1,
+        rate_step: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_tolerance: Optional[float] = None,
+        cooldown: float = 1.0,
+    ):
+        if rate <= 0 or burst < 1 or max_concurrency < 1:
+            raise ValueError("rate, burst and max_concurrency must be positive.")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1.")
+        self.max_rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.min_rate = min(min_rate, rate)
+        self.min_concurrency = min(min_concurrency, max_concurrency)
+        self.rate_step = rate_step
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.cooldown = cooldown
+
+        self._rate = float(rate)
+        self._window = float(max_concurrency)
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self._in_flight = 0
+        self._latency = None
+        self._baseline_latency = None
+        self._decreased_at = None
+        self._condition = threading.Condition()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @property
+    def concurrency(self) -> int:
+        return max(self.min_concurrency, int(self._window))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self) -> None:
+        """
+        Blocks until a concurrency slot and a token are available.
+        Call release once the response is received.
+        """
+        with self._condition:
+            while self._in_flight >= self.concurrency:
+                self._condition.wait()
+            self._in_flight += 1
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def try_acquire(self) -> bool:
+        """
+        Takes a concurrency slot without blocking. Returns False when every
+        slot is in use. Call reserve afterwards to respect the rate.
+        """
+        with self._condition:
+            if self._in_flight >= self.concurrency:
+                return False
+            self._in_flight += 1
+            return True
+
+    def reserve(self) -> float:
+        """
+        Takes a token and returns the seconds to wait before sending.
+        Tokens are reserved in order, so waiting callers are served first in
+        first out.
+        """
+        with self._condition:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._refilled_at) * self._rate
+            )
+            self._refilled_at = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def release(self, status_code: Optional[int] = None, latency: float = 0.0) -> None:
+        """
+        Frees the slot taken by acquire and adapts the limits.
+        status_code is None when no response was received.
+        """
+        with self._condition:
+            self._in_flight -= 1
+            self.record(status_code, latency)
+            self._condition.notify_all()
+
+    def record(self, status_code: Optional[int], latency: float) -> None:
+        """
+        Adapts the limits to a response without touching the concurrency slots.
+        """
+        with self._condition:
+            if status_code in CONGESTION_STATUS_CODES:
+                self._decrease(drop_burst=True)
+            elif status_code is not None and status_code < 500:
+                if self._is_latency_congested(latency):
+                    self._decrease(drop_burst=False)
+                else:
+                    self._increase()
+            self._condition.notify_all()
+
+    def _is_latency_congested(self, latency: float) -> bool:
+        if self.latency_tolerance is None or latency <= 0:
+            return False
+        if self._latency is None:
+            self._latency = latency
+            self._baseline_latency = latency
+            return False
+        self._latency = 0.8 * self._latency + 0.2 * latency
+        # The baseline follows the lowest smoothed latency and slowly forgets it,
+        # so that a permanent change of the network is eventually accepted.
+        self._baseline_latency = min(
+            self._latency, self._baseline_latency * 1.01 + 0.0001
+        )
+        return self._latency > self._baseline_latency * self.latency_tolerance
+
+    def _increase(self) -> None:
+        # Grows the window by about one slot per window of responses and the
+        # rate by about rate_step per second.
+        self._window = min(self.max_concurrency, self._window + 1 / self._window)
+        self._rate = min(self.max_rate, self._rate + self.rate_step / self._rate)
+
+    def _decrease(self, drop_burst: bool) -> None:
+        now = time.monotonic()
+        if self._decreased_at is not None and now - self._decreased_at < self.cooldown:
+            return
+        self._decreased_at = now
+        self._window = max(self.min_concurrency, self._window * self.decrease_factor)
+        self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+        if drop_burst:
+            # The server rejects requests: drop the saved burst so the new
+            # rate applies immediately. A slow response alone does not.
+            self._tokens = min(self._tokens, 1.0)
@@ -0,0 +1,85 @@
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import NamedTuple, Optional, Tuple
+
+# Methods that can be sent again without changing the result on the server.
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+
+# 429 means the request was rejected before it was processed,
+# so it is safe to send again whatever the method is.
+REJECTED_STATUS_CODES = frozenset([429])
+
+
+class RetryPolicy(NamedTuple):
+    """Retry settings for a class of endpoints.
+
+    max_retries is the max number of retries after the first attempt.
+    backoff_factor is the base delay in seconds. The n-th retry waits a random
+        time between 0 and backoff_factor * 2 ** n (full jitter).
+    max_backoff is the upper bound of a single delay in seconds.
+    max_elapsed is the upper bound in seconds of the whole call including every
+        attempt and delay. None means no limit.
+    status_forcelist is the status codes that are retried.
+    retry_writes allows retrying POST requests on any status of status_forcelist
+        and on connection errors. Set it only for endpoints that are safe to repeat.
+        Otherwise POST requests are only retried when they were rejected (429)
+        or the connection could not be established.
+    respect_retry_after makes the delay follow the Retry-After response header.
+    """
+
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    max_elapsed: Optional[float] = 120.0
+    status_forcelist: Tuple[int, ...] = (429, 500, 502, 503, 504)
+    retry_writes: bool = False
+    respect_retry_after: bool = True
+
+    def is_retryable_status(self, method: str, status_code: int) -> bool:
+        if status_code not in self.status_forcelist:
+            return False
+        if status_code in REJECTED_STATUS_CODES:
+            return True
+        return self.retry_writes or method.upper() in IDEMPOTENT_METHODS
+
+    def is_retryable_error(self, method: str, connected: bool) -> bool:
+        """
+        connected is whether the request may have reached the server.
+        """
+        if not connected:
+            return True
+        return self.retry_writes or method.upper() in IDEMPOTENT_METHODS
+
+    def get_backoff(self, retry: int) -> float:
+        """
+        Returns the delay before the retry-th retry (0 origin).
+        """
+        cap = min(self.max_backoff, self.backoff_factor * (2**retry))
+        return random.uniform(0, cap)
+
+    def get_delay(self, retry: int, retry_after: Optional[str] = None) -> float:
+        if self.respect_retry_after and retry_after:
+            seconds = parse_retry_after(retry_after)
+            if seconds is not None:
+                return seconds
+        return self.get_backoff(retry)
+
+
+def parse_retry_after(value: str) -> Optional[float]:
+    """
+    Returns seconds to wait from a Retry-After header value.
+    Both delay-seconds and HTTP-date forms are supported.
+    """
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
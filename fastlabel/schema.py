@@ -0,0 +1,137 @@
+import difflib
+import time
+from typing import Dict, List, Optional
+
+from fastlabel.exceptions import FastLabelInvalidException
+
+# Attribute types whose values must be one of their options.
+OPTION_ATTRIBUTE_TYPES = frozenset(["select", "radio", "checkbox"])
+
+
+def _format_unknown(kind: str, value, known) -> str:
+    message = f"Unknown {kind} '{value}'."
+    matches = difflib.get_close_matches(str(value), [str(k) for k in known], n=1)
+    if matches:
+        message += f" Did you mean '{matches[0]}'?"
+    return message
+
+
+class AnnotationSchema:
+    """Annotation definitions of a project held in memory, to validate task
+    annotations before they are sent.
+
+    Build it with Client.get_annotation_schema, which loads the definitions
+    once. Pass it to create_image_task and update_image_task as schema to
+    reject invalid annotations without a request.
+
+    project is slug of the project.
+    annotations is the list of annotations returned by get_annotations.
+    loaded_at is the UNIX time when the annotations were fetched from the API.
+    """
+
+    def __init__(
+        self,
+        project: str,
+        annotations: List[dict],
+        loaded_at: Optional[float] = None,
+    ):
+        self.project = project
+        self.loaded_at = time.time() if loaded_at is None else loaded_at
+        self._annotations: Dict[str, dict] = {
+            annotation["value"]: annotation for annotation in annotations
+        }
+
+    def __len__(self) -> int:
+        return len(self._annotations)
+
+    def __contains__(self, value: str) -> bool:
+        return value in self._annotations
+
+    def get_annotation(self, value: str) -> Optional[dict]:
+        """
+        Returns the definition of an annotation value, or None.
+        """
+        return self._annotations.get(value)
+
+    def get_age(self) -> float:
+        """
+        Returns the seconds since the annotations were fetched from the API.
+        """
+        return time.time() - self.loaded_at
+
+    def get_errors(self, annotations: List[dict]) -> List[str]:
+        """
+        Returns the problems of task annotations, or an empty list.
+        Checks the values, types, attribute keys, attribute option values and
+        keypoint keys.
+        """
+        errors = []
+        for i, annotation in enumerate(annotations):
+            prefix = f"annotations[{i}]: "
+            value = annotation.get("value")
+            definition = self._annotations.get(value)
+            if definition is None:
+                errors.append(
+                    prefix + _format_unknown("value", value, self._annotations)
+                )
+                continue
+            type = annotation.get("type")
+            if type is not None and type != definition["type"]:
+                errors.append(
+                    prefix + f"Type of '{value}' must be '{definition['type']}', "
+                    f"not '{type}'."
+                )
+            errors.extend(
+                prefix + error
+                for error in self._get_attribute_errors(
+                    annotation.get("attributes") or [],
+                    definition.get("attributes") or [],
+                )
+            )
+            known_keys = {
+                keypoint["key"] for keypoint in definition.get("keypoints") or []
+            }
+            for keypoint in annotation.get("keypoints") or []:
+                if keypoint.get("key") not in known_keys:
+                    errors.append(
+                        prefix
+                        + _format_unknown(
+                            "keypoint key", keypoint.get("key"), known_keys
+                        )
+                    )
+        return errors
+
+    def validate(self, annotations: List[dict]) -> None:
+        """
+        Raises FastLabelInvalidException listing the problems of task
+        annotations, if any.
+        """
+        errors = self.get_errors(annotations)
+        if errors:
+            raise FastLabelInvalidException(
+                "Invalid annotations: " + " ".join(errors), 422
+            )
+
+    def _get_attribute_errors(
+        self, attributes: List[dict], definitions: List[dict]
+    ) -> List[str]:
+        definitions = {definition["key"]: definition for definition in definitions}
+        errors = []
+        for attribute in attributes:
+            key = attribute.get("key")
+            definition = definitions.get(key)
+            if definition is None:
+                errors.append(_format_unknown("attribute key", key, definitions))
+                continue
+            if definition.get("type") not in OPTION_ATTRIBUTE_TYPES:
+                continue
+            options = {option["value"] for option in definition.get("options") or []}
+            values = attribute.get("value")
+            if not isinstance(values, list):
+                values = [values]
+            for value in values:
+                if value not in options and value not in (None, ""):
+                    errors.append(
+                        _format_unknown(f"value of attribute '{key}'", value, options)
+                    )
+        return errors
@@ -0,0 +1,110 @@
+import json
+import os
+import time
+from typing import Dict, Iterator, Optional
+
+
+class TaskIndex:
+    """Bidirectional map of the task ids and names of a project held in memory.
+
+    Build it with Client.get_task_index, which loads the whole map once and
+    can keep a copy on disk.
+
+    project is slug of the project.
+    id_to_name is a map of task ids and names.
+    loaded_at is the UNIX time when the map was fetched from the API.
+    """
+
+    def __init__(
+        self,
+        project: str,
+        id_to_name: Dict[str, str],
+        loaded_at: Optional[float] = None,
+    ):
+        self.project = project
+        self.loaded_at = time.time() if loaded_at is None else loaded_at
+        self._id_to_name = dict(id_to_name)
+        self._name_to_id = {name: task_id for task_id, name in id_to_name.items()}
+
+    def __len__(self) -> int:
+        return len(self._id_to_name)
+
+    def __contains__(self, task_name: str) -> bool:
+        return task_name in self._name_to_id
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._name_to_id)
+
+    def get_id(self, task_name: str) -> Optional[str]:
+        """
+        Returns the id of a task name, or None.
+        """
+        return self._name_to_id.get(task_name)
+
+    def get_name(self, task_id: str) -> Optional[str]:
+        """
+        Returns the name of a task id, or None.
+        """
+        return self._id_to_name.get(task_id)
+
+    def add(self, task_id: str, task_name: str) -> None:
+        """
+        Adds a task created after the index was loaded.
+        """
+        previous_name = self._id_to_name.get(task_id)
+        if previous_name is not None:
+            self._name_to_id.pop(previous_name, None)
+        self._id_to_name[task_id] = task_name
+        self._name_to_id[task_name] = task_id
+
+    def remove(self, task_id: str) -> None:
+        """
+        Removes a task deleted after the index was loaded.
+        """
+        task_name = self._id_to_name.pop(task_id, None)
+        if task_name is not None:
+            self._name_to_id.pop(task_name, None)
+
+    def get_age(self) -> float:
+        """
+        Returns the seconds since the map was fetched from the API.
+        """
+        return time.time() - self.loaded_at
+
+    def is_fresh(self, max_age: Optional[float]) -> bool:
+        """
+        Returns whether the map was fetched less than max_age seconds ago.
+        None means the map never expires.
+        """
+        return max_age is None or self.get_age() < max_age
+
+    def save(self, path: str) -> None:
+        """
+        Writes the index to a JSON file.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Written to a temporary file first so that a crash never leaves a
+        # truncated file.
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "project": self.project,
+                    "loadedAt": self.loaded_at,
+                    "tasks": self._id_to_name,
+                },
+                f,
+                ensure_ascii=False,
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "TaskIndex":
+        """
+        Reads an index written by save.
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data["project"], data["tasks"], loaded_at=data["loadedAt"])
@@ -0,0 +1,233 @@
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable, Iterator, Optional, Tuple, Type
+
+import requests
+from urllib3.exceptions import NewConnectionError
+
+from fastlabel.exceptions import FastLabelInvalidException
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - depends on the installed extras
+    httpx = None
+
+try:
+    import h2  # noqa: F401
+except ImportError:  # pragma: no cover - depends on the installed extras
+    h2 = None
+
+DEFAULT_MAX_CONNECTIONS = 10
+
+# Size of the chunks read from file-like request bodies.
+BODY_CHUNK_SIZE = 1024 * 1024
+
+
+class Transport(ABC):
+    """Sends the HTTP requests of Api.
+
+    Implementations return responses with the interface shared by requests and
+    httpx (status_code, headers, content, text, json(), close()), so that Api
+    maps the status codes to FastLabelException and FastLabelInvalidException
+    the same way whatever the transport.
+
+    connect_errors are the errors raised when the request was not sent,
+    which are safe to retry for every method.
+    errors are the other network errors, raised after the request may have
+    reached the server.
+    """
+
+    connect_errors: Tuple[Type[Exception], ...] = ()
+    errors: Tuple[Type[Exception], ...] = ()
+
+    @abstractmethod
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[dict] = None,
+        params: Optional[dict] = None,
+        json=None,
+        data=None,
+        stream: bool = False,
+    ):
+        """
+        Sends a request and returns its response.
+        data is bytes, a file-like object with read and __len__, or an
+        iterator of bytes sent chunked without Content-Length.
+        With stream, the body is read by iter_bytes instead of being loaded.
+        """
+
+    @abstractmethod
+    def iter_bytes(self, response, chunk_size: int) -> Iterator[bytes]:
+        """
+        Yields the body of a response sent with stream.
+        """
+
+    def read(self, response) -> None:
+        """
+        Loads the body of a response sent with stream, e.g. before reading an
+        error message from it.
+        """
+
+    def close(self) -> None:
+        """
+        Closes the connections held by the transport.
+        """
+
+    def is_connect_error(self, error: Exception) -> bool:
+        """
+        Returns whether a network error was raised before the request was sent.
+        """
+        return isinstance(error, self.connect_errors)
+
+
+class RequestsTransport(Transport):
+    """Transport on requests. This is the default of Api.
+
+    get_session returns the requests.Session sending the requests.
+    Api passes its pooled session, which is also used for file downloads.
+    """
+
+    connect_errors = (requests.exceptions.ConnectTimeout,)
+    errors = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+    def __init__(self, get_session: Callable[[], requests.Session]):
+        self.get_session = get_session
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[dict] = None,
+        params: Optional[dict] = None,
+        json=None,
+        data=None,
+        stream: bool = False,
+    ) -> requests.Response:
+        kwargs = {"headers": headers}
+        if params is not None:
+            kwargs["params"] = params
+        if json is not None:
+            kwargs["json"] = json
+        if data is not None:
+            kwargs["data"] = data
+        if stream:
+            kwargs["stream"] = True
+        return self.get_session().request(method, url, **kwargs)
+
+    def iter_bytes(self, response, chunk_size: int) -> Iterator[bytes]:
+        return response.iter_content(chunk_size=chunk_size)
+
+    def read(self, response) -> None:
+        # Reading content loads the body.
+        response.content
+
+    def is_connect_error(self, error: Exception) -> bool:
+        if super().is_connect_error(error):
+            return True
+        if not isinstance(error, requests.exceptions.ConnectionError):
+            return False
+        # Connection refused and DNS failures are raised as ConnectionError
+        # wrapping a NewConnectionError (NameResolutionError is a subclass),
+        # usually through a MaxRetryError of urllib3.
+        reason = error.args[0] if error.args else None
+        reason = getattr(reason, "reason", reason)
+        return isinstance(reason, NewConnectionError)
+
+
+def check_dependencies(http2: bool) -> None:
+    if httpx is None:
+        raise FastLabelInvalidException(
+            "httpx is required for HTTPXTransport. "
+            "Install it with: pip install fastlabel[async]",
+            422,
+        )
+    if http2 and h2 is None:
+        raise FastLabelInvalidException(
+            "h2 is required for HTTP/2. Install it with: pip install fastlabel[http2]",
+            422,
+        )
+
+
+class HTTPXTransport(Transport):
+    """Transport on httpx, which can multiplex concurrent requests over a few
+    HTTP/2 connections.
+
+    http2 is whether HTTP/2 is negotiated with the server. Requires the h2
+    package (Optional).
+    max_connections is the max number of connections open at once (Optional).
+    timeout is the timeout in seconds of a single request.
+    None means no timeout like requests (Optional).
+
+    Requires: pip install fastlabel[http2]
+    """
+
+    def __init__(
+        self,
+        http2: bool = True,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        timeout: Optional[float] = None,
+    ):
+        check_dependencies(http2)
+        self.http2 = http2
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.connect_errors = (httpx.ConnectError, httpx.ConnectTimeout)
+        self.errors = (httpx.TransportError,)
+        self._client = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def client(self) -> "httpx.Client":
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        http2=self.http2,
+                        limits=httpx.Limits(
+                            max_connections=self.max_connections,
+                            max_keepalive_connections=self.max_connections,
+                        ),
+                        timeout=self.timeout,
+                    )
+        return self._client
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[dict] = None,
+        params: Optional[dict] = None,
+        json=None,
+        data=None,
+        stream: bool = False,
+    ) -> "httpx.Response":
+        headers = dict(headers or {})
+        kwargs = {}
+        if params:
+            # requests drops None values while httpx sends them as empty strings
+            kwargs["params"] = {
+                key: value for key, value in params.items() if value is not None
+            }
+        if json is not None:
+            kwargs["json"] = json
+        if hasattr(data, "read"):
+            headers["Content-Length"] = str(len(data))
+            kwargs["content"] = iter(lambda: data.read(BODY_CHUNK_SIZE), b"")
+        elif data is not None:
+            kwargs["content"] = data
+        request = self.client.build_request(method, url, headers=headers, **kwargs)
+        return self.client.send(request, stream=stream)
+
+    def iter_bytes(self, response, chunk_size: int) -> Iterator[bytes]:
+        return response.iter_bytes(chunk_size=chunk_size)
+
+    def read(self, response) -> None:
+        response.read()
+
+    def close(self) -> None:
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
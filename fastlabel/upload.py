@@ -0,0 +1,433 @@
+import binascii
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterator, NamedTuple, Optional
+
+# Size of the chunks read from the file while uploading.
+DEFAULT_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+class UploadProgress(NamedTuple):
+    """Progress of a file upload passed to progress callbacks.
+
+    bytes_sent is the number of bytes of the request body sent so far.
+    total_bytes is the size of the request body.
+    elapsed is the seconds since the upload started.
+    """
+
+    bytes_sent: int
+    total_bytes: int
+    elapsed: float
+
+    @property
+    def throughput(self) -> float:
+        """Average bytes sent per second."""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.bytes_sent / self.elapsed
+
+    @property
+    def done(self) -> bool:
+        return self.bytes_sent >= self.total_bytes
+
+
+ProgressCallback = Callable[[UploadProgress], None]
+
+
+class ByteBudget:
+    """Upper bound of the bytes being sent at once by concurrent uploads.
+
+    Bodies are streamed, so this bounds the data on the wire rather than
+    the memory used.
+
+    acquire blocks until the bytes fit in max_bytes. A single item larger
+    than max_bytes is let through when nothing else is in flight, so that it
+    does not wait forever.
+
+    max_bytes is the max number of bytes in flight.
+    """
+
+    def __init__(self, max_bytes: int):
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be greater than or equal to 1.")
+        self.max_bytes = max_bytes
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self, size: int) -> None:
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._in_flight == 0 or self._in_flight + size <= self.max_bytes
+            )
+            self._in_flight += size
+
+    def release(self, size: int) -> None:
+        with self._condition:
+            self._in_flight -= size
+            self._condition.notify_all()
+
+
+# State files can be shared by the threads of a process.
+_state_lock = threading.Lock()
+
+
+def _quote_filename(file_name: str) -> str:
+    return file_name.replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+class MultipartFileReader:
+    """File-like multipart/form-data body holding a single file field.
+
+    The body is the same as the one requests builds for files={"file": f},
+    but the file is read from disk chunk by chunk while it is sent instead of
+    being loaded into memory. The length is known in advance, so the body is
+    sent with Content-Length.
+
+    progress_callback is called with an UploadProgress after each chunk.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        field_name: str = "file",
+        progress_callback: Optional[ProgressCallback] = None,
+        chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+    ):
+        self.file_path = file_path
+        self.boundary = binascii.hexlify(os.urandom(16)).decode("ascii")
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self.progress_callback = progress_callback
+        self.chunk_size = chunk_size
+        file_name = _quote_filename(os.path.basename(file_path))
+        self._head = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field_name}"; '
+            f'filename="{file_name}"\r\n\r\n'
+        ).encode("utf-8")
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("ascii")
+        self._file_size = os.path.getsize(file_path)
+        self._file = None
+        self._bytes_sent = 0
+        self._started_at = None
+
+    def __len__(self) -> int:
+        return len(self._head) + self._file_size + len(self._tail)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def bytes_sent(self) -> int:
+        return self._bytes_sent
+
+    def get_progress(self) -> UploadProgress:
+        elapsed = 0.0
+        if self._started_at is not None:
+            elapsed = time.monotonic() - self._started_at
+        return UploadProgress(self._bytes_sent, len(self), elapsed)
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Returns up to size bytes of the body, or an empty bytes at the end.
+        """
+        if self._started_at is None:
+            self._started_at = time.monotonic()
+            self._file = open(self.file_path, "rb")
+        if size is None or size < 0:
+            return b"".join(self.iter_chunks())
+        chunk = b""
+        position = self._bytes_sent
+        file_end = len(self._head) + self._file_size
+        if position < len(self._head):
+            chunk = self._head[position : position + size]
+        elif position < file_end:
+            chunk = self._file.read(min(size, file_end - position))
+            if not chunk:
+                raise IOError(f"{self.file_path} was truncated while uploading.")
+        else:
+            offset = position - file_end
+            chunk = self._tail[offset : offset + size]
+        self._bytes_sent += len(chunk)
+        if chunk and self.progress_callback is not None:
+            self.progress_callback(self.get_progress())
+        return chunk
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        while chunk := self.read(self.chunk_size):
+            yield chunk
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class JSONFileReader:
+    """File-like JSON body holding a file as a base64 string field.
+
+    The body is the same as json.dumps({field_name: base64 of the file,
+    **payload}), but the file is read and encoded chunk by chunk while it is
+    sent. Neither the file, its base64 string nor the whole JSON body is held
+    in memory, so the memory of an upload does not grow with the file size.
+    The length is known in advance, so the body is sent with Content-Length.
+    """
+
+    def __init__(
+        self,
+        payload: dict,
+        file_path: str,
+        field_name: str = "file",
+        chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+    ):
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        rest = json.dumps(payload, allow_nan=False)
+        self._head = ("{" + json.dumps(field_name) + ': "').encode("utf-8")
+        self._tail = ('"' + (", " + rest[1:] if payload else "}")).encode("utf-8")
+        self._file_size = os.path.getsize(file_path)
+        self._file = None
+        self._chunks = None
+        self._chunk = b""
+        self._offset = 0
+
+    def __len__(self) -> int:
+        encoded_size = (self._file_size + 2) // 3 * 4
+        return len(self._head) + encoded_size + len(self._tail)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Returns up to size bytes of the body, or an empty bytes at the end.
+        """
+        if self._chunks is None:
+            self._file = open(self.file_path, "rb")
+            self._chunks = self._iter_encoded()
+        if size is None or size < 0:
+            return b"".join(iter(lambda: self.read(self.chunk_size), b""))
+        while self._offset >= len(self._chunk):
+            self._chunk = next(self._chunks, b"")
+            self._offset = 0
+            if not self._chunk:
+                return b""
+        chunk = self._chunk[self._offset : self._offset + size]
+        self._offset += len(chunk)
+        return chunk
+
+    def _iter_encoded(self) -> Iterator[bytes]:
+        yield self._head
+        # Multiples of 3 bytes are encoded without padding, so the encoded
+        # chunks join into the base64 of the whole file.
+        raw_size = max(self.chunk_size // 4 * 3, 3)
+        while data := self._file.read(raw_size):
+            yield binascii.b2a_base64(data, newline=False)
+        yield self._tail
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+# Words of the error messages of the API for a missing or expired file key.
+_FILE_KEY_ERROR_WORDS = ("expired", "not found", "not exist", "no such")
+
+
+def is_file_key_error(error: Exception) -> bool:
+    """
+    Returns whether an error of a request with a file key says that the
+    uploaded file is missing or expired, so uploading it again may succeed.
+    """
+    code = getattr(error, "code", None)
+    if code in (404, 410):
+        return True
+    message = str(getattr(error, "message", error)).lower()
+    if "filekey" in message.replace(" ", "").replace("_", ""):
+        return True
+    return "file" in message and any(word in message for word in _FILE_KEY_ERROR_WORDS)
+
+
+class UploadState:
+    """Local record of the files uploaded to signed URLs, kept in a JSON file.
+
+    A file is recorded with its file key once its upload succeeds, and removed
+    once the request using the file key succeeds. When a process stops in
+    between, the next run reuses the file key instead of uploading the file
+    again. Files are identified by their path, size and modification time, so
+    a modified file is uploaded again.
+    """
+
+    def __init__(self, state_path: str):
+        self.state_path = state_path
+
+    @staticmethod
+    def get_file_id(project: str, file_path: str) -> str:
+        stat = os.stat(file_path)
+        return ":".join(
+            [
+                project,
+                os.path.abspath(file_path),
+                str(stat.st_size),
+                str(stat.st_mtime_ns),
+            ]
+        )
+
+    def get_file_key(self, project: str, file_path: str) -> Optional[str]:
+        """
+        Returns the file key of an uploaded file, or None.
+        """
+        with _state_lock:
+            entry = self._load().get(self.get_file_id(project, file_path))
+        return entry["fileKey"] if entry else None
+
+    def save(self, project: str, file_path: str, file_key: str) -> None:
+        with _state_lock:
+            state = self._load()
+            state[self.get_file_id(project, file_path)] = {
+                "fileKey": file_key,
+                "uploadedAt": time.time(),
+            }
+            self._dump(state)
+
+    def remove(self, project: str, file_path: str) -> None:
+        with _state_lock:
+            state = self._load()
+            if state.pop(self.get_file_id(project, file_path), None) is not None:
+                self._dump(state)
+
+    def _load(self) -> dict:
+        if not os.path.exists(self.state_path):
+            return {}
+        with open(self.state_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def _dump(self, state: dict) -> None:
+        # Written to a temporary file first so that a crash never leaves a
+        # truncated state file.
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+
+def get_file_hash(file_path: str, chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE) -> str:
+    """
+    Returns the SHA-256 hex digest of a file, read chunk by chunk.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ImportJournal:
+    """Append-only record of the items created by a bulk import, kept in a
+    JSON Lines file, so that an import stopped midway can be resumed.
+
+    An item is recorded with its key, the SHA-256 of its file and the id of
+    the created resource once it succeeds. The journal is read into memory
+    when opened, so looking up an item costs no request. A recorded item is
+    skipped while its file is unchanged: the size and modification time are
+    compared first, and the file is hashed only when they differ.
+    Lines are only appended, so a crash loses at most the line being written,
+    which is ignored when the journal is read.
+
+    journal_path is a path to the journal file. It is created if it does not
+    exist.
+    """
+
+    def __init__(self, journal_path: str):
+        self.journal_path = journal_path
+        self._entries: Dict[str, dict] = {}
+        self._file = None
+        self._lock = threading.Lock()
+        # Whether the last line lacks its newline, after a crash while writing.
+        self._truncated = False
+        if os.path.exists(journal_path):
+            with open(journal_path, encoding="utf-8") as f:
+                for line in f:
+                    self._truncated = not line.endswith("\n")
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    self._entries[entry["key"]] = entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def get_id(self, key: str, file_path: str) -> Optional[str]:
+        """
+        Returns the id recorded for key if file_path is unchanged, or None.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        try:
+            stat = os.stat(file_path)
+            if stat.st_size != entry["size"]:
+                return None
+            if stat.st_mtime_ns != entry["mtime"]:
+                if get_file_hash(file_path) != entry["hash"]:
+                    return None
+        except OSError:
+            return None
+        return entry["id"]
+
+    def record(self, key: str, file_path: str, id: str) -> None:
+        """
+        Appends a created item to the journal.
+        """
+        stat = os.stat(file_path)
+        entry = {
+            "key": key,
+            "hash": get_file_hash(file_path),
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "id": id,
+            "createdAt": time.time(),
+        }
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            if self._file is None:
+                directory = os.path.dirname(self.journal_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._file = open(self.journal_path, "a", encoding="utf-8")
+                if self._truncated:
+                    self._file.write("\n")
+                    self._truncated = False
+            self._file.write(line)
+            # Flushed per line so that the entry survives a crash of the process.
+            self._file.flush()
+            self._entries[key] = entry
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -182,6 +182,22 @@ def get_json_length(value) -> int:
     return len(json_str)
 
 
+def get_base64_length(size: int) -> int:
+    """
+    Returns the length of the base64 string of size bytes.
+    """
+    return (size + 2) // 3 * 4
+
+
+def get_content_json_length(name: str, file_size: int) -> int:
+    """
+    Returns get_json_length({"name": name, "file": base64 of the file}) from
+    the file size, without encoding the file.
+    """
+    # len('{"name": , "file": ""}') is 22
+    return 22 + len(json.dumps(name)) + get_base64_length(file_size)
+
+
 def get_video_fourcc(video_path: str) -> str:
     cap = cv2.VideoCapture(video_path)
     fourcc_code = int(cap.get(cv2.CAP_PROP_FOURCC))
@@ -0,0 +1,739 @@
+"""Tests for the HTTP layer in fastlabel.api.
+
+Requests are served by a fake session so no real connection is made.
+"""
+
+import base64
+import gzip
+import io
+import json
+import threading
+import zlib
+
+import pytest
+import requests
+from urllib3.exceptions import MaxRetryError, NameResolutionError, NewConnectionError
+
+import fastlabel
+from fastlabel import retry
+from fastlabel.api import Api
+from fastlabel.exceptions import FastLabelException, FastLabelInvalidException
+from fastlabel.http_cache import HTTPCache
+from fastlabel.rate_limit import RateLimiter
+from fastlabel.retry import RetryPolicy
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, json_body=None, content=None, headers=None):
+        self.status_code = status_code
+        self._json_body = json_body
+        self.headers = headers or {}
+        if content is None:
+            content = b"" if json_body is None else b"{}"
+        self.content = content
+        self.text = content.decode() if isinstance(content, bytes) else content
+
+    def json(self):
+        if self._json_body is None:
+            raise ValueError("no json")
+        return self._json_body
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i : i + chunk_size]
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSession:
+    """Records requests and replays queued responses."""
+
+    def __init__(self, responses=None):
+        self.responses = list(responses or [])
+        self.calls = []
+
+    def _respond(self, method, url, **kwargs):
+        self.calls.append({"method": method, "url": url, "kwargs": kwargs})
+        if self.responses:
+            return self.responses.pop(0)
+        return FakeResponse(200, json_body={})
+
+    def request(self, method, url, **kwargs):
+        return self._respond(method, url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self._respond("PUT", url, **kwargs)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def api(monkeypatch):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+    monkeypatch.delenv("FASTLABEL_API_URL", raising=False)
+    return Api(rate_limiter=False)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Skip retry delays and record them."""
+    recorded = []
+    monkeypatch.setattr("fastlabel.api.time.sleep", recorded.append)
+    return recorded
+
+
+def test_session_is_shared_across_threads(api):
+    sessions = []
+
+    def worker():
+        sessions.append(api.session)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len({id(s) for s in sessions}) == 1
+
+
+def test_session_pool_size_is_configurable(monkeypatch):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+    api = Api(pool_maxsize=32)
+
+    adapter = api.session.get_adapter("https://api.fastlabel.ai/v1/")
+
+    assert adapter._pool_maxsize == 32
+
+
+def test_invalid_pool_size(monkeypatch):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+
+    with pytest.raises(ValueError):
+        Api(pool_maxsize=0)
+
+
+def test_close_recreates_session(api):
+    first = api.session
+    api.close()
+
+    assert api.session is not first
+
+
+def test_get_request_uses_session(api):
+    api._session = FakeSession([FakeResponse(200, json_body=[{"id": "1"}])])
+
+    result = api.get_request("tasks/image", params={"project": "p"})
+
+    assert result == [{"id": "1"}]
+    call = api._session.calls[0]
+    assert call["url"] == api.base_url + "tasks/image"
+    assert call["kwargs"]["params"] == {"project": "p"}
+    assert call["kwargs"]["headers"]["Authorization"] == "Bearer dummy-token"
+
+
+@pytest.mark.parametrize(
+    "status_code, exception",
+    [(404, FastLabelInvalidException), (500, FastLabelException)],
+)
+def test_error_mapping(api, sleeps, status_code, exception):
+    api._session = FakeSession(
+        [FakeResponse(status_code, json_body={"message": "failed"})]
+    )
+
+    with pytest.raises(exception) as e:
+        api.post_request("tasks/image", payload={})
+
+    assert e.value.code == status_code
+    assert e.value.message == "failed"
+
+
+def test_upload_zipfile_closes_file(api, tmp_path):
+    file_path = tmp_path / "data.zip"
+    file_path.write_bytes(b"zip")
+    api._session = FakeSession([FakeResponse(200)])
+
+    api.upload_zipfile(url="https://storage.example/signed", file_path=str(file_path))
+
+    body = api._session.calls[0]["kwargs"]["data"]
+    assert body._file is None
+    assert api.get_upload_stats()["uploads"] == 1
+
+
+def test_upload_zipfile_streams_file(api, tmp_path):
+    file_path = tmp_path / "data.zip"
+    file_path.write_bytes(b"z" * 1000)
+    progresses = []
+
+    class StreamingSession(FakeSession):
+        def request(self, method, url, **kwargs):
+            body = kwargs["data"]
+            kwargs["sent"] = b"".join(iter(lambda: body.read(100), b""))
+            return super().request(method, url, **kwargs)
+
+    api._session = StreamingSession([FakeResponse(200)])
+
+    api.upload_zipfile(
+        url="https://storage.example/signed",
+        file_path=str(file_path),
+        progress_callback=progresses.append,
+    )
+
+    kwargs = api._session.calls[0]["kwargs"]
+    assert kwargs["headers"]["Content-Type"].startswith("multipart/form-data")
+    assert len(kwargs["sent"]) == len(kwargs["data"])
+    assert b"z" * 1000 in kwargs["sent"]
+    assert progresses[-1].bytes_sent == progresses[-1].total_bytes
+    assert all(p.bytes_sent <= 100 * (i + 1) for i, p in enumerate(progresses))
+    assert api.get_upload_stats()["bytes_sent"] == len(kwargs["sent"])
+
+
+# --- retry -----------------------------------------------------------------
+
+
+def test_get_request_retries_server_errors(api, sleeps):
+    api._session = FakeSession(
+        [
+            FakeResponse(503, json_body={"message": "busy"}),
+            FakeResponse(502, json_body={"message": "busy"}),
+            FakeResponse(200, json_body={"id": "1"}),
+        ]
+    )
+
+    assert api.get_request("tasks/image/1") == {"id": "1"}
+    assert len(api._session.calls) == 3
+    assert len(sleeps) == 2
+    assert api.get_retry_stats()[""] == {"calls": 1, "retries": 2, "exhausted": 0}
+
+
+def test_retry_after_is_honored(api, sleeps):
+    api._session = FakeSession(
+        [
+            FakeResponse(
+                429, json_body={"message": "slow down"}, headers={"Retry-After": "7"}
+            ),
+            FakeResponse(200, json_body={}),
+        ]
+    )
+
+    api.get_request("tasks/image")
+
+    assert sleeps == [7.0]
+
+
+def test_post_is_not_retried_on_server_error(api, sleeps):
+    api._session = FakeSession([FakeResponse(500, json_body={"message": "failed"})])
+
+    with pytest.raises(FastLabelException):
+        api.post_request("tasks/image", payload={"name": "a.jpg"})
+
+    assert len(api._session.calls) == 1
+    assert sleeps == []
+
+
+def test_post_is_retried_when_rejected(api, sleeps):
+    api._session = FakeSession(
+        [
+            FakeResponse(429, json_body={"message": "slow down"}),
+            FakeResponse(200, json_body="id"),
+        ]
+    )
+
+    assert api.post_request("tasks/image", payload={"name": "a.jpg"}) == "id"
+    assert len(api._session.calls) == 2
+
+
+def test_retries_are_exhausted(monkeypatch, sleeps):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+    api = Api(retry_policy=RetryPolicy(max_retries=2), rate_limiter=False)
+    api._session = FakeSession(
+        [FakeResponse(503, json_body={"message": "busy"}) for _ in range(5)]
+    )
+
+    with pytest.raises(FastLabelException) as e:
+        api.get_request("tasks/image")
+
+    assert e.value.code == 503
+    assert len(api._session.calls) == 3
+    assert api.get_retry_stats()[""]["exhausted"] == 1
+
+
+def test_max_elapsed_stops_retrying(monkeypatch, sleeps):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+    api = Api(retry_policy=RetryPolicy(max_elapsed=5), rate_limiter=False)
+    api._session = FakeSession(
+        [
+            FakeResponse(
+                429, json_body={"message": "slow"}, headers={"Retry-After": "60"}
+            ),
+        ]
+    )
+
+    with pytest.raises(FastLabelInvalidException):
+        api.get_request("tasks/image")
+
+    assert sleeps == []
+
+
+def test_policy_per_endpoint_class(monkeypatch, sleeps):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+    api = Api(
+        retry_policy=RetryPolicy(max_retries=0),
+        retry_policies={"tasks/": RetryPolicy(max_retries=1)},
+        rate_limiter=False,
+    )
+    api._session = FakeSession(
+        [
+            FakeResponse(503, json_body={"message": "busy"}),
+            FakeResponse(200, json_body=[]),
+        ]
+    )
+
+    assert api.get_request("tasks/image") == []
+    assert api.get_retry_policy("projects").max_retries == 0
+    assert api.get_retry_stats()["tasks/"]["retries"] == 1
+
+
+def test_connection_error_is_retried_for_reads(api, sleeps):
+    responses = [
+        requests.exceptions.ConnectionError("reset"),
+        FakeResponse(200, json_body=[]),
+    ]
+
+    class FlakySession(FakeSession):
+        def request(self, method, url, **kwargs):
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+    api._session = FlakySession()
+
+    assert api.get_request("tasks/image") == []
+
+
+def test_connection_error_is_raised_for_writes(api, sleeps):
+    class BrokenSession(FakeSession):
+        def request(self, method, url, **kwargs):
+            raise requests.exceptions.ConnectionError("reset")
+
+    api._session = BrokenSession()
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        api.post_request("tasks/image", payload={})
+    assert sleeps == []
+
+
+@pytest.mark.parametrize(
+    "reason",
+    [
+        NewConnectionError(None, "Connection refused"),
+        NameResolutionError("api.fastlabel.ai", None, "Name or service not known"),
+    ],
+)
+def test_connection_refused_is_retried_for_writes(api, sleeps, reason):
+    responses = [
+        requests.exceptions.ConnectionError(
+            MaxRetryError(None, "/v1/tasks/image", reason)
+        ),
+        FakeResponse(200, json_body={"id": "1"}),
+    ]
+
+    class FlakySession(FakeSession):
+        def request(self, method, url, **kwargs):
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+    api._session = FlakySession()
+
+    assert api.post_request("tasks/image", payload={}) == {"id": "1"}
+    assert len(sleeps) == 1
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("3", 3.0), ("0.5", 0.5), ("-1", 0.0), ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0)],
+)
+def test_parse_retry_after(value, expected):
+    assert retry.parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_invalid():
+    assert retry.parse_retry_after("soon") is None
+
+
+def test_backoff_is_capped():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=4)
+
+    assert all(0 <= policy.get_backoff(10) <= 4 for _ in range(100))
+
+
+# --- rate limiter ----------------------------------------------------------
+
+
+def test_rate_limiter_is_enabled_by_default(monkeypatch):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+
+    assert isinstance(Api().rate_limiter, RateLimiter)
+    assert Api(rate_limiter=False).rate_limiter is None
+
+
+def test_requests_go_through_rate_limiter(monkeypatch, sleeps):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+    limiter = RateLimiter(max_concurrency=4, latency_tolerance=None)
+    api = Api(rate_limiter=limiter)
+    api._session = FakeSession(
+        [
+            FakeResponse(429, json_body={"message": "slow down"}),
+            FakeResponse(200, json_body=[]),
+        ]
+    )
+
+    api.get_request("tasks/image")
+
+    assert limiter.concurrency == 2
+    assert limiter.in_flight == 0
+
+
+def test_signed_url_upload_bypasses_rate_limiter(monkeypatch, tmp_path):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+    limiter = RateLimiter(max_concurrency=1)
+    limiter.acquire()
+    api = Api(rate_limiter=limiter)
+    api._session = FakeSession([FakeResponse(200)])
+    file_path = tmp_path / "data.zip"
+    file_path.write_bytes(b"zip")
+
+    # would block forever if it waited for the only slot
+    api.upload_zipfile(url="https://storage.example/signed", file_path=str(file_path))
+
+
+def test_rate_limiter_token_bucket():
+    limiter = RateLimiter(rate=10, burst=2)
+
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == pytest.approx(0.1, abs=0.01)
+    assert limiter.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_rate_limiter_aimd():
+    limiter = RateLimiter(
+        rate=10, max_concurrency=8, cooldown=0, latency_tolerance=None
+    )
+
+    limiter.record(429, 0.1)
+    assert limiter.concurrency == 4
+    assert limiter.rate == 5
+
+    for _ in range(100):
+        limiter.record(200, 0.1)
+    assert limiter.concurrency == 8
+    assert limiter.rate == 10
+
+
+def test_rate_limiter_decreases_once_per_cooldown():
+    limiter = RateLimiter(max_concurrency=16, cooldown=60)
+
+    for _ in range(5):
+        limiter.record(429, 0.1)
+
+    assert limiter.concurrency == 8
+
+
+def test_rate_limiter_backs_off_on_rising_latency():
+    limiter = RateLimiter(max_concurrency=16, cooldown=0, latency_tolerance=2)
+
+    for _ in range(10):
+        limiter.record(200, 0.1)
+    for _ in range(10):
+        limiter.record(200, 2.0)
+
+    assert limiter.concurrency < 16
+
+
+def test_rate_limiter_ignores_latency_by_default():
+    limiter = RateLimiter(max_concurrency=16, cooldown=0)
+
+    for _ in range(10):
+        limiter.record(200, 0.01)
+    for _ in range(10):
+        limiter.record(200, 5.0)
+
+    assert limiter.concurrency == 16
+    assert limiter.rate == limiter.max_rate
+
+
+def test_rate_limiter_keeps_burst_on_latency():
+    limiter = RateLimiter(burst=100, cooldown=0, latency_tolerance=2)
+
+    for _ in range(10):
+        limiter.record(200, 0.1)
+    for _ in range(10):
+        limiter.record(200, 2.0)
+    assert limiter.reserve() == 0.0
+
+    limiter.record(429, 0.1)
+    limiter.reserve()
+    assert limiter.reserve() > 0
+
+
+def test_rate_limiter_bounds_concurrency():
+    limiter = RateLimiter(max_concurrency=2)
+    limiter.acquire()
+    limiter.acquire()
+    acquired = threading.Event()
+
+    def worker():
+        limiter.acquire()
+        acquired.set()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    assert not acquired.wait(0.05)
+
+    limiter.release(200, 0.01)
+    assert acquired.wait(1)
+    thread.join()
+
+
+# --- compression -----------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "compression, decompress",
+    [("gzip", gzip.decompress), ("deflate", zlib.decompress)],
+)
+def test_large_bodies_are_compressed(monkeypatch, compression, decompress):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+    api = Api(compression=compression, compression_threshold=100, rate_limiter=False)
+    api._session = FakeSession([FakeResponse(200, json_body="id")])
+    payload = {"annotations": [{"points": list(range(1000))}]}
+
+    api.post_request("tasks/image", payload=payload)
+
+    kwargs = api._session.calls[0]["kwargs"]
+    assert kwargs["headers"]["Content-Encoding"] == compression
+    assert json.loads(decompress(kwargs["data"])) == payload
+    assert len(kwargs["data"]) < len(json.dumps(payload))
+
+
+def test_small_bodies_are_not_compressed(monkeypatch):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+    api = Api(compression="gzip", compression_threshold=1000, rate_limiter=False)
+    api._session = FakeSession([FakeResponse(200, json_body={})])
+
+    api.put_request("tasks/1", payload={"status": "approved"})
+
+    kwargs = api._session.calls[0]["kwargs"]
+    assert "Content-Encoding" not in kwargs["headers"]
+    assert json.loads(kwargs["data"]) == {"status": "approved"}
+
+
+def test_compression_is_disabled_by_default(api):
+    api._session = FakeSession([FakeResponse(200, json_body={})])
+
+    api.put_request("tasks/1", payload={"status": "approved"})
+
+    assert api._session.calls[0]["kwargs"]["json"] == {"status": "approved"}
+
+
+def test_invalid_compression(monkeypatch):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+
+    with pytest.raises(ValueError):
+        Api(compression="br")
+
+
+def test_get_request_stream_yields_items(api):
+    content = json.dumps([{"id": str(i), "name": "a,b]"} for i in range(50)])
+    session = FakeSession([FakeResponse(200, content=content.encode())])
+    api._session = session
+
+    items = list(api.get_request_stream("tasks/appendix", chunk_size=7))
+
+    assert items == json.loads(content)
+    assert session.calls[0]["kwargs"]["stream"] is True
+
+
+def test_get_request_stream_raises_errors(api):
+    response = FakeResponse(400, json_body={"message": "bad request"})
+    api._session = FakeSession([response])
+
+    with pytest.raises(FastLabelInvalidException):
+        list(api.get_request_stream("tasks/appendix"))
+    assert response.closed
+
+
+def test_get_request_stream_reads_streamed_error_body(api):
+    response = requests.Response()
+    response.status_code = 404
+    response.raw = io.BytesIO(b'{"message": "Task not found."}')
+    api._session = FakeSession([response])
+
+    with pytest.raises(FastLabelInvalidException, match="Task not found."):
+        list(api.get_request_stream("tasks/appendix"))
+
+
+def test_post_request_with_file_streams_json_body(api, sleeps, tmp_path):
+    path = tmp_path / "a.jpg"
+    path.write_bytes(b"image bytes")
+    api._session = FakeSession(
+        [FakeResponse(429, json_body={}), FakeResponse(200, json_body="task-id")]
+    )
+    bodies = []
+    request = api._session.request
+
+    def read_body(method, url, **kwargs):
+        bodies.append(kwargs["data"].read())
+        return request(method, url, **kwargs)
+
+    api._session.request = read_body
+
+    assert (
+        api.post_request_with_file("tasks/image", {"name": "a.jpg"}, str(path))
+        == "task-id"
+    )
+    # The body is read from the start again on retry.
+    assert bodies[0] == bodies[1]
+    assert json.loads(bodies[0]) == {"file": "aW1hZ2UgYnl0ZXM=", "name": "a.jpg"}
+    assert api._session.calls[0]["kwargs"]["headers"]["Content-Type"] == (
+        "application/json"
+    )
+
+
+@pytest.mark.parametrize(
+    "compression, decompress",
+    [("gzip", gzip.decompress), ("deflate", zlib.decompress)],
+)
+def test_post_request_with_file_compresses_body(
+    monkeypatch, sleeps, tmp_path, compression, decompress
+):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+    api = Api(compression=compression, compression_threshold=100, rate_limiter=False)
+    path = tmp_path / "a.jpg"
+    path.write_bytes(b"image bytes" * 100)
+    api._session = FakeSession(
+        [FakeResponse(429, json_body={}), FakeResponse(200, json_body="task-id")]
+    )
+    bodies = []
+    request = api._session.request
+
+    def read_body(method, url, **kwargs):
+        # A generator is sent chunked by requests.
+        assert not hasattr(kwargs["data"], "read")
+        bodies.append(b"".join(kwargs["data"]))
+        return request(method, url, **kwargs)
+
+    api._session.request = read_body
+
+    api.post_request_with_file("tasks/image", {"name": "a.jpg"}, str(path))
+
+    assert bodies[0] == bodies[1]
+    assert json.loads(decompress(bodies[0])) == {
+        "file": base64.b64encode(b"image bytes" * 100).decode(),
+        "name": "a.jpg",
+    }
+    headers = api._session.calls[0]["kwargs"]["headers"]
+    assert headers["Content-Encoding"] == compression
+    assert "Content-Length" not in headers
+
+
+def test_post_request_with_small_file_is_not_compressed(monkeypatch, tmp_path):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+    api = Api(compression="gzip", compression_threshold=1000, rate_limiter=False)
+    path = tmp_path / "a.jpg"
+    path.write_bytes(b"image bytes")
+    api._session = FakeSession([FakeResponse(200, json_body="task-id")])
+
+    api.post_request_with_file("tasks/image", {"name": "a.jpg"}, str(path))
+
+    kwargs = api._session.calls[0]["kwargs"]
+    assert "Content-Encoding" not in kwargs["headers"]
+    assert hasattr(kwargs["data"], "read")
+
+
+# --- metrics -------------------------------------------------------------
+
+
+def test_metrics_record_every_attempt(monkeypatch, sleeps):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+    client = fastlabel.Client(rate_limiter=False)
+    client.api._session = FakeSession(
+        [
+            FakeResponse(503, json_body={}),
+            FakeResponse(200, json_body={"id": "1"}, headers={"Content-Length": "11"}),
+        ]
+    )
+    records = []
+    client.add_metrics_hook(records.append)
+
+    client.find_image_task("123e4567-e89b-12d3-a456-426614174000")
+
+    stats = client.metrics()["GET tasks/image/{id}"]
+    assert stats["count"] == 2
+    assert stats["retries"] == 1
+    assert stats["status_codes"] == {503: 1, 200: 1}
+    assert stats["bytes_received"] == 11
+    assert [r.retry for r in records] == [0, 1]
+
+
+def test_failing_metrics_hook_does_not_fail_write(api):
+    api._session = FakeSession([FakeResponse(200, json_body="task-id")])
+
+    def broken_hook(record):
+        raise ConnectionError("collector is down")
+
+    api.metrics.add_hook(broken_hook)
+
+    assert api.post_request("tasks/image", payload={"name": "a.jpg"}) == "task-id"
+    assert len(api._session.calls) == 1
+
+
+# --- http cache ----------------------------------------------------------
+
+
+def test_get_request_revalidates_cached_response(api, tmp_path):
+    api.http_cache = HTTPCache(str(tmp_path))
+    body = json.dumps([{"id": "1"}]).encode()
+    api._session = FakeSession(
+        [
+            FakeResponse(200, json_body=[{"id": "1"}], content=body),
+            FakeResponse(304),
+            FakeResponse(200, json_body=[{"id": "2"}], content=b'[{"id": "2"}]'),
+        ]
+    )
+    api._session.responses[0].headers = {"ETag": '"v1"'}
+
+    assert api.get_request("tasks/image", params={"project": "a"}) == [{"id": "1"}]
+    assert api.get_request("tasks/image", params={"project": "a"}) == [{"id": "1"}]
+    assert api.get_request("tasks/image", params={"project": "a"}) == [{"id": "2"}]
+
+    headers = [call["kwargs"]["headers"] for call in api._session.calls]
+    assert "If-None-Match" not in headers[0]
+    assert headers[1]["If-None-Match"] == '"v1"'
+    assert headers[2]["If-None-Match"] == '"v1"'
+
+
+def test_get_request_cache_is_per_params(api, tmp_path):
+    api.http_cache = HTTPCache(str(tmp_path))
+    api._session = FakeSession(
+        [
+            FakeResponse(
+                200,
+                json_body={},
+                content=b"{}",
+                headers={"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"},
+            ),
+        ]
+    )
+
+    api.get_request("tasks/image", params={"project": "a"})
+    api.get_request("tasks/image", params={"project": "b"})
+
+    headers = [call["kwargs"]["headers"] for call in api._session.calls]
+    assert "If-Modified-Since" not in headers[1]
@@ -0,0 +1,282 @@
+"""Tests for AsyncClient.
+
+Requests are served by httpx.MockTransport so no real connection is made.
+"""
+
+import asyncio
+import base64
+import gzip
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+import fastlabel  # noqa: E402
+from fastlabel.exceptions import FastLabelInvalidException  # noqa: E402
+from fastlabel.retry import RetryPolicy  # noqa: E402
+
+
+def _client(monkeypatch, handler, **kwargs):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+    monkeypatch.delenv("FASTLABEL_API_URL", raising=False)
+    client = fastlabel.AsyncClient(rate_limiter=False, **kwargs)
+    client.api._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_single_request_method(monkeypatch):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=[{"id": "1"}])
+
+    client = _client(monkeypatch, handler)
+
+    tasks = asyncio.run(client.get_image_tasks(project="slug", status="approved"))
+
+    assert tasks == [{"id": "1"}]
+    assert requests[0].method == "GET"
+    assert requests[0].url.path == "/v1/tasks/image"
+    assert dict(requests[0].url.params) == {
+        "project": "slug",
+        "status": "approved",
+        "limit": "100",
+    }
+    assert requests[0].headers["Authorization"] == "Bearer dummy-token"
+
+
+def test_payload_is_built_by_client(monkeypatch):
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json="task-id")
+
+    client = _client(monkeypatch, handler)
+
+    result = asyncio.run(client.update_task(task_id="t1", status="approved"))
+
+    assert result == "task-id"
+    assert bodies == [{"status": "approved"}]
+
+
+def test_methods_taking_name_keyword(monkeypatch, tmp_path):
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json="id")
+
+    client = _client(monkeypatch, handler)
+    file_path = tmp_path / "a.jpg"
+    file_path.write_bytes(b"jpg")
+
+    async def run():
+        return [
+            await client.create_image_task(
+                project="slug", name="a.jpg", file_path=str(file_path)
+            ),
+            await client.update_project(project_id="p1", name="renamed"),
+        ]
+
+    assert asyncio.run(run()) == ["id", "id"]
+    assert bodies[0]["name"] == "a.jpg"
+    assert bodies[1]["name"] == "renamed"
+
+
+def test_create_image_task_with_compression(monkeypatch, tmp_path):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json="id")
+
+    client = _client(monkeypatch, handler, compression="gzip")
+    client.api.compression_threshold = 100
+    file_path = tmp_path / "a.jpg"
+    file_path.write_bytes(b"jpg" * 100)
+
+    asyncio.run(
+        client.create_image_task(project="slug", name="a.jpg", file_path=str(file_path))
+    )
+
+    request = requests[0]
+    assert request.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in request.headers
+    body = json.loads(gzip.decompress(request.read()))
+    assert body["file"] == base64.b64encode(b"jpg" * 100).decode()
+
+
+def test_default_rate_limiter_follows_max_connections(monkeypatch):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+
+    client = fastlabel.AsyncClient(max_connections=200)
+
+    assert client.api.rate_limiter.max_concurrency == 200
+
+
+@pytest.mark.parametrize("name", ["transport", "http_cache"])
+def test_unsupported_api_arguments(monkeypatch, tmp_path, name):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+    value = {
+        "transport": fastlabel.HTTPXTransport(http2=False),
+        "http_cache": fastlabel.HTTPCache(str(tmp_path)),
+    }[name]
+
+    with pytest.raises(FastLabelInvalidException, match=name):
+        fastlabel.AsyncClient(**{name: value})
+
+
+def test_connect_error_is_retried_for_writes(monkeypatch):
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        if len(attempts) == 1:
+            raise httpx.ConnectError("Connection refused.")
+        return httpx.Response(200, json="task-id")
+
+    client = _client(monkeypatch, handler, retry_policy=RetryPolicy(backoff_factor=0))
+
+    result = asyncio.run(client.update_task(task_id="t1", status="approved"))
+
+    assert result == "task-id"
+    assert len(attempts) == 2
+
+
+def test_validation_runs_before_sending(monkeypatch):
+    def handler(request):
+        raise AssertionError("must not be sent")
+
+    client = _client(monkeypatch, handler)
+
+    with pytest.raises(FastLabelInvalidException):
+        asyncio.run(client.get_image_tasks(project="slug", limit=5000))
+
+
+def test_find_by_name(monkeypatch):
+    def handler(request):
+        if request.url.params["taskName"] == "exists.jpg":
+            return httpx.Response(200, json=[{"name": "exists.jpg"}])
+        return httpx.Response(200, json=[])
+
+    client = _client(monkeypatch, handler)
+
+    async def run():
+        return (
+            await client.find_image_task_by_name("slug", "exists.jpg"),
+            await client.find_image_task_by_name(project="slug", task_name="none"),
+        )
+
+    found, missing = asyncio.run(run())
+
+    assert found == {"name": "exists.jpg"}
+    assert missing is None
+
+
+def test_error_mapping(monkeypatch):
+    def handler(request):
+        return httpx.Response(404, json={"message": "not found"})
+
+    client = _client(monkeypatch, handler)
+
+    with pytest.raises(FastLabelInvalidException) as e:
+        asyncio.run(client.find_image_task("missing"))
+
+    assert e.value.code == 404
+
+
+def test_retry(monkeypatch):
+    statuses = [503, 200]
+
+    def handler(request):
+        return httpx.Response(statuses.pop(0), json={"id": "1"})
+
+    client = _client(
+        monkeypatch, handler, retry_policy=RetryPolicy(backoff_factor=0.001)
+    )
+
+    assert asyncio.run(client.find_image_task("1")) == {"id": "1"}
+    assert client.api.get_retry_stats()[""]["retries"] == 1
+
+
+def test_multi_request_method(monkeypatch):
+    calls = []
+
+    def handler(request):
+        calls.append(request.method + " " + request.url.path)
+        return httpx.Response(200, json="ok")
+
+    client = _client(monkeypatch, handler)
+
+    result = asyncio.run(
+        client.create_workspace_user_module_permissions(
+            email="john@example.com", modules=["annotation", "dataset"]
+        )
+    )
+
+    assert result == ["ok", "ok"]
+    assert calls == [
+        "POST /v1/function-resource-permissions/annotation/internal-users",
+        "POST /v1/function-resource-permissions/dataset/internal-users",
+    ]
+
+
+def test_concurrent_requests_share_rate_limiter(monkeypatch):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={})
+
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+    client = fastlabel.AsyncClient(
+        rate_limiter=fastlabel.RateLimiter(max_concurrency=3)
+    )
+    client.api._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def run():
+        async with client:
+            return await client.gather(
+                *(client.find_image_task(str(i)) for i in range(12))
+            )
+
+    results = asyncio.run(run())
+
+    assert len(results) == 12
+    assert max_in_flight <= 3
+
+
+def test_upload_zipfile_streams_file(monkeypatch, tmp_path):
+    file_path = tmp_path / "data.zip"
+    file_path.write_bytes(b"z" * 1000)
+    uploads = []
+    progresses = []
+
+    def handler(request):
+        uploads.append(request)
+        return httpx.Response(200)
+
+    client = _client(monkeypatch, handler)
+
+    asyncio.run(
+        client.api.upload_zipfile(
+            "https://storage.example/signed",
+            str(file_path),
+            progress_callback=progresses.append,
+        )
+    )
+
+    request = uploads[0]
+    assert request.method == "PUT"
+    assert request.headers["Content-Type"].startswith("multipart/form-data")
+    assert int(request.headers["Content-Length"]) == len(request.read())
+    assert b"z" * 1000 in request.content
+    assert progresses[-1].done
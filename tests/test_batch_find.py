@@ -0,0 +1,106 @@
+"""Tests for the concurrent batch find methods of Client.
+
+The HTTP layer (client.api.get_request) is stubbed so no real request is made.
+"""
+
+import threading
+import time
+
+import pytest
+import requests
+
+import fastlabel
+from fastlabel.exceptions import FastLabelInvalidException
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+    return fastlabel.Client()
+
+
+def test_find_tasks(monkeypatch, client):
+    calls = []
+
+    def get_request(endpoint, params=None):
+        calls.append(endpoint)
+        task_id = endpoint.rsplit("/", 1)[1]
+        if task_id == "missing":
+            raise FastLabelInvalidException("Task not found.", 404)
+        return {"id": task_id}
+
+    monkeypatch.setattr(client.api, "get_request", get_request)
+
+    results = client.find_tasks("video", ["b", "a", "missing", "b"])
+
+    assert results == [
+        {"id": "b", "success": True, "result": {"id": "b"}},
+        {"id": "a", "success": True, "result": {"id": "a"}},
+        {
+            "id": "missing",
+            "success": False,
+            "result": {"error": "<Response [404]> Task not found."},
+        },
+    ]
+    assert sorted(calls) == ["tasks/video/a", "tasks/video/b", "tasks/video/missing"]
+
+
+def test_find_tasks_bounds_concurrency(monkeypatch, client):
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def get_request(endpoint, params=None):
+        with lock:
+            running.append(endpoint)
+            peak.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(endpoint)
+        return {}
+
+    monkeypatch.setattr(client.api, "get_request", get_request)
+
+    results = client.find_tasks("image", [str(i) for i in range(20)], max_workers=3)
+
+    assert len(results) == 20
+    assert max(peak) <= 3
+
+
+def test_find_tasks_rejects_unknown_kind(client):
+    with pytest.raises(FastLabelInvalidException):
+        client.find_tasks("movie", ["a"])
+
+
+def test_find_annotations_and_dataset_objects(monkeypatch, client):
+    calls = []
+
+    def get_request(endpoint, params=None):
+        calls.append((endpoint, params))
+        return {"endpoint": endpoint}
+
+    monkeypatch.setattr(client.api, "get_request", get_request)
+
+    assert [r["id"] for r in client.find_annotations(["x", "y", "x"])] == ["x", "y"]
+    results = client.find_dataset_objects("ds", ["a/1.jpg", "2.jpg"], version="1.0")
+
+    assert [r["name"] for r in results] == ["a/1.jpg", "2.jpg"]
+    assert (
+        "dataset-revision-objects/datasets/ds/objects/a%2F1.jpg",
+        {"version": "1.0"},
+    ) in calls
+
+
+def test_find_tasks_reports_network_errors(monkeypatch, client):
+    def get_request(endpoint, params=None):
+        task_id = endpoint.rsplit("/", 1)[1]
+        if task_id == "b":
+            raise requests.exceptions.ConnectionError("Connection reset.")
+        return {"id": task_id}
+
+    monkeypatch.setattr(client.api, "get_request", get_request)
+
+    results = client.find_tasks("image", ["a", "b", "c"])
+
+    assert [r["success"] for r in results] == [True, False, True]
+    assert results[1]["result"] == {"error": "Connection reset."}
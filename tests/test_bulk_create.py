@@ -0,0 +1,143 @@
+"""Tests for the bulk task creation pipeline of Client.
+
+create_*_task requests are served by a stubbed client.api.post_request_with_file.
+"""
+
+import threading
+import time
+
+import pytest
+
+import fastlabel
+from fastlabel.upload import ByteBudget
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+    return fastlabel.Client()
+
+
+def _write(tmp_path, name, size=30):
+    path = tmp_path / name
+    path.write_bytes(b"x" * size)
+    return str(path)
+
+
+def test_byte_budget_blocks_until_released():
+    budget = ByteBudget(100)
+    budget.acquire(60)
+    acquired = threading.Event()
+
+    def acquire():
+        budget.acquire(60)
+        acquired.set()
+
+    thread = threading.Thread(target=acquire)
+    thread.start()
+    assert not acquired.wait(0.05)
+    budget.release(60)
+    assert acquired.wait(1)
+    thread.join()
+    assert budget.in_flight == 60
+
+
+def test_byte_budget_lets_large_item_through_alone():
+    budget = ByteBudget(10)
+    budget.acquire(50)
+    assert budget.in_flight == 50
+
+
+def test_create_image_tasks(monkeypatch, client, tmp_path):
+    payloads = []
+    monkeypatch.setattr(
+        client.api,
+        "post_request_with_file",
+        lambda endpoint, payload, file_path: payloads.append(payload)
+        or payload["name"],
+    )
+    a = _write(tmp_path, "a.jpg")
+    b = _write(tmp_path, "b.gif")
+
+    results = client.create_image_tasks(
+        "slug",
+        [a, b, str(tmp_path / "missing.jpg"), {"file_path": a, "name": "renamed"}],
+        status="registered",
+    )
+
+    assert [r["name"] for r in results] == ["a.jpg", "b.gif", "missing.jpg", "renamed"]
+    assert [r["success"] for r in results] == [True, False, False, True]
+    assert results[0]["result"] == "a.jpg"
+    assert "not a supported image file" in results[1]["result"]["error"]
+    assert sorted(p["name"] for p in payloads) == ["a.jpg", "renamed"]
+    assert all(p["status"] == "registered" for p in payloads)
+
+
+def test_create_image_tasks_resumes_from_journal(monkeypatch, client, tmp_path):
+    names = []
+    fail = {"b.jpg"}
+
+    def post_request_with_file(endpoint, payload, file_path):
+        names.append(payload["name"])
+        if payload["name"] in fail:
+            raise fastlabel.FastLabelInvalidException("Error", 422)
+        return "id-" + payload["name"]
+
+    monkeypatch.setattr(client.api, "post_request_with_file", post_request_with_file)
+    paths = [_write(tmp_path, name) for name in ["a.jpg", "b.jpg", "c.jpg"]]
+    journal_path = str(tmp_path / "import.jsonl")
+
+    results = client.create_image_tasks("slug", paths, journal_path=journal_path)
+    assert [r["success"] for r in results] == [True, False, True]
+
+    fail.clear()
+    names.clear()
+    results = client.create_image_tasks("slug", paths, journal_path=journal_path)
+
+    assert names == ["b.jpg"]
+    assert [r["result"] for r in results] == ["id-a.jpg", "id-b.jpg", "id-c.jpg"]
+    assert [r.get("skipped", False) for r in results] == [True, False, True]
+
+
+def test_create_image_tasks_reports_network_errors(monkeypatch, client, tmp_path):
+    httpx = pytest.importorskip("httpx")
+    client.api.transport = fastlabel.HTTPXTransport(http2=False)
+
+    def post_request_with_file(endpoint, payload, file_path):
+        if payload["name"] == "b.jpg":
+            raise httpx.ConnectError("Connection refused.")
+        return payload["name"]
+
+    monkeypatch.setattr(client.api, "post_request_with_file", post_request_with_file)
+    paths = [_write(tmp_path, name) for name in ["a.jpg", "b.jpg", "c.jpg"]]
+
+    results = client.create_image_tasks("slug", paths)
+
+    assert [r["success"] for r in results] == [True, False, True]
+    assert results[1]["result"] == {"error": "Connection refused."}
+
+
+def test_create_text_tasks_bounds_bytes_in_flight(monkeypatch, client, tmp_path):
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+
+    def post_request_with_file(endpoint, payload, file_path):
+        with lock:
+            in_flight.append(payload["name"])
+            peak.append(len(in_flight))
+        time.sleep(0.01)
+        with lock:
+            in_flight.remove(payload["name"])
+        return payload["name"]
+
+    monkeypatch.setattr(client.api, "post_request_with_file", post_request_with_file)
+    # 30 bytes are 40 bytes encoded: at most 2 files fit in 100 bytes.
+    paths = [_write(tmp_path, f"{i}.txt") for i in range(10)]
+
+    results = client.create_text_tasks(
+        "slug", iter(paths), max_workers=8, max_bytes_in_flight=100
+    )
+
+    assert [r["result"] for r in results] == [f"{i}.txt" for i in range(10)]
+    assert max(peak) <= 2
@@ -0,0 +1,140 @@
+"""Tests for Client.update_tasks and the annotation payload helpers.
+
+update_*_task requests are served by a stubbed client.api.put_request.
+"""
+
+import copy
+import threading
+
+import pytest
+import requests
+
+import fastlabel
+from fastlabel import delete_extra_annotations_parameter
+from fastlabel.exceptions import FastLabelInvalidException
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+    return fastlabel.Client()
+
+
+ANNOTATION = {
+    "id": "annotation-id",
+    "title": "Cat",
+    "color": "#ff0000",
+    "value": "cat",
+    "type": "bbox",
+    "points": [0, 0, 10, 10],
+    "attributes": [{"key": "kind", "title": "Kind", "type": "text", "value": "a"}],
+    "keypoints": [{"key": "eye", "name": "Eye", "edges": [], "value": [1, 1]}],
+}
+
+
+def test_delete_extra_annotations_parameter_does_not_modify_annotations():
+    annotations = [copy.deepcopy(ANNOTATION)]
+
+    result = delete_extra_annotations_parameter(annotations, content="a.jpg")
+
+    assert annotations == [ANNOTATION]
+    assert result == [
+        {
+            "value": "cat",
+            "type": "bbox",
+            "points": [0, 0, 10, 10],
+            "attributes": [{"key": "kind", "value": "a"}],
+            "keypoints": [{"key": "eye", "value": [1, 1]}],
+            "content": "a.jpg",
+        }
+    ]
+
+
+def test_update_tasks(monkeypatch, client):
+    payloads = {}
+
+    def put_request(endpoint, payload=None):
+        task_id = endpoint.split("/")[-1]
+        if task_id == "missing":
+            raise fastlabel.FastLabelException("Task not found.", 404)
+        payloads[endpoint] = payload
+        return task_id
+
+    monkeypatch.setattr(client.api, "put_request", put_request)
+    annotations = [copy.deepcopy(ANNOTATION)]
+
+    results = client.update_tasks(
+        "image",
+        [
+            ("a", {"status": "completed", "annotations": annotations}),
+            ("missing", {"status": "completed"}),
+            ("b", {"tags": ["reviewed"]}),
+        ],
+    )
+
+    assert [r["id"] for r in results] == ["a", "missing", "b"]
+    assert annotations == [ANNOTATION]
+    assert payloads["tasks/image/a"]["annotations"][0]["content"] == ""
+    assert "id" not in payloads["tasks/image/a"]["annotations"][0]
+    assert payloads["tasks/image/b"] == {"tags": ["reviewed"]}
+
+
+def test_update_tasks_reports_failures(monkeypatch, client):
+    def put_request(endpoint, payload=None):
+        if endpoint.endswith("missing"):
+            raise fastlabel.FastLabelException("Task not found.", 404)
+        return endpoint.split("/")[-1]
+
+    monkeypatch.setattr(client.api, "put_request", put_request)
+
+    results = list(client.update_tasks("pcd", [("a", {}), ("missing", {})]))
+
+    assert results[0] == {"id": "a", "success": True, "result": "a"}
+    assert results[1]["success"] is False
+    assert "Task not found." in results[1]["result"]["error"]
+
+
+def test_update_tasks_reports_network_errors(monkeypatch, client):
+    def put_request(endpoint, payload=None):
+        if endpoint.endswith("/b"):
+            raise requests.exceptions.ConnectionError("Connection reset.")
+        return endpoint.split("/")[-1]
+
+    monkeypatch.setattr(client.api, "put_request", put_request)
+
+    results = list(client.update_tasks("image", [("a", {}), ("b", {}), ("c", {})]))
+
+    assert [r["success"] for r in results] == [True, False, True]
+    assert results[1] == {
+        "id": "b",
+        "success": False,
+        "result": {"error": "Connection reset."},
+    }
+
+
+def test_update_tasks_reads_updates_ahead_lazily(monkeypatch, client):
+    lock = threading.Lock()
+    read = []
+
+    def put_request(endpoint, payload=None):
+        return endpoint.split("/")[-1]
+
+    def updates():
+        for i in range(100):
+            with lock:
+                read.append(i)
+            yield str(i), {"status": "completed"}
+
+    monkeypatch.setattr(client.api, "put_request", put_request)
+
+    results = client.update_tasks("video", updates(), max_workers=2)
+    first = next(results)
+
+    assert first["id"] == "0"
+    assert len(read) <= 2 * 2 + 1
+    assert [r["id"] for r in results] == [str(i) for i in range(1, 100)]
+
+
+def test_update_tasks_rejects_unknown_kind(client):
+    with pytest.raises(FastLabelInvalidException):
+        list(client.update_tasks("unknown", [("a", {})]))
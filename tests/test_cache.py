@@ -0,0 +1,190 @@
+"""Tests for TTLCache and the cached project and dataset lookups of Client.
+
+The HTTP layer (client.api) is stubbed so no real request is made.
+"""
+
+import pytest
+
+import fastlabel
+from fastlabel.cache import TTLCache
+
+
+class FakeApi:
+    def __init__(self):
+        self.calls = []
+        self.projects = {"p1": {"id": "p1", "slug": "slug-1", "type": "image_bbox"}}
+
+    def get_request(self, endpoint, params=None):
+        self.calls.append(("GET", endpoint))
+        if endpoint == "projects":
+            return [p for p in self.projects.values() if p["slug"] == params["slug"]]
+        if endpoint == "projects/map/id-slug":
+            return {p["id"]: p["slug"] for p in self.projects.values()}
+        if endpoint.startswith("projects/"):
+            return self.projects[endpoint.split("/")[1]]
+        if endpoint.startswith("datasets-v2/"):
+            return {"id": endpoint.split("/")[1]}
+        raise AssertionError(endpoint)
+
+    def put_request(self, endpoint, payload=None):
+        self.calls.append(("PUT", endpoint))
+        if endpoint == "projects-users":
+            project = next(
+                p for p in self.projects.values() if p["slug"] == payload["project"]
+            )
+            project.setdefault("users", []).append(payload["email"])
+            return True
+        project = self.projects[endpoint.split("/")[1]]
+        project.update(payload)
+        return project["id"]
+
+    def delete_request(self, endpoint, params=None):
+        self.calls.append(("DELETE", endpoint))
+
+    def post_request(self, endpoint, payload=None):
+        self.calls.append(("POST", endpoint))
+        project_id = f"p{len(self.projects) + 1}"
+        self.projects[project_id] = {"id": project_id, "slug": payload["slug"]}
+        return project_id
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+    client = fastlabel.Client(cache=True)
+    client.api = FakeApi()
+    return client
+
+
+def test_expires(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("fastlabel.cache.time.monotonic", lambda: now[0])
+    cache = TTLCache(ttl=10)
+    loads = []
+
+    def load():
+        loads.append(1)
+        return {"value": len(loads)}
+
+    assert cache.get_or_load(("kind", 1), load) == {"value": 1}
+    now[0] += 5
+    assert cache.get_or_load(("kind", 1), load) == {"value": 1}
+    now[0] += 10
+    assert cache.get_or_load(("kind", 1), load) == {"value": 2}
+    assert cache.get_stats() == {"size": 1, "hits": 1, "misses": 2}
+
+
+def test_drops_least_recently_used():
+    cache = TTLCache(max_size=2)
+    cache.get_or_load(("kind", 1), lambda: 1)
+    cache.get_or_load(("kind", 2), lambda: 2)
+    cache.get_or_load(("kind", 1), lambda: 1)
+    cache.get_or_load(("kind", 3), lambda: 3)
+
+    assert len(cache) == 2
+    assert cache.get_or_load(("kind", 2), lambda: "reloaded") == "reloaded"
+
+
+def test_returns_copies_and_skips_none():
+    cache = TTLCache()
+    cache.get_or_load(("kind", 1), lambda: {"tags": []})
+    cache.get_or_load(("kind", 1), lambda: None)["tags"].append("x")
+
+    assert cache.get_or_load(("kind", 1), lambda: None) == {"tags": []}
+    assert cache.get_or_load(("kind", 2), lambda: None) is None
+    assert len(cache) == 1
+
+
+def test_skips_empty_results():
+    cache = TTLCache()
+
+    assert cache.get_or_load(("kind", 1), lambda: []) == []
+    assert cache.get_or_load(("kind", 1), lambda: ["loaded"]) == ["loaded"]
+    assert len(cache) == 1
+
+
+def test_does_not_store_value_loaded_during_invalidation():
+    cache = TTLCache()
+
+    def load():
+        # An update invalidates the entry while the old value is loaded.
+        cache.invalidate(("kind", 1))
+        return "stale"
+
+    assert cache.get_or_load(("kind", 1), load) == "stale"
+    assert cache.get_or_load(("kind", 1), lambda: "fresh") == "fresh"
+
+
+def test_caches_project_lookups(client):
+    for _ in range(3):
+        assert client.find_project_by_slug("slug-1")["id"] == "p1"
+        assert client.find_project("p1")["slug"] == "slug-1"
+        assert client.get_project_id_slug_map() == {"p1": "slug-1"}
+        assert client.find_dataset("d1") == {"id": "d1"}
+
+    assert len(client.api.calls) == 4
+
+
+def test_update_project_invalidates(client):
+    client.find_project("p1")
+    client.find_project_by_slug("slug-1")
+    client.get_project_id_slug_map()
+
+    client.update_project("p1", slug="slug-2")
+
+    assert client.find_project("p1")["slug"] == "slug-2"
+    assert client.find_project_by_slug("slug-1") is None
+    assert client.get_project_id_slug_map() == {"p1": "slug-2"}
+
+
+def test_update_project_metadata_invalidates(client):
+    client.find_project("p1")
+    client.find_project_by_slug("slug-1")
+
+    client.update_project_metadata("p1", "code-1", None, None)
+
+    assert client.find_project("p1")["externalCode1"] == "code-1"
+    assert client.find_project_by_slug("slug-1")["externalCode1"] == "code-1"
+
+
+def test_update_project_user_permission_invalidates(client):
+    client.find_project("p1")
+    client.find_project_by_slug("slug-1")
+
+    client.update_project_user_permission("slug-1", "john@example.com", "reviewer")
+
+    assert client.find_project("p1")["users"] == ["john@example.com"]
+    assert client.find_project_by_slug("slug-1")["users"] == ["john@example.com"]
+
+
+def test_create_project_after_missing_slug_lookup(client):
+    assert client.find_project_by_slug("new") is None
+
+    client.create_project(type="image_bbox", name="New", slug="new")
+
+    assert client.find_project_by_slug("new")["slug"] == "new"
+
+
+def test_delete_invalidates(client):
+    client.find_project("p1")
+    client.find_dataset("d1")
+    client.delete_project("p1")
+    client.delete_dataset("d1")
+    client.api.calls.clear()
+
+    client.find_project("p1")
+    client.find_dataset("d1")
+
+    assert client.api.calls == [("GET", "projects/p1"), ("GET", "datasets-v2/d1")]
+
+
+def test_disabled_by_default(monkeypatch):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+    client = fastlabel.Client()
+    client.api = FakeApi()
+
+    client.find_project("p1")
+    client.find_project("p1")
+
+    assert client.cache is None
+    assert len(client.api.calls) == 2
@@ -0,0 +1,150 @@
+"""Tests for dumping the tasks of a project to JSONL or Parquet.
+
+The HTTP layer (client.api.get_request) is stubbed to serve pages of a fixed
+list of tasks.
+"""
+
+import json
+import os
+
+import pytest
+
+import fastlabel
+from fastlabel.exceptions import FastLabelInvalidException
+
+TASKS = [
+    {
+        "id": str(i),
+        "name": f"{i}.jpg",
+        "status": "approved",
+        "annotations": [{"value": "cat", "points": [i, i, 10, 10]}],
+    }
+    for i in range(25)
+]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+    return fastlabel.Client()
+
+
+def _serve(monkeypatch, client, fail_at=None):
+    calls = []
+
+    def get_request(endpoint, params=None):
+        offset = params.get("offset", 0)
+        calls.append(offset)
+        if fail_at is not None and offset >= fail_at:
+            raise ConnectionError("stopped")
+        return TASKS[offset : offset + params["limit"]]
+
+    monkeypatch.setattr(client.api, "get_request", get_request)
+    return calls
+
+
+def _read_jsonl(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_dump_jsonl(monkeypatch, client, tmp_path):
+    _serve(monkeypatch, client)
+    path = str(tmp_path / "out" / "tasks.jsonl")
+
+    stats = client.dump_tasks("slug", "robotics", path, page_size=10)
+
+    assert _read_jsonl(path) == TASKS
+    assert stats["tasks"] == 25
+    assert stats["pages"] == 3
+    assert stats["bytes"] == os.path.getsize(path)
+    assert not os.path.exists(path + ".state.json")
+
+
+def test_dump_jsonl_resumes(monkeypatch, client, tmp_path):
+    path = str(tmp_path / "tasks.jsonl")
+    _serve(monkeypatch, client, fail_at=20)
+    with pytest.raises(ConnectionError):
+        client.dump_tasks("slug", "robotics", path, page_size=10)
+    # A partially written page is dropped on resume
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"id": "partial"')
+
+    calls = _serve(monkeypatch, client)
+    stats = client.dump_tasks("slug", "robotics", path, page_size=10)
+
+    assert calls == [20]
+    assert stats["tasks"] == 5
+    assert _read_jsonl(path) == TASKS
+
+
+def test_dump_starts_over_for_other_filters(monkeypatch, client, tmp_path):
+    path = str(tmp_path / "tasks.jsonl")
+    _serve(monkeypatch, client, fail_at=10)
+    with pytest.raises(ConnectionError):
+        client.dump_tasks("slug", "robotics", path, page_size=10)
+
+    calls = _serve(monkeypatch, client)
+    client.dump_tasks("slug", "robotics", path, status="approved", page_size=10)
+
+    assert calls[0] == 0
+    assert _read_jsonl(path) == TASKS
+
+
+def test_dump_parquet(monkeypatch, client, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "tasks")
+    _serve(monkeypatch, client, fail_at=10)
+    with pytest.raises(ConnectionError):
+        client.dump_tasks("slug", "robotics", path, format="parquet", page_size=10)
+
+    _serve(monkeypatch, client)
+    client.dump_tasks("slug", "robotics", path, format="parquet", page_size=10)
+
+    assert sorted(os.listdir(path)) == [
+        "part-000000.parquet",
+        "part-000001.parquet",
+        "part-000002.parquet",
+    ]
+    rows = pq.read_table(path).to_pylist()
+    assert [row["id"] for row in rows] == [task["id"] for task in TASKS]
+    assert json.loads(rows[3]["annotations"]) == TASKS[3]["annotations"]
+
+
+def test_dump_parquet_with_differing_fields(monkeypatch, client, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "tasks")
+    pages = [
+        [
+            {"id": "1", "assignee": None, "priority": 0, "tags": []},
+            {"id": "2", "assignee": None, "priority": 10, "tags": ["a"]},
+        ],
+        [
+            {"id": "3", "assignee": "alice", "priority": 1.5, "reviewer": "bob"},
+            {"id": "4", "priority": None, "tags": None},
+        ],
+        [{"id": "5", "assignee": "carol", "tags": ["b"], "reviewer": None}],
+    ]
+    monkeypatch.setattr(
+        client,
+        "get_image_tasks",
+        lambda project, offset=None, limit=100, **kwargs: (
+            pages[offset // 2] if offset // 2 < len(pages) else []
+        ),
+    )
+
+    client.dump_tasks("slug", "image", path, format="parquet", page_size=2)
+
+    rows = pq.read_table(path).to_pylist()
+    assert [row["id"] for row in rows] == ["1", "2", "3", "4", "5"]
+    assert [row["assignee"] for row in rows] == [None, None, "alice", None, "carol"]
+    assert [row["priority"] for row in rows] == ["0", "10", "1.5", None, None]
+    assert json.loads(rows[1]["tags"]) == ["a"]
+    assert json.loads(rows[2]["_extra"]) == {"reviewer": "bob"}
+    assert json.loads(rows[4]["_extra"]) == {"reviewer": None}
+    assert rows[0]["_extra"] is None
+
+
+def test_dump_invalid_format(client, tmp_path):
+    with pytest.raises(FastLabelInvalidException):
+        client.dump_tasks("slug", "image", str(tmp_path / "tasks.csv"), format="csv")
@@ -0,0 +1,57 @@
+"""Tests for the disk cache of GET responses in fastlabel.http_cache."""
+
+import os
+
+from fastlabel.http_cache import HTTPCache
+
+
+def test_store_and_get(tmp_path):
+    cache = HTTPCache(str(tmp_path))
+    key = cache.get_key("https://api/tasks", {"project": "a"}, "Bearer x")
+
+    assert cache.get(key) is None
+    cache.store(key, '"v1"', None, b'[{"id": "1"}]')
+
+    cached = cache.get(key)
+    assert cached.etag == '"v1"'
+    assert cached.last_modified is None
+    assert cached.body == b'[{"id": "1"}]'
+
+
+def test_keys_differ_by_params_and_token():
+    keys = {
+        HTTPCache.get_key("https://api/tasks", {"project": "a"}, "Bearer x"),
+        HTTPCache.get_key("https://api/tasks", {"project": "b"}, "Bearer x"),
+        HTTPCache.get_key("https://api/tasks", {"project": "a"}, "Bearer y"),
+    }
+    assert len(keys) == 3
+
+
+def test_skips_responses_without_validators(tmp_path):
+    cache = HTTPCache(str(tmp_path))
+    cache.store("key", None, None, b"{}")
+
+    assert cache.get("key") is None
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = HTTPCache(str(tmp_path), max_size=300)
+    for key in ("a", "b"):
+        cache.store(key, '"v"', None, b"x" * 100)
+    cache.get("a")
+    cache.store("c", '"v"', None, b"x" * 100)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.get_stats()["entries"] == 2
+    assert cache.get_stats()["bytes"] <= 300
+
+
+def test_loads_existing_files(tmp_path):
+    HTTPCache(str(tmp_path)).store("a", '"v"', None, b"x" * 100)
+
+    cache = HTTPCache(str(tmp_path))
+    assert cache.get_stats()["entries"] == 1
+    cache.clear()
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,172 @@
+"""Tests for the auto-paginating iterators of Client.
+
+The HTTP layer (client.api.get_request) is stubbed to serve pages of a fixed
+list of items.
+"""
+
+import pytest
+
+import fastlabel
+from fastlabel.exceptions import FastLabelInvalidException
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+    return fastlabel.Client()
+
+
+def _serve(monkeypatch, client, items):
+    calls = []
+
+    def get_request(endpoint, params=None):
+        calls.append({"endpoint": endpoint, "params": params})
+        offset = params.get("offset", 0)
+        return items[offset : offset + params["limit"]]
+
+    monkeypatch.setattr(client.api, "get_request", get_request)
+    return calls
+
+
+@pytest.mark.parametrize("count", [0, 5, 1000, 2500])
+def test_iter_tasks(monkeypatch, client, count):
+    tasks = [{"id": str(i)} for i in range(count)]
+    calls = _serve(monkeypatch, client, tasks)
+
+    assert list(client.iter_tasks("slug", "image", status="approved")) == tasks
+    assert all(call["endpoint"] == "tasks/image" for call in calls)
+    assert all(call["params"]["status"] == "approved" for call in calls)
+    assert all(call["params"]["limit"] == 1000 for call in calls)
+    assert len(calls) == count // 1000 + 1
+
+
+def test_iter_tasks_with_fields(monkeypatch, client):
+    tasks = [
+        {"id": str(i), "name": f"{i}.jpg", "annotations": [{"points": [0] * 10}]}
+        for i in range(1500)
+    ]
+    calls = []
+
+    def get_request_stream(endpoint, params=None, fields=None):
+        calls.append({"endpoint": endpoint, "params": params, "fields": fields})
+        offset = params.get("offset", 0)
+        page = tasks[offset : offset + params["limit"]]
+        return ({key: task[key] for key in fields} for task in page)
+
+    monkeypatch.setattr(client.api, "get_request_stream", get_request_stream)
+
+    assert list(client.iter_tasks("slug", "image", fields=["id", "name"])) == [
+        {"id": task["id"], "name": task["name"]} for task in tasks
+    ]
+    assert [call["params"]["offset"] for call in calls[1:]] == [1000]
+    assert all(call["fields"] == ["id", "name"] for call in calls)
+
+
+def test_iter_tasks_yields_as_pages_arrive(monkeypatch, client):
+    calls = _serve(monkeypatch, client, [{"id": str(i)} for i in range(25)])
+
+    tasks = client.iter_tasks("slug", "video")
+    assert calls == []
+
+    next(tasks)
+    assert len(calls) == 1
+    assert calls[0]["params"]["limit"] == 10
+
+
+def test_iter_tasks_page_size(monkeypatch, client):
+    calls = _serve(monkeypatch, client, [{"id": str(i)} for i in range(7)])
+
+    assert len(list(client.iter_tasks("slug", "robotics", page_size=3))) == 7
+    assert [call["params"]["offset"] for call in calls] == [0, 3, 6]
+
+
+def test_iter_tasks_invalid(client):
+    with pytest.raises(FastLabelInvalidException):
+        client.iter_tasks("slug", "unknown")
+    with pytest.raises(FastLabelInvalidException):
+        client.iter_tasks("slug", "image", page_size=0)
+    with pytest.raises(FastLabelInvalidException):
+        next(client.iter_tasks("slug", "video", page_size=100))
+
+
+@pytest.mark.parametrize(
+    "method, kwargs, endpoint",
+    [
+        ("iter_annotations", {"project": "slug"}, "annotations"),
+        ("iter_histories", {"project": "slug"}, "tasks/import/histories"),
+        ("iter_tags", {"project": "slug"}, "tags"),
+        ("iter_projects", {}, "projects"),
+    ],
+)
+def test_other_iterators(monkeypatch, client, method, kwargs, endpoint):
+    items = [{"id": str(i)} for i in range(2001)]
+    calls = _serve(monkeypatch, client, items)
+
+    assert list(getattr(client, method)(**kwargs)) == items
+    assert [call["endpoint"] for call in calls] == [endpoint] * 3
+
+
+# --- fetch_tasks -------------------------------------------------------------
+
+
+def _serve_with_count(monkeypatch, client, items, on_page=None):
+    calls = []
+
+    def get_request(endpoint, params=None):
+        if endpoint == "tasks/count":
+            return len(items)
+        calls.append(params)
+        if on_page is not None:
+            on_page(len(calls))
+        offset = params.get("offset", 0)
+        return list(items[offset : offset + params["limit"]])
+
+    monkeypatch.setattr(client.api, "get_request", get_request)
+    return calls
+
+
+@pytest.mark.parametrize("count", [0, 1, 999, 5000])
+def test_fetch_tasks_ordered(monkeypatch, client, count):
+    tasks = [{"id": str(i)} for i in range(count)]
+    calls = _serve_with_count(monkeypatch, client, tasks)
+
+    assert list(client.fetch_tasks("slug", "image", max_workers=4)) == tasks
+    assert all(params["limit"] <= 1000 for params in calls)
+
+
+def test_fetch_tasks_as_completed(monkeypatch, client):
+    tasks = [{"id": str(i)} for i in range(95)]
+    _serve_with_count(monkeypatch, client, tasks)
+
+    fetched = list(
+        client.fetch_tasks("slug", "robotics", ordered=False, page_size=10, overlap=2)
+    )
+
+    assert sorted(fetched, key=lambda t: int(t["id"])) == tasks
+
+
+def test_fetch_tasks_handles_removed_and_added_tasks(monkeypatch, client):
+    tasks = [{"id": str(i)} for i in range(100)]
+
+    def on_page(number):
+        if number == 2:
+            # Tasks removed before the other pages are fetched shift them back
+            del tasks[0:3]
+            tasks.append({"id": "new"})
+
+    _serve_with_count(monkeypatch, client, tasks, on_page=on_page)
+
+    fetched = list(
+        client.fetch_tasks("slug", "robotics", max_workers=1, page_size=10, overlap=5)
+    )
+    ids = [task["id"] for task in fetched]
+
+    assert len(ids) == len(set(ids))
+    assert set(ids) >= {str(i) for i in range(3, 100)} | {"new"}
+
+
+def test_fetch_tasks_invalid(client):
+    with pytest.raises(FastLabelInvalidException):
+        client.fetch_tasks("slug", "image", page_size=1000, overlap=1)
+    with pytest.raises(FastLabelInvalidException):
+        client.fetch_tasks("slug", "image", max_workers=0)
@@ -0,0 +1,142 @@
+"""Tests for the incremental JSON array parser."""
+
+import json
+
+import pytest
+
+from fastlabel.json_stream import (
+    JSONArrayScanner,
+    ProjectingScanner,
+    iter_json_array,
+    parse_fields,
+)
+
+
+def _chunks(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+ITEMS = [
+    {"id": "1", "name": "a.jpg", "tags": ["x", "y"], "nested": {"v": [1, [2]]}},
+    {"name": 'quote " and \\ backslash ] } ,', "unicode": "画像"},
+    [],
+    {},
+    "text",
+    -1.5e3,
+    True,
+    False,
+    None,
+    0,
+]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 100000])
+def test_iter_json_array(size):
+    data = json.dumps(ITEMS, ensure_ascii=False).encode("utf-8")
+
+    assert list(iter_json_array(_chunks(data, size))) == ITEMS
+
+
+def test_iter_json_array_with_whitespace():
+    data = b' \n[ {"a" : 1} ,\n 2 , "b" ]\n '
+
+    assert list(iter_json_array(_chunks(data, 1))) == [{"a": 1}, 2, "b"]
+
+
+def test_empty_array():
+    assert list(iter_json_array([b"[", b" ", b"]"])) == []
+
+
+def test_items_are_yielded_before_the_end():
+    items = iter_json_array([b'[{"a": 1},', b'{"b": 2}'])
+
+    assert next(items) == {"a": 1}
+    assert next(items) == {"b": 2}
+    with pytest.raises(ValueError):
+        next(items)
+
+
+@pytest.mark.parametrize(
+    "data", [b'{"a": 1}', b"[1 2]", b"[1] 2", b"[1,", b"[{]", b"[nul]"]
+)
+def test_invalid_array(data):
+    with pytest.raises(ValueError):
+        list(iter_json_array([data]))
+
+
+def test_buffer_is_released():
+    scanner = JSONArrayScanner()
+    scanner.feed('[{"a": "' + "x" * 1000 + '"},')
+    scanner.feed("{")
+
+    assert len(scanner._buffer) < 10
+
+
+def test_large_item_fed_in_small_chunks():
+    item = {"text": 'a \\"quoted\\" \\\\ value ' * 5000, "points": list(range(5000))}
+    text = json.dumps([item, 1])
+    scanner = JSONArrayScanner()
+    items = []
+    for i in range(0, len(text), 7):
+        items.extend(scanner.feed(text[i : i + 7]))
+        # Only the last piece is kept as the buffer.
+        assert len(scanner._buffer) <= 7
+    scanner.close()
+
+    assert items == [item, 1]
+
+
+# --- field projection ----------------------------------------------------
+
+TASKS = [
+    {
+        "id": "1",
+        "name": 'a "quoted" } name',
+        "status": "registered",
+        "annotations": [
+            {
+                "value": "cat",
+                "points": [1.5, 2, -3e2],
+                "attributes": [{"key": "k", "value": "]}"}],
+            },
+            {"value": "dog", "keypoints": []},
+        ],
+        "metadata": {"camera": {"id": 1, "lens": "wide"}},
+    },
+    {"id": "2", "name": "画像", "annotations": [], "metadata": None},
+]
+
+
+def test_parse_fields():
+    assert parse_fields(["id", "annotations.value", "a.b.c", "a.b"]) == {
+        "id": None,
+        "annotations": {"value": None},
+        "a": {"b": None},
+    }
+
+
+@pytest.mark.parametrize("size", [1, 5, 100000])
+def test_projecting_scanner(size):
+    data = json.dumps(TASKS, ensure_ascii=False, indent=1).encode("utf-8")
+    scanner = ProjectingScanner(
+        ["id", "name", "annotations.value", "metadata.camera.id"]
+    )
+
+    assert list(iter_json_array(_chunks(data, size), scanner=scanner)) == [
+        {
+            "id": "1",
+            "name": 'a "quoted" } name',
+            "annotations": [{"value": "cat"}, {"value": "dog"}],
+            "metadata": {"camera": {"id": 1}},
+        },
+        {"id": "2", "name": "画像", "annotations": [], "metadata": None},
+    ]
+
+
+def test_projecting_scanner_keeps_whole_fields():
+    data = json.dumps(TASKS).encode("utf-8")
+    scanner = ProjectingScanner(["annotations"])
+
+    assert list(iter_json_array([data], scanner=scanner)) == [
+        {"annotations": task["annotations"]} for task in TASKS
+    ]
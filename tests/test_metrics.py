@@ -0,0 +1,92 @@
+"""Tests for the per endpoint request metrics."""
+
+import pytest
+
+from fastlabel.metrics import Metrics, RequestRecord, normalize_endpoint
+
+
+def _record(endpoint="tasks/image", status_code=200, latency=0.1, retry=0):
+    return RequestRecord(
+        method="GET",
+        endpoint=endpoint,
+        status_code=status_code,
+        latency=latency,
+        bytes_sent=10,
+        bytes_received=100,
+        retry=retry,
+    )
+
+
+@pytest.mark.parametrize(
+    "endpoint, expected",
+    [
+        ("tasks/image", "tasks/image"),
+        ("tasks/image/123e4567-e89b-12d3-a456-426614174000", "tasks/image/{id}"),
+        ("datasets/42/objects", "datasets/{id}/objects"),
+        ("", "<signed url>"),
+    ],
+)
+def test_normalize_endpoint(endpoint, expected):
+    assert normalize_endpoint(endpoint) == expected
+
+
+def test_snapshot():
+    metrics = Metrics(latency_buckets=(0.1, 1.0))
+    metrics.record(_record(latency=0.05))
+    metrics.record(_record(latency=0.5, status_code=503))
+    metrics.record(_record(latency=5.0, retry=1))
+    metrics.record(_record(status_code=None, retry=2))
+
+    stats = metrics.snapshot()["GET tasks/image"]
+
+    assert stats["count"] == 4
+    assert stats["errors"] == 1
+    assert stats["retries"] == 2
+    assert stats["status_codes"] == {200: 2, 503: 1}
+    assert stats["bytes_sent"] == 40
+    assert stats["bytes_received"] == 400
+    assert stats["latency_max"] == 5.0
+    assert [b["count"] for b in stats["latency_histogram"]] == [2, 1, 1]
+    assert stats["latency_histogram"][-1]["le"] is None
+    assert stats["latency_p50"] == 0.1
+    assert stats["latency_p99"] == 5.0
+
+
+def test_snapshot_is_a_copy():
+    metrics = Metrics()
+    metrics.record(_record())
+
+    metrics.snapshot()["GET tasks/image"]["status_codes"][200] = 0
+
+    assert metrics.snapshot()["GET tasks/image"]["status_codes"] == {200: 1}
+
+
+def test_hook_and_reset():
+    metrics = Metrics()
+    records = []
+    metrics.add_hook(records.append)
+
+    metrics.record(_record())
+    metrics.remove_hook(records.append)
+    metrics.record(_record())
+    metrics.reset()
+
+    assert len(records) == 1
+    assert metrics.snapshot() == {}
+
+
+def test_hook_errors_are_logged(caplog):
+    metrics = Metrics()
+    records = []
+
+    def broken_hook(record):
+        raise ConnectionError("collector is down")
+
+    metrics.add_hook(broken_hook)
+    metrics.add_hook(records.append)
+
+    metrics.record(_record())
+
+    assert len(records) == 1
+    assert metrics.snapshot()["GET tasks/image"]["count"] == 1
+    assert "Metrics hook" in caplog.text
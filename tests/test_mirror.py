@@ -0,0 +1,126 @@
+"""Tests for ProjectMirror and Client.refresh_project_mirror.
+
+The HTTP layer (client.api.get_request) is stubbed so no real request is made.
+"""
+
+import pytest
+
+import fastlabel
+from fastlabel.exceptions import FastLabelInvalidException
+from fastlabel.mirror import ProjectMirror, get_annotation_area
+
+
+def _task(i, status="registered", updated_at="2024-01-01", tags=(), annotations=()):
+    return {
+        "id": f"id-{i}",
+        "name": f"{i:04d}.jpg",
+        "status": status,
+        "externalStatus": "registered",
+        "tags": list(tags),
+        "annotations": list(annotations),
+        "updatedAt": updated_at,
+    }
+
+
+CAT = {"type": "bbox", "value": "cat", "points": [0, 0, 10, 20]}
+DOG = {"type": "polygon", "value": "dog", "points": [0, 0, 4, 0, 4, 4, 0, 4]}
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    with ProjectMirror(str(tmp_path / "mirror.sqlite"), "slug", "image") as mirror:
+        yield mirror
+
+
+def test_annotation_area():
+    assert get_annotation_area(CAT) == 200
+    assert get_annotation_area(DOG) == 16
+    assert get_annotation_area({"type": "keypoint", "points": [1, 2]}) is None
+    assert get_annotation_area({"type": "bbox", "points": {"1": {}}}) is None
+
+
+def test_queries(mirror):
+    mirror.sync(
+        [
+            _task(1, tags=["night"], annotations=[CAT]),
+            _task(2, status="completed", annotations=[CAT, DOG]),
+            _task(3, status="completed"),
+        ]
+    )
+
+    assert len(mirror) == 3
+    assert [t["id"] for t in mirror.get_tasks(value="cat")] == ["id-1", "id-2"]
+    assert [t["id"] for t in mirror.get_tasks(tag="night")] == ["id-1"]
+    assert [t["id"] for t in mirror.get_tasks(status="completed", value="dog")] == [
+        "id-2"
+    ]
+    assert mirror.count_tasks_by_status() == {"registered": 1, "completed": 2}
+    assert mirror.get_annotation_stats() == {
+        "cat": {"count": 2, "area_min": 200, "area_max": 200, "area_mean": 200},
+        "dog": {"count": 1, "area_min": 16, "area_max": 16, "area_mean": 16},
+    }
+    assert mirror.execute("SELECT COUNT(*) FROM task_tags") == [(1,)]
+
+
+def test_sync_writes_only_changes(mirror):
+    mirror.sync([_task(1, annotations=[CAT]), _task(2), _task(3)])
+
+    stats = mirror.sync(
+        [
+            _task(1, updated_at="2024-02-01", annotations=[DOG]),
+            _task(2),
+            _task(4),
+        ]
+    )
+
+    assert stats == {"inserted": 1, "updated": 1, "deleted": 1, "unchanged": 1}
+    assert [t["id"] for t in mirror.get_tasks()] == ["id-1", "id-2", "id-4"]
+    assert list(mirror.get_annotation_stats()) == ["dog"]
+    assert mirror.refreshed_at is not None
+
+
+def test_failed_sync_writes_nothing(mirror):
+    mirror.sync([_task(1)])
+
+    def tasks():
+        yield _task(2)
+        raise RuntimeError("connection lost")
+
+    with pytest.raises(RuntimeError):
+        mirror.sync(tasks())
+
+    assert [t["id"] for t in mirror.get_tasks()] == ["id-1"]
+
+
+def test_rejects_another_project(tmp_path):
+    path = str(tmp_path / "mirror.sqlite")
+    ProjectMirror(path, "slug", "image").close()
+
+    with pytest.raises(FastLabelInvalidException):
+        ProjectMirror(path, "other", "image")
+
+
+def test_refresh_project_mirror(monkeypatch, mirror):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+    client = fastlabel.Client()
+    tasks = [_task(i, annotations=[CAT]) for i in range(1500)]
+
+    def get_request(endpoint, params=None):
+        if endpoint == "tasks/count":
+            return len(tasks)
+        assert endpoint == "tasks/image"
+        offset = params.get("offset", 0)
+        return tasks[offset : offset + params["limit"]]
+
+    monkeypatch.setattr(client.api, "get_request", get_request)
+
+    assert client.refresh_project_mirror(mirror)["inserted"] == 1500
+    tasks[10] = _task(10, updated_at="2024-03-01")
+    del tasks[20]
+
+    assert client.refresh_project_mirror(mirror) == {
+        "inserted": 0,
+        "updated": 1,
+        "deleted": 1,
+        "unchanged": 1498,
+    }
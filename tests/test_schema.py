@@ -0,0 +1,131 @@
+"""Tests for AnnotationSchema and the local validation of task annotations.
+
+The HTTP layer (client.api) is stubbed so no real request is made.
+"""
+
+import pytest
+
+import fastlabel
+from fastlabel.exceptions import FastLabelInvalidException
+from fastlabel.schema import AnnotationSchema
+
+ANNOTATIONS = [
+    {
+        "type": "bbox",
+        "value": "cat",
+        "attributes": [
+            {"type": "text", "key": "kind", "options": []},
+            {
+                "type": "select",
+                "key": "size",
+                "options": [{"value": "large"}, {"value": "small"}],
+            },
+            {
+                "type": "checkbox",
+                "key": "flags",
+                "options": [{"value": "occluded"}, {"value": "truncated"}],
+            },
+        ],
+    },
+    {
+        "type": "pose_estimation",
+        "value": "person",
+        "attributes": [],
+        "keypoints": [{"key": "head"}, {"key": "right_shoulder"}],
+    },
+]
+
+
+@pytest.fixture
+def schema():
+    return AnnotationSchema("slug", ANNOTATIONS)
+
+
+def test_valid_annotations(schema):
+    assert (
+        schema.get_errors(
+            [
+                {
+                    "type": "bbox",
+                    "value": "cat",
+                    "attributes": [
+                        {"key": "kind", "value": "Scottish fold"},
+                        {"key": "size", "value": "large"},
+                        {"key": "flags", "value": ["occluded", "truncated"]},
+                    ],
+                    "points": [0, 0, 10, 10],
+                },
+                {"value": "person", "keypoints": [{"key": "head", "value": []}]},
+            ]
+        )
+        == []
+    )
+
+
+def test_reports_every_problem(schema):
+    errors = schema.get_errors(
+        [
+            {"type": "bbox", "value": "cta"},
+            {"type": "polygon", "value": "cat"},
+            {
+                "value": "cat",
+                "attributes": [
+                    {"key": "colour", "value": "red"},
+                    {"key": "size", "value": "lage"},
+                    {"key": "flags", "value": ["hidden"]},
+                ],
+            },
+            {"value": "person", "keypoints": [{"key": "nose"}]},
+        ]
+    )
+
+    assert errors == [
+        "annotations[0]: Unknown value 'cta'. Did you mean 'cat'?",
+        "annotations[1]: Type of 'cat' must be 'bbox', not 'polygon'.",
+        "annotations[2]: Unknown attribute key 'colour'.",
+        "annotations[2]: Unknown value of attribute 'size' 'lage'. "
+        "Did you mean 'large'?",
+        "annotations[2]: Unknown value of attribute 'flags' 'hidden'.",
+        "annotations[3]: Unknown keypoint key 'nose'.",
+    ]
+
+
+def test_create_image_task_rejects_before_upload(monkeypatch, schema, tmp_path):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+    client = fastlabel.Client()
+    sent = []
+    monkeypatch.setattr(
+        client.api, "post_request_with_file", lambda *args, **kwargs: sent.append(1)
+    )
+    file_path = tmp_path / "sample.jpg"
+    file_path.write_bytes(b"\xff\xd8")
+
+    with pytest.raises(FastLabelInvalidException) as e:
+        client.create_image_task(
+            project="slug",
+            name="sample.jpg",
+            file_path=str(file_path),
+            annotations=[{"type": "bbox", "value": "dog", "points": []}],
+            schema=schema,
+        )
+
+    assert "Unknown value 'dog'" in str(e.value)
+    assert sent == []
+
+
+def test_get_annotation_schema(monkeypatch):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+    client = fastlabel.Client()
+    calls = []
+
+    def get_request(endpoint, params=None):
+        calls.append((endpoint, params))
+        return ANNOTATIONS[params.get("offset", 0) :][: params["limit"]]
+
+    monkeypatch.setattr(client.api, "get_request", get_request)
+
+    schema = client.get_annotation_schema("slug")
+
+    assert len(schema) == 2
+    assert "person" in schema
+    assert calls == [("annotations", {"project": "slug", "limit": 1000})]
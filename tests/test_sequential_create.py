@@ -0,0 +1,65 @@
+"""Tests for the tasks of Client created from a folder of files.
+
+Requests are served by a stubbed client.api.post_request.
+"""
+
+import glob
+import os
+
+import pytest
+
+import fastlabel
+from fastlabel import const, utils
+from fastlabel.exceptions import FastLabelInvalidException
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+    client = fastlabel.Client()
+    client.payloads = []
+
+    def post_request(endpoint, payload=None):
+        client.payloads.append(payload)
+        return {"id": "task-id"}
+
+    monkeypatch.setattr(client.api, "post_request", post_request)
+    return client
+
+
+def test_sequential_image_task_keeps_file_order(client, tmp_path):
+    for i in range(20):
+        (tmp_path / f"{i:03}.jpg").write_bytes(bytes([i]) * (i + 1))
+
+    client.create_sequential_image_task("project", "task", str(tmp_path))
+
+    contents = client.payloads[0]["contents"]
+    assert [content["name"] for content in contents] == [
+        os.path.basename(path) for path in glob.glob(os.path.join(tmp_path, "*"))
+    ]
+    for content in contents:
+        assert content["file"] == utils.base64_encode(str(tmp_path / content["name"]))
+
+
+def test_oversized_folder_fails_before_encoding(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(const, "SUPPORTED_CONTENTS_SIZE", 100)
+    for i in range(3):
+        (tmp_path / f"{i}.pcd").write_bytes(b"x" * 60)
+    encoded = []
+    monkeypatch.setattr(utils, "base64_encode", encoded.append)
+
+    with pytest.raises(FastLabelInvalidException, match="contents size"):
+        client.create_sequential_pcd_task("project", "task", str(tmp_path))
+    assert encoded == []
+    assert client.payloads == []
+
+
+def test_too_many_files_fails_before_encoding(client, tmp_path, monkeypatch):
+    for i in range(7):
+        (tmp_path / f"{i}.png").write_bytes(b"x")
+    encoded = []
+    monkeypatch.setattr(utils, "base64_encode", encoded.append)
+
+    with pytest.raises(FastLabelInvalidException, match="under 6"):
+        client.create_multi_image_classification_task("project", "task", str(tmp_path))
+    assert encoded == []
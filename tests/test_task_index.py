@@ -0,0 +1,93 @@
+"""Tests for TaskIndex and its use by the find_*_task_by_name helpers.
+
+The HTTP layer (client.api.get_request) is stubbed so no real request is made.
+"""
+
+import pytest
+
+import fastlabel
+from fastlabel.task_index import TaskIndex
+
+TASK_MAP = {f"id-{i}": f"{i}.jpg" for i in range(2500)}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+    return fastlabel.Client()
+
+
+def _serve(monkeypatch, client):
+    calls = []
+    items = list(TASK_MAP.items())
+
+    def get_request(endpoint, params=None):
+        calls.append(endpoint)
+        if endpoint == "tasks/count":
+            return len(items)
+        if endpoint == "tasks/map/id-name":
+            offset = params.get("offset", 0)
+            return dict(items[offset : offset + params["limit"]])
+        if endpoint.startswith("tasks/image/"):
+            return {"id": endpoint.rsplit("/", 1)[1]}
+        raise AssertionError(endpoint)
+
+    monkeypatch.setattr(client.api, "get_request", get_request)
+    return calls
+
+
+def test_lookups():
+    index = TaskIndex("slug", {"a": "a.jpg", "b": "b.jpg"})
+
+    assert index.get_id("a.jpg") == "a"
+    assert index.get_name("b") == "b.jpg"
+    assert index.get_id("c.jpg") is None
+    assert "a.jpg" in index
+    assert len(index) == 2
+
+    index.add("c", "c.jpg")
+    index.remove("a")
+    assert index.get_id("c.jpg") == "c"
+    assert index.get_id("a.jpg") is None
+
+
+def test_freshness():
+    index = TaskIndex("slug", {}, loaded_at=0)
+
+    assert not index.is_fresh(3600)
+    assert index.is_fresh(None)
+
+
+def test_get_task_index(monkeypatch, client):
+    _serve(monkeypatch, client)
+
+    index = client.get_task_index("slug", max_workers=4)
+
+    assert len(index) == len(TASK_MAP)
+    assert index.get_id("1234.jpg") == "id-1234"
+
+
+def test_get_task_index_uses_disk_copy(monkeypatch, client, tmp_path):
+    calls = _serve(monkeypatch, client)
+    cache_path = str(tmp_path / "index.json")
+
+    client.get_task_index("slug", cache_path=cache_path)
+    fetched = len(calls)
+    index = client.get_task_index("slug", cache_path=cache_path)
+
+    assert len(calls) == fetched
+    assert index.get_name("id-7") == "7.jpg"
+
+    client.get_task_index("slug", cache_path=cache_path, max_age=0)
+    assert len(calls) > fetched
+
+
+def test_find_by_name_with_index(monkeypatch, client):
+    calls = _serve(monkeypatch, client)
+    index = TaskIndex("slug", {"id-1": "1.jpg"})
+
+    assert client.find_image_task_by_name("slug", "1.jpg", index=index) == {
+        "id": "id-1"
+    }
+    assert client.find_image_task_by_name("slug", "missing.jpg", index=index) is None
+    assert calls == ["tasks/image/id-1"]
@@ -0,0 +1,136 @@
+"""Tests for the HTTP transports of Api.
+
+HTTPXTransport is served by httpx.MockTransport so no real connection is made.
+"""
+
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from fastlabel import transport  # noqa: E402
+from fastlabel.api import Api  # noqa: E402
+from fastlabel.exceptions import (  # noqa: E402
+    FastLabelException,
+    FastLabelInvalidException,
+)
+from fastlabel.retry import RetryPolicy  # noqa: E402
+from fastlabel.transport import HTTPXTransport  # noqa: E402
+
+
+def _api(monkeypatch, handler, **kwargs):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+    monkeypatch.delenv("FASTLABEL_API_URL", raising=False)
+    http = HTTPXTransport(http2=False)
+    http._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return Api(rate_limiter=False, transport=http, **kwargs)
+
+
+def test_requests(monkeypatch):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"id": "1"})
+
+    api = _api(monkeypatch, handler)
+
+    assert api.get_request("tasks/image", params={"a": "b", "c": None}) == {"id": "1"}
+    assert api.post_request("tasks/image", payload={"name": "a.jpg"}) == {"id": "1"}
+
+    assert requests[0].method == "GET"
+    assert dict(requests[0].url.params) == {"a": "b"}
+    assert requests[0].headers["Authorization"] == "Bearer dummy-token"
+    assert json.loads(requests[1].content) == {"name": "a.jpg"}
+
+
+@pytest.mark.parametrize(
+    "status_code, exception",
+    [(400, FastLabelInvalidException), (500, FastLabelException)],
+)
+def test_error_mapping(monkeypatch, status_code, exception):
+    def handler(request):
+        return httpx.Response(status_code, json={"message": "failed"})
+
+    api = _api(monkeypatch, handler, retry_policy=RetryPolicy(max_retries=0))
+
+    with pytest.raises(exception) as e:
+        api.get_request("tasks/image")
+    assert e.value.code == status_code
+    assert str(e.value.message) == "failed"
+
+
+def test_connection_error_is_retried(monkeypatch):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ConnectError("refused")
+        return httpx.Response(200, json=[])
+
+    api = _api(monkeypatch, handler, retry_policy=RetryPolicy(backoff_factor=0))
+
+    assert api.get_request("tasks/image") == []
+    assert len(calls) == 2
+
+
+def test_stream(monkeypatch):
+    def handler(request):
+        return httpx.Response(200, json=[{"id": str(i)} for i in range(10)])
+
+    api = _api(monkeypatch, handler)
+
+    items = list(api.get_request_stream("tasks/appendix", chunk_size=5))
+
+    assert items == [{"id": str(i)} for i in range(10)]
+
+
+def test_stream_error_mapping(monkeypatch):
+    def handler(request):
+        # An iterator body is not read until the response is read.
+        return httpx.Response(
+            404,
+            headers={"Content-Type": "application/json"},
+            content=iter([b'{"message": ', b'"Task not found."}']),
+        )
+
+    api = _api(monkeypatch, handler)
+
+    with pytest.raises(FastLabelInvalidException, match="Task not found."):
+        list(api.get_request_stream("tasks/appendix"))
+
+
+def test_upload(monkeypatch, tmp_path):
+    file_path = tmp_path / "data.zip"
+    file_path.write_bytes(b"z" * 1000)
+    uploads = []
+
+    def handler(request):
+        uploads.append(request)
+        return httpx.Response(200)
+
+    api = _api(monkeypatch, handler)
+
+    api.upload_zipfile("https://storage.example/signed", str(file_path))
+
+    body = uploads[0].read()
+    assert int(uploads[0].headers["Content-Length"]) == len(body)
+    assert b"z" * 1000 in body
+
+
+def test_http2_requires_h2(monkeypatch):
+    monkeypatch.setattr(transport, "h2", None)
+
+    with pytest.raises(FastLabelInvalidException):
+        HTTPXTransport(http2=True)
+
+
+def test_incomplete_transport_cannot_be_created():
+    class NoStreamTransport(transport.Transport):
+        def request(self, method, url, **kwargs):
+            return None
+
+    with pytest.raises(TypeError):
+        NoStreamTransport()
@@ -0,0 +1,274 @@
+"""Tests for the streamed upload bodies and the upload state file."""
+
+import base64
+import json
+import os
+
+import pytest
+import requests
+
+import fastlabel
+from fastlabel.exceptions import FastLabelException, FastLabelInvalidException
+from fastlabel.upload import (
+    ImportJournal,
+    JSONFileReader,
+    MultipartFileReader,
+    UploadProgress,
+    UploadState,
+    is_file_key_error,
+)
+
+
+@pytest.fixture
+def file_path(tmp_path):
+    path = tmp_path / 'data "1".zip'
+    path.write_bytes(bytes(range(256)) * 40)
+    return str(path)
+
+
+def _read_all(body, size):
+    return b"".join(iter(lambda: body.read(size), b""))
+
+
+@pytest.mark.parametrize("size", [1, 7, 4096, -1])
+def test_body_matches_requests_multipart(file_path, size):
+    with open(file_path, "rb") as f:
+        expected = requests.Request(
+            "PUT", "https://storage.example/signed", files={"file": f}
+        ).prepare()
+
+    with MultipartFileReader(file_path) as body:
+        sent = _read_all(body, size)
+
+    boundary = expected.headers["Content-Type"].split("boundary=")[1]
+    assert sent.replace(body.boundary.encode(), boundary.encode()) == expected.body
+    assert len(sent) == len(body)
+
+
+def test_progress_callback(file_path):
+    progresses = []
+
+    with MultipartFileReader(file_path, progress_callback=progresses.append) as body:
+        chunks = list(body.iter_chunks())
+
+    assert len(progresses) == len(chunks)
+    assert progresses[-1].bytes_sent == len(body)
+    assert progresses[-1].done
+    assert [p.bytes_sent for p in progresses] == sorted(
+        p.bytes_sent for p in progresses
+    )
+
+
+def test_file_is_opened_lazily_and_closed(file_path):
+    body = MultipartFileReader(file_path)
+    assert body._file is None
+
+    body.read(1000)
+    assert body._file is not None
+
+    body.close()
+    assert body._file is None
+
+
+@pytest.mark.parametrize("chunk_size", [4, 5, 1024, 1024 * 1024])
+@pytest.mark.parametrize("file_size", [0, 1, 2, 3, 10240])
+def test_json_body_matches_json_dumps(tmp_path, chunk_size, file_size):
+    path = tmp_path / "video.mp4"
+    path.write_bytes(bytes(range(256)) * (file_size // 256) + b"x" * (file_size % 256))
+    payload = {"project": "slug", "name": "画像.mp4", "tags": ["a"]}
+
+    with JSONFileReader(payload, str(path), chunk_size=chunk_size) as body:
+        sent = _read_all(body, 7)
+
+    expected = {"file": base64.b64encode(path.read_bytes()).decode(), **payload}
+    assert json.loads(sent) == expected
+    assert len(sent) == len(body)
+
+
+def test_json_body_without_payload(file_path):
+    with JSONFileReader({}, file_path, field_name="data") as body:
+        assert list(json.loads(body.read())) == ["data"]
+
+
+def test_throughput():
+    assert UploadProgress(100, 200, 2.0).throughput == 50.0
+    assert UploadProgress(0, 200, 0.0).throughput == 0.0
+
+
+def test_upload_state(file_path, tmp_path):
+    state = UploadState(str(tmp_path / "state.json"))
+    assert state.get_file_key("slug", file_path) is None
+
+    state.save("slug", file_path, "files/data.zip")
+    assert UploadState(state.state_path).get_file_key("slug", file_path) == (
+        "files/data.zip"
+    )
+    assert state.get_file_key("other", file_path) is None
+
+    state.remove("slug", file_path)
+    assert state.get_file_key("slug", file_path) is None
+
+
+def test_upload_state_ignores_modified_file(file_path, tmp_path):
+    state = UploadState(str(tmp_path / "state.json"))
+    state.save("slug", file_path, "files/data.zip")
+
+    with open(file_path, "ab") as f:
+        f.write(b"more")
+
+    assert state.get_file_key("slug", file_path) is None
+
+
+def test_import_journal(file_path, tmp_path):
+    journal_path = str(tmp_path / "journal" / "import.jsonl")
+    with ImportJournal(journal_path) as journal:
+        assert journal.get_id("slug/a", file_path) is None
+        journal.record("slug/a", file_path, "task-a")
+        assert journal.get_id("slug/a", file_path) == "task-a"
+
+    journal = ImportJournal(journal_path)
+    assert len(journal) == 1
+    assert journal.get_id("slug/a", file_path) == "task-a"
+    assert journal.get_id("slug/b", file_path) is None
+
+
+def test_import_journal_checks_content(file_path, tmp_path):
+    journal = ImportJournal(str(tmp_path / "import.jsonl"))
+    journal.record("slug/a", file_path, "task-a")
+    journal.close()
+    stat = os.stat(file_path)
+
+    # Same content with a new modification time is hashed and still matches.
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert journal.get_id("slug/a", file_path) == "task-a"
+
+    with open(file_path, "r+b") as f:
+        f.write(b"x")
+    assert journal.get_id("slug/a", file_path) is None
+
+
+def test_import_journal_ignores_truncated_line(file_path, tmp_path):
+    journal_path = tmp_path / "import.jsonl"
+    with ImportJournal(str(journal_path)) as journal:
+        journal.record("slug/a", file_path, "task-a")
+    with open(journal_path, "a", encoding="utf-8") as f:
+        f.write('{"key": "slug/b", "ha')
+
+    with ImportJournal(str(journal_path)) as journal:
+        assert len(journal) == 1
+        journal.record("slug/c", file_path, "task-c")
+
+    journal = ImportJournal(str(journal_path))
+    assert journal.get_id("slug/a", file_path) == "task-a"
+    assert journal.get_id("slug/c", file_path) == "task-c"
+    assert "slug/b" not in journal
+
+
+# --- resumable import ----------------------------------------------------------
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("FASTLABEL_ACCESS_TOKEN", "dummy-token")
+    client = fastlabel.Client()
+    client.uploads = []
+    client.posts = []
+    monkeypatch.setattr(
+        client.api,
+        "get_request",
+        lambda endpoint, params=None: {"url": "https://signed", "name": "key-1"},
+    )
+    monkeypatch.setattr(
+        client.api,
+        "upload_zipfile",
+        lambda url, file_path, progress_callback=None: client.uploads.append(url),
+    )
+    return client
+
+
+def _fail_posts(
+    client, monkeypatch, times, exception=FastLabelException, error=("Error", 500)
+):
+    def post_request(endpoint, payload=None):
+        client.posts.append(payload)
+        if len(client.posts) <= times:
+            raise exception(*error)
+        return "ok"
+
+    monkeypatch.setattr(client.api, "post_request", post_request)
+
+
+def test_import_reuses_uploaded_file(client, monkeypatch, tmp_path):
+    zip_path = tmp_path / "appendix.zip"
+    zip_path.write_bytes(b"zip")
+    state_path = str(tmp_path / "state.json")
+    _fail_posts(client, monkeypatch, times=1)
+
+    with pytest.raises(FastLabelException):
+        client.import_appendix_file("slug", str(zip_path), upload_state_path=state_path)
+    result = client.import_appendix_file(
+        "slug", str(zip_path), upload_state_path=state_path
+    )
+
+    assert result == "ok"
+    assert client.uploads == ["https://signed"]
+    assert [p["fileKey"] for p in client.posts] == ["key-1", "key-1"]
+    assert UploadState(state_path).get_file_key("slug", str(zip_path)) is None
+
+
+def test_import_uploads_again_when_file_key_is_rejected(client, monkeypatch, tmp_path):
+    zip_path = tmp_path / "appendix.zip"
+    zip_path.write_bytes(b"zip")
+    state_path = str(tmp_path / "state.json")
+    UploadState(state_path).save("slug", str(zip_path), "expired-key")
+    _fail_posts(
+        client,
+        monkeypatch,
+        times=1,
+        exception=FastLabelInvalidException,
+        error=("File key is expired.", 400),
+    )
+
+    result = client.import_appendix_file(
+        "slug", str(zip_path), upload_state_path=state_path
+    )
+
+    assert result == "ok"
+    assert client.uploads == ["https://signed"]
+    assert [p["fileKey"] for p in client.posts] == ["expired-key", "key-1"]
+
+
+def test_import_does_not_upload_again_on_validation_error(
+    client, monkeypatch, tmp_path
+):
+    zip_path = tmp_path / "appendix.zip"
+    zip_path.write_bytes(b"zip")
+    state_path = str(tmp_path / "state.json")
+    UploadState(state_path).save("slug", str(zip_path), "key-0")
+    _fail_posts(
+        client,
+        monkeypatch,
+        times=1,
+        exception=FastLabelInvalidException,
+        error=("Name is already used.", 422),
+    )
+
+    with pytest.raises(FastLabelInvalidException):
+        client.import_appendix_file("slug", str(zip_path), upload_state_path=state_path)
+
+    assert client.uploads == []
+    assert UploadState(state_path).get_file_key("slug", str(zip_path)) == "key-0"
+
+
+@pytest.mark.parametrize(
+    "message, code, expected",
+    [
+        ("Not found.", 404, True),
+        ("File key is expired.", 400, True),
+        ("The file does not exist.", 400, True),
+        ("Name is already used.", 422, False),
+        ("Invalid payload.", 400, False),
+    ],
+)
+def test_is_file_key_error(message, code, expected):
+    assert is_file_key_error(FastLabelInvalidException(message, code)) is expected
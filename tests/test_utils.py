@@ -1,3 +1,5 @@
+import pytest
+
 from fastlabel import utils
 
 
@@ -12,3 +14,15 @@ class TestIsVideoSupportedCodec:
         video_path = synthetic_video(name="sample.mp4", fourcc_code="mp4v")
 
         assert utils.is_video_supported_codec(str(video_path)) is False
+
+
+class TestGetContentJsonLength:
+    @pytest.mark.parametrize("size", [0, 1, 2, 3, 4, 1000])
+    def test_matches_json_length_of_encoded_content(self, tmp_path, size):
+        path = tmp_path / "é 1.png"
+        path.write_bytes(b"\xff" * size)
+        content = {"name": path.name, "file": utils.base64_encode(str(path))}
+
+        assert utils.get_content_json_length(path.name, size) == utils.get_json_length(
+            content
+        )